@@ -4,15 +4,54 @@ import os
 import random
 import csv
 import math
+import contextlib
+import atexit
+import collections
+import traceback
+import functools
+import weakref
 
 # Initialize Pygame
 pygame.init()
+# Shut SDL down once when the interpreter exits (normal return or sys.exit from a page)
+atexit.register(pygame.quit)
+# Only queue the event types the pages handle; MOUSEMOTION floods the queue
+# and hover is read from pygame.mouse.get_pos() instead
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+])
 
 # Constants
 SCREEN_WIDTH = 1680
 SCREEN_HEIGHT = 1050
 FPS = 60
 
+# Page results returned by run() and dispatched by the navigation handlers.
+# Pages return these shared objects, so == against them hits CPython's identity fast path.
+RESULT_QUIT = sys.intern("quit")
+RESULT_BACK = sys.intern("back")
+RESULT_START = sys.intern("start")
+RESULT_TEST_MODE = sys.intern("test_mode")
+RESULT_BUTTON_E = sys.intern("button_e")
+RESULT_BUTTON_M = sys.intern("button_m")
+RESULT_BUTTON_H = sys.intern("button_h")
+RESULT_BOSS_CLICKED = sys.intern("boss_clicked")
+RESULT_ROUND_SELECT = sys.intern("round_select")
+RESULT_LEVEL_SELECT = sys.intern("level_select")
+# RoundPage difficulty buttons -> GameplayPage difficulty
+DIFFICULTY_MAP = {RESULT_BUTTON_E: "e", RESULT_BUTTON_M: "m", RESULT_BUTTON_H: "h"}
+DIFFICULTY_RESULTS = frozenset(DIFFICULTY_MAP)
+
+# Diagnostic prints (set BRESSOLES_DEBUG=1 to enable)
+DEBUG = bool(os.environ.get("BRESSOLES_DEBUG"))
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -21,6 +60,40 @@ LIGHT_GOLD = (255, 235, 150)
 DARK_GOLD = (184, 134, 11)
 PAPER_COLOR = (83, 76, 70)
 
+# GameplayPage arrow click animation: frame order (ping-pong once) and ms per step
+ARROW_ANIM_SEQUENCE = (0, 1, 2, 1, 0)
+ARROW_ANIM_INTERVAL_MS = 120
+ARROW_ANIM_TOTAL_MS = len(ARROW_ANIM_SEQUENCE) * ARROW_ANIM_INTERVAL_MS
+# Price graph animation: 12 frames per second (increased by 30% from 9 to 12, approximately 83ms per frame)
+PRICE_ANIM_INTERVAL_MS = 1000 // 12
+# GameplayPage End Turn button: scale of EndButton.png and margins from the bottom-right corner
+END_BUTTON_SCALE = 0.3
+END_BUTTON_MARGIN_RIGHT = 50
+END_BUTTON_MARGIN_BOTTOM = 50
+# Card tables shared by GameplayPage and RoundPage (cards not listed have no action/turns).
+# Base image per card: 11-14 use Card_11.png, 15-16 Card_15.png, 17-18 Card_17.png; other
+# cards use their own image, so look up with CARD_BASE_IDS.get(card_id, card_id).
+CARD_BASE_IDS = {11: 11, 12: 11, 13: 11, 14: 11, 15: 15, 16: 15, 17: 17, 18: 17}
+# CardAction: price delta (17/18 multiply the price instead)
+CARD_ACTIONS = {11: 2, 12: 2, 13: 4, 14: 4, 15: -2, 16: -2, 17: 2, 18: 2}
+# CardTurns: how many turns a market card keeps acting
+CARD_TURNS = {11: 1, 12: 2, 13: 1, 14: 2, 15: 1, 16: 2, 17: 1, 18: 2}
+# Cards whose CardAction multiplies the price (they also share the Card_17.png art layout)
+CARD_MULTIPLIER_IDS = frozenset((17, 18))
+# End-turn price operation per card: (multiplies price, CardAction); 17/18 multiply, others add
+CARD_PRICE_OPS = {cid: (cid in CARD_MULTIPLIER_IDS, action) for cid, action in CARD_ACTIONS.items()}
+# GameplayPage card sizes: a few pixels larger than the bottom (138x240) / market (96x168) placeholders
+CARD_SIZE_BOTTOM = (142, 244)
+CARD_SIZE_MARKET = (99, 171)
+# Every (market, slot) cell of the 3x3 market grid, in end-turn processing order
+MARKET_SLOTS = tuple((market, slot) for market in (0, 1, 2) for slot in (0, 1, 2))
+# End-turn price odds per market: (upper bound of a 0-100 roll, animation type, step sign), checked in order
+STOCK_PRICE_ODDS = (
+    ((15, 'unchanged', 0), (100, 'rise', 1)),                       # A: 15% same, 85% up
+    ((10, 'fall', -1), (30, 'unchanged', 0), (100, 'rise', 1)),     # B: 10% down, 20% same, 70% up
+    ((30, 'fall', -1), (50, 'unchanged', 0), (100, 'rise', 1)),     # C: 30% down, 20% same, 50% up
+)
+
 # -------------------------------
 # Animation helpers (dt-based)
 # -------------------------------
@@ -61,7 +134,7 @@ def clamp_popup_y(desired_y: float, popup_image, screen_height: int, margin: flo
 
 
 def wrap_text(text, font, max_width):
-    """Split text into lines that fit within max_width using rendered widths."""
+    """Split text into lines that fit within max_width using font metrics (no rendering)."""
     if not text:
         return []
     words = text.split()
@@ -69,7 +142,7 @@ def wrap_text(text, font, max_width):
     current_line = []
     for word in words:
         candidate = " ".join(current_line + [word]) if current_line else word
-        candidate_width = font.render(candidate + " ", True, PAPER_COLOR).get_width()
+        candidate_width = font.size(candidate + " ")[0]
         if candidate_width <= max_width:
             current_line.append(word)
         else:
@@ -80,6 +153,181 @@ def wrap_text(text, font, max_width):
         lines.append(" ".join(current_line))
     return lines
 
+
+# Fonts known to wrap_text_cached, keyed by id(font) (entries vanish when the font is freed)
+_wrap_text_fonts = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_text_cached(text, font_id, max_width):
+    font = _wrap_text_fonts.get(font_id)
+    if font is None:
+        return ()
+    return tuple(wrap_text(text, font, max_width))
+
+
+def wrap_text_cached(text, font, max_width):
+    """Memoized wrap_text for per-frame callers; returns a tuple of lines."""
+    font_id = id(font)
+    if _wrap_text_fonts.get(font_id) is not font:
+        # New font (or a recycled id): drop results computed for the old one
+        _wrap_text_cached.cache_clear()
+        _wrap_text_fonts[font_id] = font
+    return _wrap_text_cached(text, font_id, max_width)
+
+
+# -------------------------------
+# Asset lookup and image cache
+# -------------------------------
+# directory -> normcased entry names, scanned once (assets do not change while the game runs)
+_dir_manifest = {}
+
+
+def asset_exists(path):
+    """os.path.exists for asset files/folders, answered from one cached scan per directory."""
+    directory, name = os.path.split(path)
+    directory = directory or "."
+    entries = _dir_manifest.get(directory)
+    if entries is None:
+        try:
+            with os.scandir(directory) as it:
+                entries = frozenset(os.path.normcase(entry.name) for entry in it)
+        except OSError:
+            entries = frozenset()
+        _dir_manifest[directory] = entries
+    return os.path.normcase(name) in entries
+
+
+# (path, size, alpha, source_size) -> converted Surface; size=None is the unscaled image.
+# Cached surfaces are shared between pages, so never draw onto them (copy() first).
+_image_cache = {}
+
+
+def has_real_alpha(surface):
+    """True if any pixel of a per-pixel-alpha surface is not fully opaque."""
+    width, height = surface.get_size()
+    return pygame.mask.from_surface(surface, 254).count() != width * height
+
+
+def load_image(path, size=None, alpha=True, source_size=None):
+    """Load (and optionally smoothscale to size) an image once per process.
+
+    alpha=None picks convert() for PNGs whose alpha channel is fully opaque, so they
+    blit without per-pixel blending, and convert_alpha() otherwise.
+    source_size scales from the cached copy at that (larger) size instead of the full
+    original, which is much less pixel traffic when several small variants are needed.
+    It is part of the cache key, since the two scaling paths give different pixels.
+    """
+    key = (path, size, alpha, source_size)
+    image = _image_cache.get(key)
+    if image is None:
+        if size is None:
+            image = pygame.image.load(path)
+            if alpha is None:
+                converted = image.convert_alpha()
+                image = converted if has_real_alpha(converted) else image.convert()
+            else:
+                image = image.convert_alpha() if alpha else image.convert()
+        else:
+            image = pygame.transform.smoothscale(load_image(path, source_size, alpha), size)
+        _image_cache[key] = image
+    return image
+
+
+def load_image_scaled_by(path, factor, alpha=True):
+    """load_image smoothscaled by factor (like transform.smoothscale_by), sharing the cache."""
+    width, height = load_image(path, None, alpha).get_size()
+    return load_image(path, (int(width * factor), int(height * factor)), alpha)
+
+
+# (folder, indices, size) -> tuple of frames, shared by every page/market using the strip
+_frame_strip_cache = {}
+
+
+def load_frame_strip(folder, indices, size):
+    """Load numbered animation frames (folder/<i>.png) scaled to size, once per process.
+
+    Missing frames are skipped with a warning; a missing folder gives an empty tuple.
+    """
+    key = (folder, tuple(indices), size)
+    frames = _frame_strip_cache.get(key)
+    if frames is None:
+        loaded = []
+        if asset_exists(folder):
+            for i in key[1]:
+                frame_path = os.path.join(folder, f"{i}.png")
+                if asset_exists(frame_path):
+                    loaded.append(load_image(frame_path, size))
+                else:
+                    print(f"WARNING: Frame {i}.png not found in {os.path.basename(folder)} folder")
+        else:
+            print("WARNING: Animation folder not found:", folder)
+        frames = tuple(loaded)
+        _frame_strip_cache[key] = frames
+    return frames
+
+
+def pad_frames(frames, count=3):
+    """Return frames as a tuple, repeating the last frame up to count (empty stays empty).
+
+    The padding repeats references to the same Surface; nothing is copied.
+    """
+    if not frames:
+        return ()
+    return tuple(frames) + (frames[-1],) * (count - len(frames))
+
+
+def load_arrow_set(paths, label, size=(60, 60)):
+    """Load an arrow's base image (paths[0]) and animation frames, padded to 3 frames.
+
+    Returns (frames, base); base is None (with a warning) when the base image is missing.
+    """
+    frames = pad_frames([load_image(path, size) for path in paths if asset_exists(path)])
+    if asset_exists(paths[0]):
+        return frames, frames[0]
+    print(f"WARNING: {label} image not found:", paths[0])
+    return frames, None
+
+
+# base card id -> path of its face in Cards/ ("Card_X.png" wins over "Card X.png"), from one listing
+_card_files = None
+
+
+def card_image_path(base_id):
+    """Path of the Cards/ image for a base card id, or None if there is no such file."""
+    global _card_files
+    if _card_files is None:
+        _card_files = {}
+        try:
+            names = os.listdir("Cards")
+        except OSError:
+            names = []
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext.lower() != ".png" or stem[:4].lower() != "card" or stem[4:5] not in ("_", " "):
+                continue
+            try:
+                card_id = int(stem[5:])
+            except ValueError:
+                continue
+            if stem[4] == "_" or card_id not in _card_files:
+                _card_files[card_id] = os.path.join("Cards", name)
+    return _card_files.get(base_id)
+
+
+# (path, size) -> Font; fonts are only rendered from, so pages can share them
+_font_cache = {}
+
+
+def get_font(path, size):
+    """Return a shared pygame Font for (path, size), opening the file only once."""
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _font_cache[key] = font
+    return font
+
 # Language system
 Lang = {}  # Dictionary to store language strings
 CURRENT_LANGUAGE = "RU"  # Default language (RUS in user's terms, but file uses RU)
@@ -88,7 +336,26 @@ CURRENT_LANGUAGE = "RU"  # Default language (RUS in user's terms, but file uses
 level_1_boss_defeated = False  # Track if level 1 boss is defeated
 level_2_boss_defeated = False  # Track if level 2 is completed (unlocks level 3)
 level_3_boss_defeated = False  # Track if level 3 is completed (unlocks level 4)
-# Boss defeat tracking per level: {level_number: {"defeated": int, "last_rect": pygame.Rect or None, "lines": list}}
+# Defeated boss kept on the BossPage map: image filename + top-left/size of its 100x100 slot
+DefeatedBoss = collections.namedtuple("DefeatedBoss", "filename x y w h")
+
+
+class BossProgress:
+    """Boss defeat progress for one level run (what BossPage needs to redraw the map)."""
+    __slots__ = ("defeated", "last_rect", "lines", "defeated_bosses", "roster")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.defeated = 0  # Bosses defeated in this run
+        self.last_rect = None  # pygame.Rect of the last defeated boss (anchor for the next round)
+        self.lines = []  # Saved pen lines (start_x, start_y, end_x, end_y)
+        self.defeated_bosses = []  # DefeatedBoss entries
+        self.roster = None  # Level 3 pinned boss roster
+
+
+# Boss defeat tracking per level: {level_number: BossProgress}
 boss_progress = {}
 # Global Dobor variable - how many cards to draw after each turn (default 1, can be increased by boss rewards)
 global_dobor = 1
@@ -123,13 +390,13 @@ def _generate_level3_boss_roster(bosses_required: int):
     return [[fn] for fn in chosen]
 
 
-def _ensure_level3_roster(bp_state: dict, bosses_required: int):
+def _ensure_level3_roster(bp_state: BossProgress, bosses_required: int):
     """Ensure bp_state has a stable roster for the current Level 3 run (and matches bosses_required)."""
-    roster = bp_state.get("roster")
+    roster = bp_state.roster
     if isinstance(roster, list) and roster and len(roster) == max(1, int(bosses_required or 1)):
         return roster
     roster = _generate_level3_boss_roster(bosses_required)
-    bp_state["roster"] = roster
+    bp_state.roster = roster
     return roster
 
 # Reward cards earned by player: {level_number: [list of card_ids]}
@@ -329,12 +596,13 @@ def load_language(lang_code="RU"):
         return
     
     try:
+        # Use RU column (user mentioned RUS, but file has RU)
+        column = 'RU' if lang_code == "RU" else 'ENG'
         with open(lang_file, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f, delimiter=';')
             for row in reader:
                 key = row.get('Key', '').strip()
-                # Use RU column (user mentioned RUS, but file has RU)
-                value = row.get('RU', '').strip() if lang_code == "RU" else row.get('ENG', '').strip()
+                value = row.get(column, '').strip()
                 if key:
                     Lang[key] = value
     except Exception as e:
@@ -799,7 +1067,8 @@ def load_boss_rewards():
         print(f"ERROR loading BossRewards.csv: {e}")
     
     _boss_rewards_cache = rewards
-    print(f"DEBUG load_boss_rewards: loaded {len(rewards)} boss entries: {rewards}")
+    if DEBUG:
+        print(f"DEBUG load_boss_rewards: loaded {len(rewards)} boss entries: {rewards}")
     return rewards
 
 
@@ -1054,24 +1323,23 @@ def get_text(key, default=None):
 
 
 class StartPage:
-    def __init__(self, screen, background, font_path, lang_dict=None):
+    def __init__(self, screen, background, font_path, lang_dict=None, clock=None):
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.clock = clock if clock is not None else pygame.time.Clock()
         self.lang = lang_dict if lang_dict else Lang
 
         # Load StartPage image from UI folder
         start_page_path = os.path.join("UI", "StartPage.jpg")
         if os.path.exists(start_page_path):
-            self.background = pygame.image.load(start_page_path).convert()
-            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.background = load_image(start_page_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
         else:
             print("WARNING: StartPage.jpg not found:", start_page_path)
             self.background = background if background else None
 
         # Load fonts
-        self.font_large = pygame.font.Font(font_path, 72)
-        self.font_medium = pygame.font.Font(font_path, 48)
-        self.font_small = pygame.font.Font(font_path, 36)
+        self.font_large = get_font(font_path, 72)
+        self.font_medium = get_font(font_path, 48)
+        self.font_small = get_font(font_path, 36)
 
         # -------------------------------
         # MENU
@@ -1084,6 +1352,11 @@ class StartPage:
             self.lang.get("MenuTestMode", "Test Mode")
         ]
         self.selected_index = 0
+        self._last_mouse_pos = pygame.mouse.get_pos()  # hover only follows actual mouse movement
+        # The menu is static: run() only redraws after input changed something,
+        # and only the menu column is repainted unless a full redraw is needed
+        self._needs_redraw = True
+        self._needs_full_redraw = True
         
         # Menu positions - adjusted for right side empty slots (centered in slots)
         # These positions are set to align with empty menu slots on the right side of StartPage.jpg
@@ -1094,23 +1367,57 @@ class StartPage:
             (SCREEN_WIDTH - 400, 550),  # Quit
             (SCREEN_WIDTH - 400, 650),  # Test Mode
         ]
+        
+        # Menu labels never change, so render them once:
+        # per item (shadow, shadow_rect, normal, highlight, text_rect, indicator_rect)
+        self.indicator_surface = self.font_medium.render(">", True, GOLD)
+        self._menu_cache = []
+        # Clickable hitboxes: text rect expanded slightly for easier clicking
+        self._menu_rects = []
+        for i, item in enumerate(self.menu_items):
+            menu_x, y_pos = self.menu_positions[i]
+            shadow = self.font_medium.render(item, True, BLACK)
+            normal = self.font_medium.render(item, True, PAPER_COLOR)
+            highlight = self.font_medium.render(item, True, LIGHT_GOLD)
+            text_rect = normal.get_rect(center=(menu_x, y_pos))
+            self._menu_cache.append((
+                shadow,
+                shadow.get_rect(center=(menu_x + 2, y_pos + 2)),
+                normal,
+                highlight,
+                text_rect,
+                self.indicator_surface.get_rect(center=(menu_x - 100, y_pos)),
+            ))
+            self._menu_rects.append(text_rect.inflate(20, 10))
+        # Screen area covering every menu label, shadow and indicator (the only part that changes)
+        menu_rects = [rect for entry in self._menu_cache for rect in (entry[1], entry[4], entry[5])]
+        self._menu_area = menu_rects[0].unionall(menu_rects[1:])
 
     # ------------------------------------
     # INPUT
     # ------------------------------------
     def _get_menu_rect(self, index):
         """Get the clickable rectangle for a menu item"""
-        menu_x, y_pos = self.menu_positions[index]
-        item = self.menu_items[index]
-        text = self.font_medium.render(item, True, PAPER_COLOR)
-        text_rect = text.get_rect(center=(menu_x, y_pos))
-        # Expand hitbox slightly for easier clicking
-        return text_rect.inflate(20, 10)
+        return self._menu_rects[index]
     
     def handle_input(self):
         mouse_pos = pygame.mouse.get_pos()
+
+        # Hover: follow the mouse only when it has moved, so keyboard selection sticks
+        if mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            for i in range(len(self.menu_items)):
+                if self._get_menu_rect(i).collidepoint(mouse_pos):
+                    if i != self.selected_index:
+                        self.selected_index = i
+                        self._needs_redraw = True
+                    break
         
         for event in pygame.event.get():
+            # Any queued event (key, click, window expose) may change what is shown
+            self._needs_redraw = True
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._needs_full_redraw = True
             if event.type == pygame.QUIT:
                 return "quit"
 
@@ -1131,14 +1438,6 @@ class StartPage:
                         return "test_mode"
             
             # Mouse support
-            if event.type == pygame.MOUSEMOTION:
-                # Update selected index based on mouse position
-                for i in range(len(self.menu_items)):
-                    menu_rect = self._get_menu_rect(i)
-                    if menu_rect.collidepoint(mouse_pos):
-                        self.selected_index = i
-                        break
-            
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     for i in range(len(self.menu_items)):
@@ -1160,68 +1459,75 @@ class StartPage:
     # DRAW
     # ------------------------------------
     def draw(self):
+        full = self._needs_full_redraw
+        self._needs_full_redraw = False
+        if not full:
+            # Only the menu can change: restrict every blit below to the menu area
+            self.screen.set_clip(self._menu_area)
+
         # Background - StartPage.jpg from UI folder
         if self.background:
-            self.screen.blit(self.background, (0, 0))
+            blit_list = [(self.background, (0, 0))]
         else:
             self.screen.fill(BLACK)
+            blit_list = []
 
         # Menu - positioned in empty slots on the right side (centered)
-        for i, item in enumerate(self.menu_items):
-            menu_x, y_pos = self.menu_positions[i]
-            
-            highlight = (i == self.selected_index)
-            color = LIGHT_GOLD if highlight else PAPER_COLOR
-
-            if highlight:
-                indicator = self.font_medium.render(">", True, GOLD)
-                rect = indicator.get_rect(center=(menu_x - 100, y_pos))
-                self.screen.blit(indicator, rect)
-
-            shadow = self.font_medium.render(item, True, BLACK)
-            shadow_rect = shadow.get_rect(center=(menu_x + 2, y_pos + 2))
-            self.screen.blit(shadow, shadow_rect)
-
-            text = self.font_medium.render(item, True, color)
-            text_rect = text.get_rect(center=(menu_x, y_pos))
-            self.screen.blit(text, text_rect)
+        for i, (shadow, shadow_rect, normal, highlight, text_rect, indicator_rect) in enumerate(self._menu_cache):
+            if i == self.selected_index:
+                blit_list.append((self.indicator_surface, indicator_rect))
+                blit_list.append((shadow, shadow_rect))
+                blit_list.append((highlight, text_rect))
+            else:
+                blit_list.append((shadow, shadow_rect))
+                blit_list.append((normal, text_rect))
 
-        pygame.display.flip()
+        # One batched call (pygame-ce) instead of a blit per surface
+        self.screen.fblits(blit_list)
+        if full:
+            pygame.display.flip()
+        else:
+            self.screen.set_clip(None)
+            pygame.display.update(self._menu_area)
 
     # ------------------------------------
     # RUN LOOP
     # ------------------------------------
     def run(self):
+        self._needs_redraw = True
+        self._needs_full_redraw = True
         while True:
             result = self.handle_input()
 
-            if result == "quit":
-                return "quit"
+            if result == RESULT_QUIT:
+                return RESULT_QUIT
 
-            if result == "start":
-                return "start"
+            if result == RESULT_START:
+                return RESULT_START
 
             if result == "options":
                 print("Opening options…")
             
-            if result == "test_mode":
-                return "test_mode"
+            if result == RESULT_TEST_MODE:
+                return RESULT_TEST_MODE
 
-            self.draw()
+            if self._needs_redraw:
+                self._needs_redraw = False
+                self.draw()
+            # FPS stays the ceiling; idle frames just poll input and sleep
             self.clock.tick(FPS)
 
 
 class GameScreen:
-    def __init__(self, screen, background, font_path, test_mode=False):
+    def __init__(self, screen, background, font_path, test_mode=False, clock=None):
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.clock = clock if clock is not None else pygame.time.Clock()
         self.test_mode = test_mode
         
         # Load Back3.png from UI folder
         back3_path = os.path.join("UI", "Back3.png")
         if os.path.exists(back3_path):
-            self.background = pygame.image.load(back3_path).convert()
-            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.background = load_image(back3_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
         else:
             print("WARNING: Back3.png not found:", back3_path)
             self.background = background if background else None
@@ -1229,13 +1535,12 @@ class GameScreen:
         # Load LevelCard image
         levelcard_path = os.path.join("LevelPage", "LevelCard.jpg")
         if os.path.exists(levelcard_path):
-            original_image = pygame.image.load(levelcard_path).convert_alpha()
+            original_image = load_image(levelcard_path)
             # Reduce card size by 20% (scale to 80%)
-            original_width = original_image.get_width()
-            original_height = original_image.get_height()
+            original_width, original_height = original_image.get_size()
             new_width = int(original_width * 0.8)
             new_height = int(original_height * 0.8)
-            self.levelcard_image = pygame.transform.smoothscale(original_image, (new_width, new_height)).convert_alpha()
+            self.levelcard_image = load_image(levelcard_path, (new_width, new_height))
         else:
             print("WARNING: LevelCard.jpg not found:", levelcard_path)
             self.levelcard_image = None
@@ -1246,29 +1551,28 @@ class GameScreen:
         self.card_position = (padding_x, padding_y)
         
         # Load fonts for card text
-        self.font_card = pygame.font.Font(font_path, 48)  # For title
-        self.font_card_desc = pygame.font.Font(font_path, 32)  # For description
+        self.font_card = get_font(font_path, 48)  # For title
+        self.font_card_desc = get_font(font_path, 32)  # For description
+        # (title, description) -> (title surface, wrapped description line surfaces)
+        self._card_text_cache = {}
         
         # Load StartArrow image
         startarrow_path = os.path.join("LevelPage", "StartArrow.jpg")
         if os.path.exists(startarrow_path):
-            original_arrow = pygame.image.load(startarrow_path).convert_alpha()
+            original_arrow = load_image(startarrow_path)
             # Reduce arrow size to 50% to fit organically on the card
-            original_width = original_arrow.get_width()
-            original_height = original_arrow.get_height()
+            original_width, original_height = original_arrow.get_size()
             new_width = int(original_width * 0.5)
             new_height = int(original_height * 0.5)
-            self.startarrow_image = pygame.transform.smoothscale(original_arrow, (new_width, new_height)).convert_alpha()
+            self.startarrow_image = load_image(startarrow_path, (new_width, new_height))
         else:
             print("WARNING: StartArrow.jpg not found:", startarrow_path)
             self.startarrow_image = None
         
         # Calculate StartArrow position in bottom right corner of card
         if self.levelcard_image and self.startarrow_image:
-            card_width = self.levelcard_image.get_width()
-            card_height = self.levelcard_image.get_height()
-            arrow_width = self.startarrow_image.get_width()
-            arrow_height = self.startarrow_image.get_height()
+            card_width, card_height = self.levelcard_image.get_size()
+            arrow_width, arrow_height = self.startarrow_image.get_size()
             # Position: bottom right corner with small padding
             arrow_padding = 15
             self.arrow_position = (
@@ -1306,7 +1610,7 @@ class GameScreen:
             level1_picture_path = level1_picture_path_jpg
         
         if level1_picture_path:
-            level1_picture_original = pygame.image.load(level1_picture_path).convert_alpha()
+            level1_picture_original = load_image(level1_picture_path)
             # Scale to fit in the dark square on the left side of the card
             # Fixed size for all levels: 262 pixels
             picture_size = 262  # Size for the dark square area (fixed for all levels)
@@ -1316,7 +1620,7 @@ class GameScreen:
             scale_factor = min(picture_size / original_pic_width, picture_size / original_pic_height) * 0.9  # 90% to leave some padding
             new_pic_width = int(original_pic_width * scale_factor)
             new_pic_height = int(original_pic_height * scale_factor)
-            self.level1_picture = pygame.transform.smoothscale(level1_picture_original, (new_pic_width, new_pic_height)).convert_alpha()
+            self.level1_picture = load_image(level1_picture_path, (new_pic_width, new_pic_height))
         else:
             print("WARNING: Level1Picture.png and Level1Picture.jpg not found in LevelPage folder")
             self.level1_picture = None
@@ -1330,10 +1634,11 @@ class GameScreen:
             for frame_file in frame_files:
                 frame_path = os.path.join(animation_folder, frame_file)
                 try:
-                    frame_img = pygame.image.load(frame_path).convert_alpha()
                     # Scale to same size as level1_picture
                     if self.level1_picture:
-                        frame_img = pygame.transform.smoothscale(frame_img, (new_pic_width, new_pic_height)).convert_alpha()
+                        frame_img = load_image(frame_path, (new_pic_width, new_pic_height))
+                    else:
+                        frame_img = load_image(frame_path)
                     self.level1_animation_frames.append(frame_img)
                 except Exception as e:
                     print(f"WARNING: Could not load animation frame {frame_file}: {e}")
@@ -1345,11 +1650,15 @@ class GameScreen:
         self.level1_animation_frame_index = 0
         self.level1_animation_timer = 0.0
         self.level1_animation_frame_duration = 0.12  # Slow but not too slow: 0.12 seconds per frame (2.88 seconds total for 24 frames)
+        # Redraw only after input/hover changes or while the hover animation plays;
+        # animation steps repaint just the picture area (set when the card is drawn)
+        self._needs_redraw = True
+        self._level1_picture_rect = None
         
         # Level 2 picture
         level2_picture_path = os.path.join("LevelPage", "Level2Picture.jpg")
         if os.path.exists(level2_picture_path):
-            level2_picture_original = pygame.image.load(level2_picture_path).convert_alpha()
+            level2_picture_original = load_image(level2_picture_path)
             # Scale to fit in the dark square on the left side of the card
             picture_size = 262  # Size for the dark square area (fixed for all levels)
             original_pic_width = level2_picture_original.get_width()
@@ -1358,7 +1667,7 @@ class GameScreen:
             scale_factor = min(picture_size / original_pic_width, picture_size / original_pic_height) * 0.9  # 90% to leave some padding
             new_pic_width = int(original_pic_width * scale_factor)
             new_pic_height = int(original_pic_height * scale_factor)
-            self.level2_picture = pygame.transform.smoothscale(level2_picture_original, (new_pic_width, new_pic_height)).convert_alpha()
+            self.level2_picture = load_image(level2_picture_path, (new_pic_width, new_pic_height))
         else:
             print("WARNING: Level2Picture.jpg not found:", level2_picture_path)
             self.level2_picture = None
@@ -1373,14 +1682,14 @@ class GameScreen:
             level3_picture_path = level3_picture_path_jpg
 
         if level3_picture_path:
-            level3_picture_original = pygame.image.load(level3_picture_path).convert_alpha()
+            level3_picture_original = load_image(level3_picture_path)
             picture_size = 262  # Size for the dark square area (fixed for all levels)
             original_pic_width = level3_picture_original.get_width()
             original_pic_height = level3_picture_original.get_height()
             scale_factor = min(picture_size / original_pic_width, picture_size / original_pic_height) * 0.9
             new_pic_width = int(original_pic_width * scale_factor)
             new_pic_height = int(original_pic_height * scale_factor)
-            self.level3_picture = pygame.transform.smoothscale(level3_picture_original, (new_pic_width, new_pic_height)).convert_alpha()
+            self.level3_picture = load_image(level3_picture_path, (new_pic_width, new_pic_height))
         else:
             print("WARNING: Level3Picture.png and Level3Picture.jpg not found in LevelPage folder")
             self.level3_picture = None
@@ -1395,14 +1704,14 @@ class GameScreen:
             level4_picture_path = level4_picture_path_jpg
 
         if level4_picture_path:
-            level4_picture_original = pygame.image.load(level4_picture_path).convert_alpha()
+            level4_picture_original = load_image(level4_picture_path)
             picture_size = 262  # Size for the dark square area (fixed for all levels)
             original_pic_width = level4_picture_original.get_width()
             original_pic_height = level4_picture_original.get_height()
             scale_factor = min(picture_size / original_pic_width, picture_size / original_pic_height) * 0.9
             new_pic_width = int(original_pic_width * scale_factor)
             new_pic_height = int(original_pic_height * scale_factor)
-            self.level4_picture = pygame.transform.smoothscale(level4_picture_original, (new_pic_width, new_pic_height)).convert_alpha()
+            self.level4_picture = load_image(level4_picture_path, (new_pic_width, new_pic_height))
         else:
             print("WARNING: Level4Picture.png and Level4Picture.jpg not found in LevelPage folder")
             self.level4_picture = None
@@ -1468,14 +1777,14 @@ class GameScreen:
                         level_pic_path = level_pic_path_jpg
                     
                     if level_pic_path:
-                        level_pic_original = pygame.image.load(level_pic_path).convert_alpha()
+                        level_pic_original = load_image(level_pic_path)
                         picture_size = 262
                         original_pic_width = level_pic_original.get_width()
                         original_pic_height = level_pic_original.get_height()
                         scale_factor = min(picture_size / original_pic_width, picture_size / original_pic_height) * 0.9
                         new_pic_width = int(original_pic_width * scale_factor)
                         new_pic_height = int(original_pic_height * scale_factor)
-                        level_pic = pygame.transform.smoothscale(level_pic_original, (new_pic_width, new_pic_height)).convert_alpha()
+                        level_pic = load_image(level_pic_path, (new_pic_width, new_pic_height))
                     else:
                         level_pic = None
                     self.test_level_pictures.append(level_pic)
@@ -1550,6 +1859,46 @@ class GameScreen:
                 
                 # Create rect for level 1 card hover detection
                 self.card1_rect = pygame.Rect(self.card_position[0], self.card_position[1], card_width, card_height)
+        
+        # Card labels come from Lang, which is loaded before any page is built:
+        # resolve them once here instead of looking them up every frame
+        def lang_text(key):
+            """Translated text for key, or None when Lang.csv has no entry for it"""
+            text = get_text(key, None)
+            return text if text and text != key else None
+        
+        # level -> (title, description) for the normal-mode cards
+        self._card_labels = {
+            1: ("1815", get_text("Level1Cond", "Level1Cond")),
+            2: ("1825", get_text("Level2Cond", "Level2Cond")),
+            3: ("1830", get_text("Level3Cond", "Level3Cond")),
+            4: (lang_text("Level4Year") or "1840", lang_text("Level4Cond")),
+        }
+        # Test mode: level -> (title, description), or None when the level has no description
+        self._test_card_labels = {}
+        if self.test_mode:
+            for level_num in range(1, self.num_levels + 1):
+                desc_text = lang_text(f"Level{level_num}Cond")
+                if desc_text:
+                    year_text = lang_text(f"Level{level_num}Year") or str(1815 + (level_num - 1) * 10)
+                    self._test_card_labels[level_num] = (year_text, desc_text)
+                else:
+                    self._test_card_labels[level_num] = None
+    
+    def reset(self):
+        """Restart hover animation and scroll when the page is shown again (assets stay loaded)."""
+        self.is_hovering_level1 = False
+        self.level1_animation_frame_index = 0
+        self.level1_animation_timer = 0.0
+        self.scroll_y = 0
+        self._needs_redraw = True
+    
+    def _level1_animating(self):
+        """True while the level 1 hover animation still has frames to play."""
+        return (
+            self.is_hovering_level1
+            and self.level1_animation_frame_index < len(self.level1_animation_frames) - 1
+        )
     
     def handle_input(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -1559,6 +1908,9 @@ class GameScreen:
             was_hovering = self.is_hovering_level1
             self.is_hovering_level1 = self.card1_rect.collidepoint(mouse_pos)
             
+            if was_hovering != self.is_hovering_level1:
+                self._needs_redraw = True
+            
             # If mouse just left the card, reset animation to first frame
             if was_hovering and not self.is_hovering_level1:
                 self.level1_animation_frame_index = 0
@@ -1572,6 +1924,8 @@ class GameScreen:
             self.is_hovering_level1 = False
         
         for event in pygame.event.get():
+            # Any queued event (scroll, click, window expose) may change what is shown
+            self._needs_redraw = True
             if event.type == pygame.QUIT:
                 return "quit"
             
@@ -1647,33 +2001,10 @@ class GameScreen:
             picture_y -= 11
             self.screen.blit(level_picture, (picture_x, picture_y))
         
-        # Check if level text exists in Lang dictionary
-        desc_key = f"Level{level_num}Cond"
-        desc_text = get_text(desc_key, None)
-        
-        # Only draw title and description if text exists (not just the key)
-        if desc_text and desc_text != desc_key:
-            # Draw card title (year from Lang.csv)
-            year_key = f"Level{level_num}Year"
-            year_text = get_text(year_key, None)
-            card_text = year_text if year_text and year_text != year_key else str(1815 + (level_num - 1) * 10)
-            text_surface = self.font_card.render(card_text, True, PAPER_COLOR)
-            text_x = card_position[0] + 390
-            text_y = card_position[1] + 8
-            self.screen.blit(text_surface, (text_x, text_y))
-            
-            # Split text into multiple lines
-            max_width = 400
-            lines = wrap_text(desc_text, self.font_card_desc, max_width)
-            
-            # Draw each line below the title
-            line_height = self.font_card_desc.get_height() + 5
-            start_y = text_y + text_surface.get_height() + 20
-            start_x = card_position[0] + 250
-            
-            for i, line in enumerate(lines):
-                line_surface = self.font_card_desc.render(line, True, PAPER_COLOR)
-                self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+        # Only draw title and description if the level has text in Lang.csv
+        labels = self._test_card_labels.get(level_num)
+        if labels:
+            self._draw_card_text(card_position, *labels)
         
         # Draw StartArrow in bottom right corner
         if self.startarrow_image:
@@ -1681,7 +2012,48 @@ class GameScreen:
             arrow_y = card_position[1] + card_height - self.startarrow_image.get_height() - 15
             self.screen.blit(self.startarrow_image, (arrow_x, arrow_y))
     
+    def _get_card_text(self, title_text, desc_text):
+        """Rendered title and wrapped description lines for a level card (rendered once, then cached)"""
+        key = (title_text, desc_text)
+        cached = self._card_text_cache.get(key)
+        if cached is None:
+            title_surface = self.font_card.render(title_text, True, PAPER_COLOR)
+            # Split long text into multiple lines (max width ~400px for card)
+            lines = wrap_text(desc_text, self.font_card_desc, 400) if desc_text else []
+            line_surfaces = tuple(self.font_card_desc.render(line, True, PAPER_COLOR) for line in lines)
+            cached = (title_surface, line_surfaces)
+            self._card_text_cache[key] = cached
+        return cached
+    
+    def _draw_card_text(self, card_position, title_text, desc_text):
+        """Draw a level card's title (year) and, below it, its description (desc_text may be None)"""
+        title_surface, line_surfaces = self._get_card_text(title_text, desc_text)
+        # Position: card top + small offset, card left + right shift
+        text_x = card_position[0] + 390
+        text_y = card_position[1] + 8
+        self.screen.blit(title_surface, (text_x, text_y))
+        
+        # Draw each line below the title
+        line_height = self.font_card_desc.get_height() + 5  # 5px spacing between lines
+        start_y = text_y + title_surface.get_height() + 20  # 20px below title
+        start_x = card_position[0] + 250  # Left margin for description
+        for i, line_surface in enumerate(line_surfaces):
+            self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+    
     def draw(self):
+        self._draw_scene()
+        pygame.display.flip()
+    
+    def _draw_level1_animation_step(self):
+        """Repaint and present only the level 1 picture area for a hover animation frame."""
+        rect = self._level1_picture_rect
+        # Every blit in _draw_scene is clipped to the picture, so layering stays correct
+        self.screen.set_clip(rect)
+        self._draw_scene()
+        self.screen.set_clip(None)
+        pygame.display.update(rect)
+    
+    def _draw_scene(self):
         # Background
         if self.background:
             self.screen.blit(self.background, (0, 0))
@@ -1702,7 +2074,6 @@ class GameScreen:
                         card_position = (card_x, adjusted_y)
                         level_picture = self.test_level_pictures[card_index] if card_index < len(self.test_level_pictures) else None
                         self._draw_level_card(card_position, level_num, level_picture)
-            pygame.display.flip()
             return
         
         # Normal mode: Draw single level card in top left corner
@@ -1750,29 +2121,10 @@ class GameScreen:
                 picture_x -= 4
                 picture_y -= 11
                 self.screen.blit(picture_to_draw, (picture_x, picture_y))
+                self._level1_picture_rect = picture_to_draw.get_rect(topleft=(picture_x, picture_y))
             
-            # Draw card title "1815" in upper part, slightly shifted to the right
-            card_text = "1815"
-            text_surface = self.font_card.render(card_text, True, PAPER_COLOR)
-            # Position: card top + small offset, card left + right shift
-            text_x = self.card_position[0] + 390  # Shift 30px to the right from card left edge
-            text_y = self.card_position[1] + 8  # 20px from card top
-            self.screen.blit(text_surface, (text_x, text_y))
-            
-            # Draw card description with Level1Cond key below the title
-            desc_text = get_text("Level1Cond", "Level1Cond")
-            # Split long text into multiple lines (max width ~400px for card)
-            max_width = 400
-            lines = wrap_text(desc_text, self.font_card_desc, max_width)
-            
-            # Draw each line below the title
-            line_height = self.font_card_desc.get_height() + 5  # 5px spacing between lines
-            start_y = text_y + text_surface.get_height() + 20  # 20px below title
-            start_x = self.card_position[0] + 250  # Left margin for description
-            
-            for i, line in enumerate(lines):
-                line_surface = self.font_card_desc.render(line, True, PAPER_COLOR)
-                self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+            # Draw card title "1815" and the Level1Cond description below it
+            self._draw_card_text(self.card_position, *self._card_labels[1])
             
             # Draw StartArrow in bottom right corner
             if self.startarrow_image:
@@ -1802,28 +2154,8 @@ class GameScreen:
                 picture_y -= 11
                 self.screen.blit(self.level2_picture, (picture_x, picture_y))
             
-            # Draw card title "1825" in upper part, slightly shifted to the right
-            card_text = "1825"
-            text_surface = self.font_card.render(card_text, True, PAPER_COLOR)
-            # Position: card top + small offset, card left + right shift
-            text_x = self.card2_position[0] + 390  # Shift 30px to the right from card left edge
-            text_y = self.card2_position[1] + 8  # 20px from card top
-            self.screen.blit(text_surface, (text_x, text_y))
-            
-            # Draw card description with Level2Cond key below the title
-            desc_text = get_text("Level2Cond", "Level2Cond")
-            # Split long text into multiple lines (max width ~400px for card)
-            max_width = 400
-            lines = wrap_text(desc_text, self.font_card_desc, max_width)
-            
-            # Draw each line below the title
-            line_height = self.font_card_desc.get_height() + 5  # 5px spacing between lines
-            start_y = text_y + text_surface.get_height() + 20  # 20px below title
-            start_x = self.card2_position[0] + 250  # Left margin for description
-            
-            for i, line in enumerate(lines):
-                line_surface = self.font_card_desc.render(line, True, PAPER_COLOR)
-                self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+            # Draw card title "1825" and the Level2Cond description below it
+            self._draw_card_text(self.card2_position, *self._card_labels[2])
             
             # Draw StartArrow in bottom right corner of level 2 card
             if self.startarrow_image:
@@ -1847,23 +2179,8 @@ class GameScreen:
                 picture_y -= 11
                 self.screen.blit(self.level3_picture, (picture_x, picture_y))
 
-            # Draw card title "1830"
-            card_text = "1830"
-            text_surface = self.font_card.render(card_text, True, PAPER_COLOR)
-            text_x = self.card3_position[0] + 390
-            text_y = self.card3_position[1] + 8
-            self.screen.blit(text_surface, (text_x, text_y))
-
-            # Draw card description with Level3Cond key below the title
-            desc_text = get_text("Level3Cond", "Level3Cond")
-            max_width = 400
-            lines = wrap_text(desc_text, self.font_card_desc, max_width)
-            line_height = self.font_card_desc.get_height() + 5
-            start_y = text_y + text_surface.get_height() + 20
-            start_x = self.card3_position[0] + 250
-            for i, line in enumerate(lines):
-                line_surface = self.font_card_desc.render(line, True, PAPER_COLOR)
-                self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+            # Draw card title "1830" and the Level3Cond description below it
+            self._draw_card_text(self.card3_position, *self._card_labels[3])
 
             # Draw StartArrow in bottom right corner of level 3 card
             if self.startarrow_image:
@@ -1887,57 +2204,45 @@ class GameScreen:
                 picture_y -= 11
                 self.screen.blit(self.level4_picture, (picture_x, picture_y))
 
-            # Draw year/title if present in Lang (fallback to computed year)
-            year_key = "Level4Year"
-            year_text = get_text(year_key, None)
-            card_text = year_text if year_text and year_text != year_key else "1840"
-            text_surface = self.font_card.render(card_text, True, PAPER_COLOR)
-            text_x = self.card4_position[0] + 390
-            text_y = self.card4_position[1] + 8
-            self.screen.blit(text_surface, (text_x, text_y))
-
-            # Draw description if present
-            desc_key = "Level4Cond"
-            desc_text = get_text(desc_key, None)
-            if desc_text and desc_text != desc_key:
-                max_width = 400
-                lines = wrap_text(desc_text, self.font_card_desc, max_width)
-                line_height = self.font_card_desc.get_height() + 5
-                start_y = text_y + text_surface.get_height() + 20
-                start_x = self.card4_position[0] + 250
-                for i, line in enumerate(lines):
-                    line_surface = self.font_card_desc.render(line, True, PAPER_COLOR)
-                    self.screen.blit(line_surface, (start_x, start_y + i * line_height))
+            # Year/title from Lang (fallback "1840") and description if present
+            self._draw_card_text(self.card4_position, *self._card_labels[4])
 
             # Draw StartArrow in bottom right corner of level 4 card
             if self.startarrow_image:
                 self.screen.blit(self.startarrow_image, self.arrow4_position)
-        
-        pygame.display.flip()
     
     def run(self):
+        self._needs_redraw = True
         while True:
             result = self.handle_input()
             
-            if result == "quit":
+            if result == RESULT_QUIT:
                 pygame.quit()
                 sys.exit()
             
-            if result == "back":
-                return "back"
+            if result == RESULT_BACK:
+                return RESULT_BACK
             
             # Handle level selection - navigate to boss page
             if result and result.startswith("level_"):
                 return result
             
-            self.draw()
+            if self._needs_redraw:
+                self._needs_redraw = False
+                self.draw()
+            elif self._level1_animating():
+                if self._level1_picture_rect is not None:
+                    self._draw_level1_animation_step()
+                else:
+                    self.draw()
+            # FPS stays the ceiling; idle frames just poll input and sleep
             self.clock.tick(FPS)
 
 
 class GameplayPage:
-    def __init__(self, screen, font_path, difficulty="e", goal=None, level_number=1, is_boss_fight=False, boss_index=None, round_num=None, defeated_count=0):
+    def __init__(self, screen, font_path, difficulty="e", goal=None, level_number=1, is_boss_fight=False, boss_index=None, round_num=None, defeated_count=0, clock=None):
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.clock = clock if clock is not None else pygame.time.Clock()
         self.difficulty = difficulty  # "e", "m", or "h"
         self.Goal = goal  # Goal for this round
         self.level_number = level_number  # Level number for deck initialization
@@ -1964,162 +2269,92 @@ class GameplayPage:
         self.font_path = font_path
         
         # Load fonts
-        self.font_large = pygame.font.Font(font_path, 72)
-        self.font_medium = pygame.font.Font(font_path, 48)
-        self.font_small = pygame.font.Font(font_path, 36)
+        self.font_large = get_font(font_path, 72)
+        self.font_medium = get_font(font_path, 48)
+        self.font_small = get_font(font_path, 36)
+        # CardAction/CardTurns font file (prefer Gadugib), resolved once; sized fonts come from get_font
+        self.card_font_base = "Gadugib.ttf" if asset_exists("Gadugib.ttf") else font_path
+        self._card_action_geom_cache = {}  # card width -> (font, offset_x, offset_y, minus_shift)
+        self._card_action_text_cache = {}  # (CardAction value, card width) -> rendered text surface
         
         # Load background from GameplayPage folder
         bg_path = os.path.join("GameplayPage", "Background.png")
-        if os.path.exists(bg_path):
-            bg_image = pygame.image.load(bg_path).convert()
-            self.background = pygame.transform.smoothscale(bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        if asset_exists(bg_path):
+            self.background = load_image(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
         else:
             print("WARNING: GameplayPage background not found:", bg_path)
             self.background = None
         
         # Load Frame.png for the three top frames
         frame_path = os.path.join("GameplayPage", "Frame.png")
-        if os.path.exists(frame_path):
-            frame_original = pygame.image.load(frame_path).convert_alpha()
+        if asset_exists(frame_path):
+            frame_original = load_image(frame_path)
             # Scale frame appropriately - need to determine size based on layout
             # For three frames at top, each should be about 1/3 of screen width
             # Then reduce by 30% (multiply by 0.7)
             frame_width = int((SCREEN_WIDTH // 3 - 20) * 0.7)  # Leave some spacing, then reduce by 30%
             # Maintain aspect ratio
-            original_width = frame_original.get_width()
-            original_height = frame_original.get_height()
+            original_width, original_height = frame_original.get_size()
             scale_factor = frame_width / original_width
             frame_height = int(original_height * scale_factor)
-            self.frame = pygame.transform.smoothscale(frame_original, (frame_width, frame_height)).convert_alpha()
+            self.frame = load_image(frame_path, (frame_width, frame_height))
+            self.frame_size = self.frame.get_size()
         else:
             print("WARNING: Frame.png not found:", frame_path)
             self.frame = None
-
-        # Load arrows: outer up from ArrowAll, outer down from ArrowAllDown, middle from ArrowMiddle/Arrow1.png, all scaled to 60x60
-        arrow_path = os.path.join("GameplayPage", "ArrowAll", "ArrowAll.png")
-        arrow_path_1 = os.path.join("GameplayPage", "ArrowAll", "ArrowAll1.png")
-        arrow_path_2 = os.path.join("GameplayPage", "ArrowAll", "ArrowAll2.png")
-        arrow_down_path = os.path.join("GameplayPage", "ArrowAllDown", "ArrowAll.png")
-        arrow_down_path_1 = os.path.join("GameplayPage", "ArrowAllDown", "ArrowAll1.png")
-        arrow_down_path_2 = os.path.join("GameplayPage", "ArrowAllDown", "ArrowAll2.png")
-        arrow_mid_path = os.path.join("GameplayPage", "ArrowMiddle", "Arrow1.png")
-
-        # Outer up arrows (ArrowAll)
-        self.arrow_anim_frames = []
-        if os.path.exists(arrow_path):
-            base_img = pygame.image.load(arrow_path).convert_alpha()
-            base_img = pygame.transform.smoothscale(base_img, (60, 60)).convert_alpha()
-            self.arrow_anim_frames.append(base_img)
-            self.arrow_up = base_img
-        else:
-            print("WARNING: Arrow image not found:", arrow_path)
-            self.arrow_up = None
-        for extra_path in [arrow_path_1, arrow_path_2]:
-            if os.path.exists(extra_path):
-                img = pygame.image.load(extra_path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (60, 60)).convert_alpha()
-                self.arrow_anim_frames.append(img)
-        while len(self.arrow_anim_frames) < 3 and self.arrow_anim_frames:
-            self.arrow_anim_frames.append(self.arrow_anim_frames[-1])
-
-        # Outer down arrows (ArrowAllDown)
-        self.arrow_down_frames = []
-        if os.path.exists(arrow_down_path):
-            base_img = pygame.image.load(arrow_down_path).convert_alpha()
-            base_img = pygame.transform.smoothscale(base_img, (60, 60)).convert_alpha()
-            self.arrow_down_frames.append(base_img)
-            self.arrow_down = base_img
-        else:
-            print("WARNING: Arrow image not found:", arrow_down_path)
-            self.arrow_down = None
-        for extra_path in [arrow_down_path_1, arrow_down_path_2]:
-            if os.path.exists(extra_path):
-                img = pygame.image.load(extra_path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (60, 60)).convert_alpha()
-                self.arrow_down_frames.append(img)
-        while len(self.arrow_down_frames) < 3 and self.arrow_down_frames:
-            self.arrow_down_frames.append(self.arrow_down_frames[-1])
-
-        # Middle arrows - load animation frames for middle up arrow
-        arrow_mid_path_2 = os.path.join("GameplayPage", "ArrowMiddle", "Arrow2.png")
-        arrow_mid_path_3 = os.path.join("GameplayPage", "ArrowMiddle", "Arrow3.png")
-        
-        self.arrow_mid_up_frames = []
-        if os.path.exists(arrow_mid_path):
-            arrow_mid_img = pygame.image.load(arrow_mid_path).convert_alpha()
-            arrow_mid_img = pygame.transform.smoothscale(arrow_mid_img, (60, 60)).convert_alpha()
-            self.arrow_mid_up_frames.append(arrow_mid_img)
-            self.arrow_mid_up = arrow_mid_img
-        else:
-            print("WARNING: Middle Arrow image not found:", arrow_mid_path)
-            self.arrow_mid_up = None
-        
-        # Load additional animation frames for middle up arrow
-        for extra_path in [arrow_mid_path_2, arrow_mid_path_3]:
-            if os.path.exists(extra_path):
-                img = pygame.image.load(extra_path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (60, 60)).convert_alpha()
-                self.arrow_mid_up_frames.append(img)
-        
-        # Ensure we have 3 frames by duplicating if missing
-        while len(self.arrow_mid_up_frames) < 3 and self.arrow_mid_up_frames:
-            self.arrow_mid_up_frames.append(self.arrow_mid_up_frames[-1])
-        
-        # Middle down arrow - use ArrowDown1.png as base, then load animation frames from ArrowMiddleDown folder
-        arrow_mid_down_path_1 = os.path.join("GameplayPage", "ArrowMiddleDown", "ArrowDown1.png")
-        arrow_mid_down_path_2 = os.path.join("GameplayPage", "ArrowMiddleDown", "ArrowDown2.png")
-        arrow_mid_down_path_3 = os.path.join("GameplayPage", "ArrowMiddleDown", "ArrowDown3.png")
-        
-        self.arrow_mid_down_frames = []
-        if os.path.exists(arrow_mid_down_path_1):
-            arrow_mid_down_base = pygame.image.load(arrow_mid_down_path_1).convert_alpha()
-            arrow_mid_down_base = pygame.transform.smoothscale(arrow_mid_down_base, (60, 60)).convert_alpha()
-            self.arrow_mid_down_frames.append(arrow_mid_down_base)
-            self.arrow_mid_down = arrow_mid_down_base
-        else:
-            print("WARNING: Middle Down Arrow image not found:", arrow_mid_down_path_1)
-            self.arrow_mid_down = None
-        
-        # Load additional animation frames for middle down arrow
-        for extra_path in [arrow_mid_down_path_2, arrow_mid_down_path_3]:
-            if os.path.exists(extra_path):
-                img = pygame.image.load(extra_path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (60, 60)).convert_alpha()
-                self.arrow_mid_down_frames.append(img)
-        
-        # Ensure we have 3 frames by duplicating if missing
-        while len(self.arrow_mid_down_frames) < 3 and self.arrow_mid_down_frames:
-            self.arrow_mid_down_frames.append(self.arrow_mid_down_frames[-1])
-
-        # Arrow animation state (per clickable arrow)
-        self.arrow_anim_interval = 120  # ms
-        self.arrow_anim_sequence = [0, 1, 2, 1, 0]  # ping-pong once
-        self.arrow_entries = []  # populated each draw: [{'rect':Rect,'animating':bool,'idx':int,'last':ms}]
+            self.frame_size = None
+
+        # Load arrows: outer up from ArrowAll, outer down from ArrowAllDown, middle up from
+        # ArrowMiddle, middle down from ArrowMiddleDown. Each set is a base image plus two
+        # animation frames, all scaled to 60x60 and padded to 3 frames if some are missing.
+        def arrow_paths(folder, *names):
+            return [os.path.join("GameplayPage", folder, name) for name in names]
+
+        self.arrow_anim_frames, self.arrow_up = load_arrow_set(
+            arrow_paths("ArrowAll", "ArrowAll.png", "ArrowAll1.png", "ArrowAll2.png"), "Arrow")
+        self.arrow_down_frames, self.arrow_down = load_arrow_set(
+            arrow_paths("ArrowAllDown", "ArrowAll.png", "ArrowAll1.png", "ArrowAll2.png"), "Arrow")
+        self.arrow_mid_up_frames, self.arrow_mid_up = load_arrow_set(
+            arrow_paths("ArrowMiddle", "Arrow1.png", "Arrow2.png", "Arrow3.png"), "Middle Arrow")
+        self.arrow_mid_down_frames, self.arrow_mid_down = load_arrow_set(
+            arrow_paths("ArrowMiddleDown", "ArrowDown1.png", "ArrowDown2.png", "ArrowDown3.png"), "Middle Down Arrow")
+
+        # Arrow animation state (per clickable arrow); timing comes from ARROW_ANIM_* constants
+        self.arrow_entries = []  # populated on first draw: [{'rect':Rect,'animating':bool,'idx':int,'start':ms}]
+        self._arrow_entry_at = {}  # (market, arrow_type) -> entry in arrow_entries
+        # Trade action per arrow_type (0-3, top to bottom arrow); each takes the market index
+        self._arrow_trades = (
+            self._buy_max_shares,
+            self._buy_one_share,
+            self._sell_one_share,
+            self._sell_all_shares,
+        )
 
         # Load bottom frame for the strategy cards area
         bottom_frame_path = os.path.join("GameplayPage", "Bottom Frame.png")
-        if os.path.exists(bottom_frame_path):
-            bottom_original = pygame.image.load(bottom_frame_path).convert_alpha()
+        if asset_exists(bottom_frame_path):
+            bottom_original = load_image(bottom_frame_path)
             # Scale bottom frame to match the TOTAL width of the three market frames (A, B, C)
             # so the layout is perfectly symmetric.
             market_spacing = 10  # must match draw() spacing between top frames
             target_width = (
-                self.frame.get_width() * 3 + market_spacing * 2
+                self.frame_size[0] * 3 + market_spacing * 2
                 if self.frame
                 else int(SCREEN_WIDTH * 0.8064)
             )
-            b_orig_w = bottom_original.get_width()
-            b_orig_h = bottom_original.get_height()
+            b_orig_w, b_orig_h = bottom_original.get_size()
             b_scale = target_width / b_orig_w
             target_height = int(b_orig_h * b_scale)
-            self.bottom_frame = pygame.transform.smoothscale(bottom_original, (target_width, target_height)).convert_alpha()
+            self.bottom_frame = load_image(bottom_frame_path, (target_width, target_height))
+            self.bottom_frame_size = self.bottom_frame.get_size()
         else:
             print("WARNING: Bottom Frame.png not found:", bottom_frame_path)
             self.bottom_frame = None
+            self.bottom_frame_size = None
 
         # Load sound for arrow click
         woodtap_path = os.path.join("Sounds", "WoodTap.wav")
-        if os.path.exists(woodtap_path):
+        if asset_exists(woodtap_path):
             self.arrow_sound = pygame.mixer.Sound(woodtap_path)
         else:
             print("WARNING: WoodTap.wav not found at", woodtap_path)
@@ -2127,100 +2362,55 @@ class GameplayPage:
 
         # Load sound for price animation
         typewriter_path = os.path.join("Sounds", "Typewriter.wav")
-        if os.path.exists(typewriter_path):
+        if asset_exists(typewriter_path):
             self.typewriter_sound = pygame.mixer.Sound(typewriter_path)
         else:
             print("WARNING: Typewriter.wav not found at", typewriter_path)
             self.typewriter_sound = None
 
-        # Load price unchanged animation from Graph= folder
-        graph_folder = os.path.join("GameplayPage", "Graph=")
-        self.price_unchanged_frames = []
+        # Load price animations: unchanged (Graph=), rise (GraphRise), fall (GraphDown)
         # Animation size: increased by 40% from 84x72 to 118x101 (total 68% increase from original 70x60)
         self.animation_width = 118
         self.animation_height = 101
-        if os.path.exists(graph_folder):
-            # Load frames 0.png to 20.png (21 frames)
-            for i in range(21):
-                frame_path = os.path.join(graph_folder, f"{i}.png")
-                if os.path.exists(frame_path):
-                    frame_img = pygame.image.load(frame_path).convert_alpha()
-                    # Scale to 84x72 (20% increase from 70x60)
-                    frame_img = pygame.transform.smoothscale(frame_img, (self.animation_width, self.animation_height)).convert_alpha()
-                    self.price_unchanged_frames.append(frame_img)
-                else:
-                    print(f"WARNING: Frame {i}.png not found in Graph= folder")
-        else:
-            print("WARNING: Graph= folder not found:", graph_folder)
-
-        # Load price rise animation from GraphRise folder
-        graph_rise_folder = os.path.join("GameplayPage", "GraphRise")
-        self.price_rise_frames = []
-        if os.path.exists(graph_rise_folder):
-            # Load frames 1.png to 15.png (15 frames)
-            for i in range(1, 16):
-                frame_path = os.path.join(graph_rise_folder, f"{i}.png")
-                if os.path.exists(frame_path):
-                    frame_img = pygame.image.load(frame_path).convert_alpha()
-                    # Scale to 84x72 (20% increase from 70x60)
-                    frame_img = pygame.transform.smoothscale(frame_img, (self.animation_width, self.animation_height)).convert_alpha()
-                    self.price_rise_frames.append(frame_img)
-                else:
-                    print(f"WARNING: Frame {i}.png not found in GraphRise folder")
-        else:
-            print("WARNING: GraphRise folder not found:", graph_rise_folder)
-
-        # Load price fall animation from GraphDown folder
-        graph_down_folder = os.path.join("GameplayPage", "GraphDown")
-        self.price_fall_frames = []
-        if os.path.exists(graph_down_folder):
-            # Load frames 1.png to 17.png (17 frames)
-            for i in range(1, 18):
-                frame_path = os.path.join(graph_down_folder, f"{i}.png")
-                if os.path.exists(frame_path):
-                    frame_img = pygame.image.load(frame_path).convert_alpha()
-                    # Scale to 84x72 (20% increase from 70x60)
-                    frame_img = pygame.transform.smoothscale(frame_img, (self.animation_width, self.animation_height)).convert_alpha()
-                    self.price_fall_frames.append(frame_img)
-                else:
-                    print(f"WARNING: Frame {i}.png not found in GraphDown folder")
-        else:
-            print("WARNING: GraphDown folder not found:", graph_down_folder)
+        animation_size = (self.animation_width, self.animation_height)
+        # Frame strips are cached process-wide and shared read-only by all three markets
+        # Graph=: frames 0.png to 20.png (21 frames)
+        self.price_unchanged_frames = load_frame_strip(os.path.join("GameplayPage", "Graph="), range(21), animation_size)
+        # GraphRise: frames 1.png to 15.png (15 frames)
+        self.price_rise_frames = load_frame_strip(os.path.join("GameplayPage", "GraphRise"), range(1, 16), animation_size)
+        # GraphDown: frames 1.png to 17.png (17 frames)
+        self.price_fall_frames = load_frame_strip(os.path.join("GameplayPage", "GraphDown"), range(1, 18), animation_size)
 
         # Price animation state (for sequential playback)
-        self.price_animation_queue = []  # List of {'market': 0-2, 'type': 'unchanged'|'rise'} that need animation
+        self.price_animation_queue = collections.deque()  # FIFO of {'market': 0-2, 'type': 'unchanged'|'rise'} that need animation
         self.current_price_animation = None  # Current animation: {'market': 0-2, 'type': 'unchanged'|'rise', 'frame_idx': int, 'last_update': ms}
-        self.price_animation_speed = 12  # frames per second (increased by 30% from 9 to 12, approximately 83ms per frame)
-        self.price_animation_interval = 1000 // self.price_animation_speed  # ms per frame
+        # Playback speed: PRICE_ANIM_INTERVAL_MS per frame
 
         # Load column logos (A, B, C)
         logo_a_path = os.path.join("GameplayPage", "A logo New.png")
         logo_b_path = os.path.join("GameplayPage", "B Logo New.png")
         logo_c_path = os.path.join("GameplayPage", "C Logo New.png")
 
-        self.logo_a = pygame.image.load(logo_a_path).convert_alpha() if os.path.exists(logo_a_path) else None
-        self.logo_b = pygame.image.load(logo_b_path).convert_alpha() if os.path.exists(logo_b_path) else None
-        self.logo_c = pygame.image.load(logo_c_path).convert_alpha() if os.path.exists(logo_c_path) else None
-
         # Scale logos to fit inside frames (approx top-left area) without distorting aspect ratio
         max_logo_w, max_logo_h = 112, 128  # previous target box, but preserve aspect ratio per logo
-        def scale_logo(img):
-            if not img:
+        def scale_logo(path):
+            if not asset_exists(path):
                 return None
-            w, h = img.get_width(), img.get_height()
+            img = load_image(path)
+            w, h = img.get_size()
             scale = min(max_logo_w / w, max_logo_h / h)
             new_size = (int(w * scale), int(h * scale))
-            return pygame.transform.smoothscale(img, new_size).convert_alpha()
+            return load_image(path, new_size)
 
-        self.logo_a = scale_logo(self.logo_a)
-        self.logo_b = scale_logo(self.logo_b)
-        self.logo_c = scale_logo(self.logo_c)
+        self.logo_a = scale_logo(logo_a_path)
+        self.logo_b = scale_logo(logo_b_path)
+        self.logo_c = scale_logo(logo_c_path)
         
         # Load rewards from Rewards.csv
         # Format: {(level, round, button): {'reward1': [list of card_numbers or single int], 'reward2': card_number or None}}
         self.rewards = {}
         rewards_file = "Rewards.csv"
-        if os.path.exists(rewards_file):
+        if asset_exists(rewards_file):
             try:
                 with open(rewards_file, 'r', encoding='utf-8-sig') as f:
                     reader = csv.DictReader(f, delimiter=';')
@@ -2265,49 +2455,36 @@ class GameplayPage:
                                     'text': reward_text if reward_text else None
                                 }
                                 self.rewards[(level, round_num, button)] = reward_entry
-            except Exception as e:
+            except (OSError, ValueError, csv.Error) as e:
                 print(f"ERROR loading rewards file in GameplayPage: {e}")
-                import traceback
                 traceback.print_exc()
 
         # Load bundle of shares image
         bundle_path = os.path.join("GameplayPage", "A bundle of shares.png")
-        if os.path.exists(bundle_path):
-            bundle_original = pygame.image.load(bundle_path).convert_alpha()
+        if asset_exists(bundle_path):
             # Scale bundle image to 50% of original size
-            w, h = bundle_original.get_width(), bundle_original.get_height()
-            new_size = (int(w * 0.5), int(h * 0.5))
-            self.bundle_image = pygame.transform.smoothscale(bundle_original, new_size).convert_alpha()
+            self.bundle_image = load_image_scaled_by(bundle_path, 0.5, alpha=None)
+            self.bundle_size = self.bundle_image.get_size()
         else:
             print("WARNING: A bundle of shares.png not found:", bundle_path)
             self.bundle_image = None
+            self.bundle_size = None
 
         # Load Dollar image
         dollar_path = os.path.join("GameplayPage", "Dollar.png")
-        if os.path.exists(dollar_path):
-            dollar_original = pygame.image.load(dollar_path).convert_alpha()
+        if asset_exists(dollar_path):
             # Scale dollar image to match bundle image proportions (50% of original)
-            w, h = dollar_original.get_width(), dollar_original.get_height()
-            new_size = (int(w * 0.5), int(h * 0.5))
-            self.dollar_image = pygame.transform.smoothscale(dollar_original, new_size).convert_alpha()
+            self.dollar_image = load_image_scaled_by(dollar_path, 0.5, alpha=None)
+            self.dollar_size = self.dollar_image.get_size()
         else:
             print("WARNING: Dollar.png not found:", dollar_path)
             self.dollar_image = None
+            self.dollar_size = None
 
-        # Initialize quantity variables
-        self.Aquantity = 2
-        self.Bquantity = 0
-        self.Cquantity = 0
-
-        # Initialize price variables
-        self.Aprice = 2
-        self.BPrice = 2
-        self.CPrice = 2
-
-        # Initialize step variables (price change steps)
-        self.StepA = 2
-        self.StepB = 4
-        self.StepC = 6
+        # Per-market state, indexed by market (0 = A, 1 = B, 2 = C)
+        self.quantity = [2, 0, 0]  # shares held
+        self.price = [2, 2, 2]  # current share price
+        self.step = [2, 4, 6]  # price change steps
 
         # Initialize game state variables
         global global_start_money_bonus
@@ -2335,18 +2512,13 @@ class GameplayPage:
 
         # Load End Turn button
         end_button_path = os.path.join("GameplayPage", "EndButton.png")
-        if os.path.exists(end_button_path):
-            end_button_original = pygame.image.load(end_button_path).convert_alpha()
-            # Scale button appropriately - adjust size as needed
-            button_scale = 0.3  # Adjust this value to match screenshot size
-            w, h = end_button_original.get_width(), end_button_original.get_height()
-            new_size = (int(w * button_scale), int(h * button_scale))
-            self.end_button = pygame.transform.smoothscale(end_button_original, new_size).convert_alpha()
+        if asset_exists(end_button_path):
+            # Scale button (tune END_BUTTON_SCALE to match the screenshot size)
+            self.end_button = load_image_scaled_by(end_button_path, END_BUTTON_SCALE, alpha=None)
+            new_size = self.end_button.get_size()
             # Calculate button position in bottom-right corner
-            button_margin_right = 50
-            button_margin_bottom = 50
-            button_x = SCREEN_WIDTH - new_size[0] - button_margin_right
-            button_y = SCREEN_HEIGHT - new_size[1] - button_margin_bottom
+            button_x = SCREEN_WIDTH - new_size[0] - END_BUTTON_MARGIN_RIGHT
+            button_y = SCREEN_HEIGHT - new_size[1] - END_BUTTON_MARGIN_BOTTOM
             self.end_button_rect = pygame.Rect(button_x, button_y, new_size[0], new_size[1])
         else:
             print("WARNING: EndButton.png not found:", end_button_path)
@@ -2369,7 +2541,8 @@ class GameplayPage:
                 # Apply functionalities (e.g., "Self.hand=Self.hand-1", "LastTurn=LastTurn-1")
                 if func_string:
                     apply_boss_functionality(func_string, self)
-                    print(f"Applied boss functionality for boss {boss_number} (applies to all rounds): {func_string}")
+                    if DEBUG:
+                        print(f"Applied boss functionality for boss {boss_number} (applies to all rounds): {func_string}")
                 else:
                     # Legacy: Boss 2 (Adam Smith) - Level 2, boss_index 0: LastTurn - 1
                     # If no functionality string, apply legacy behavior
@@ -2380,16 +2553,16 @@ class GameplayPage:
         global global_dobor
         self.Dobor = global_dobor
         placeholder_path = os.path.join("GameplayPage", "Placeholder.png")
-        self.placeholder = pygame.image.load(placeholder_path).convert_alpha() if os.path.exists(placeholder_path) else None
+        self.placeholder = load_image(placeholder_path, alpha=None) if asset_exists(placeholder_path) else None
         if self.placeholder:
             # Scale placeholder for bottom area: 138x240 (40% larger than 96x168: 30% + 10%)
-            self.placeholder_bottom = pygame.transform.smoothscale(self.placeholder, (138, 240)).convert_alpha()
+            self.placeholder_bottom = load_image(placeholder_path, (138, 240), alpha=None)
             # Scale placeholder for market area: also 96x168 (увеличены на 20%)
-            self.placeholder_market = pygame.transform.smoothscale(self.placeholder, (96, 168)).convert_alpha()
+            self.placeholder_market = load_image(placeholder_path, (96, 168), alpha=None)
             # Scale placeholder for right-side areas (slightly smaller to fit 6 slots nicely)
             side_ph_w = int(96 * 0.85)
             side_ph_h = int(168 * 0.85)
-            self.placeholder_side = pygame.transform.smoothscale(self.placeholder, (side_ph_w, side_ph_h)).convert_alpha()
+            self.placeholder_side = load_image(placeholder_path, (side_ph_w, side_ph_h), alpha=None)
         else:
             self.placeholder_bottom = None
             self.placeholder_market = None
@@ -2410,13 +2583,10 @@ class GameplayPage:
         # Locked state for side cards after end turn (top area only): {slot: bool}
         self.side_cards_locked_top = {}
         
-        # Load card images
-        self.card_images_original = {}  # Original card images
-        self.card_images_bottom = {}  # Scaled for bottom area
-        self.card_images_market = {}  # Pre-scaled for market area (for performance)
-        self.card_images_side = {}  # Pre-scaled for right-side (6-slot) area
-        self.card_size_bottom = (142, 244)  # 4 pixels larger than bottom placeholder (138+4, 240+4)
-        self.card_size_market = (99, 171)  # 3 pixels larger than market placeholder (96+3, 168+3)
+        # Card faces, loaded and scaled on first draw: {(card_id, size): Surface or None}
+        self._card_images = {}
+        self.card_size_bottom = CARD_SIZE_BOTTOM
+        self.card_size_market = CARD_SIZE_MARKET
         # Right-side cards are slightly smaller; keep a small border like other zones
         if self.placeholder_side:
             self.card_size_side = (self.placeholder_side.get_width() + 3, self.placeholder_side.get_height() + 3)
@@ -2428,99 +2598,6 @@ class GameplayPage:
         self.side_placeholders_top = []   # [{'slot': int, 'rect': Rect}]
         self.side_placeholders_bottom = []  # [{'slot': int, 'rect': Rect}]
         
-        # Card base mapping: which base image to use for each card
-        # Cards 11, 12, 13, 14 use Card_11.png as base
-        # Cards 15, 16 use Card_15.png as base
-        # Cards 17, 18 use Card_17.png as base
-        card_base_mapping = {}
-        base_card_ids = [1, 2, 3, 4, 100]
-        for card_id in base_card_ids:
-            card_base_mapping[card_id] = card_id  # Base cards use their own images
-        card_base_mapping[11] = 11
-        card_base_mapping[12] = 11
-        card_base_mapping[13] = 11
-        card_base_mapping[14] = 11
-        card_base_mapping[15] = 15
-        card_base_mapping[16] = 15
-        card_base_mapping[17] = 17
-        card_base_mapping[18] = 17
-        
-        # Load all card images (base cards + known action cards + any cards present in Cards.csv)
-        config_card_ids = []
-        try:
-            config_card_ids = [int(x) for x in (self.card_types.keys() if self.card_types else [])]
-        except Exception:
-            config_card_ids = []
-        all_card_ids = sorted(set(base_card_ids + [11, 12, 13, 14, 15, 16, 17, 18] + config_card_ids))
-        for card_id in all_card_ids:
-            base_id = card_base_mapping.get(card_id, card_id)
-            # Try both formats: Card_X.png (with underscore) and Card X.png (with space)
-            card_path_underscore = os.path.join("Cards", f"Card_{base_id}.png")
-            card_path_space = os.path.join("Cards", f"Card {base_id}.png")
-            
-            card_path = None
-            if os.path.exists(card_path_underscore):
-                card_path = card_path_underscore
-            elif os.path.exists(card_path_space):
-                card_path = card_path_space
-            
-            if card_path:
-                try:
-                    card_img = pygame.image.load(card_path).convert_alpha()
-                    # Store original
-                    self.card_images_original[card_id] = card_img
-                    # Pre-scale card for bottom area (larger)
-                    self.card_images_bottom[card_id] = pygame.transform.smoothscale(card_img, self.card_size_bottom).convert_alpha()
-                    # Pre-scale card for market area (smaller) - this prevents scaling on every frame
-                    self.card_images_market[card_id] = pygame.transform.smoothscale(card_img, self.card_size_market).convert_alpha()
-                    # Pre-scale for right-side (6-slot) area
-                    self.card_images_side[card_id] = pygame.transform.smoothscale(card_img, self.card_size_side).convert_alpha()
-                    print(f"Loaded card {card_id} (base: {base_id}) from {card_path}")
-                except Exception as e:
-                    print(f"ERROR loading card {card_id} (base: {base_id}): {e}")
-                    self.card_images_original[card_id] = None
-                    self.card_images_bottom[card_id] = None
-                    self.card_images_market[card_id] = None
-                    self.card_images_side[card_id] = None
-            else:
-                print(f"WARNING: Card file not found for card {card_id} (base: {base_id}). Tried: {card_path_underscore} and {card_path_space}")
-                self.card_images_original[card_id] = None
-                self.card_images_bottom[card_id] = None
-                self.card_images_market[card_id] = None
-                self.card_images_side[card_id] = None
-        
-        # Initialize CardAction system: dictionary mapping card_id to CardAction value
-        # Cards 11, 12: CardAction = 2
-        # Cards 13, 14: CardAction = 4
-        # Cards 15, 16: CardAction = -2
-        # Cards 17, 18: CardAction = 2
-        self.card_actions = {}
-        self.card_actions[11] = 2
-        self.card_actions[12] = 2
-        self.card_actions[13] = 4
-        self.card_actions[14] = 4
-        self.card_actions[15] = -2
-        self.card_actions[16] = -2
-        self.card_actions[17] = 2
-        self.card_actions[18] = 2
-        
-        # Initialize CardTurns system: dictionary mapping card_id to CardTurns value
-        # Cards 11, 13: CardTurns = 1
-        # Cards 12, 14: CardTurns = 2
-        # Card 15: CardTurns = 1
-        # Card 16: CardTurns = 2
-        # Card 17: CardTurns = 1
-        # Card 18: CardTurns = 2
-        self.card_turns = {}
-        self.card_turns[11] = 1
-        self.card_turns[13] = 1
-        self.card_turns[12] = 2
-        self.card_turns[14] = 2
-        self.card_turns[15] = 1
-        self.card_turns[16] = 2
-        self.card_turns[17] = 1
-        self.card_turns[18] = 2
-        
         # Initialize deck based on level
         self.deck = self._get_initial_deck(self.level_number)
         # Safety net: if something still produced card 0 (old save, legacy rewards), map it to 100
@@ -2546,17 +2623,13 @@ class GameplayPage:
         for idx, card_id in enumerate(forced_cards):
             self.hand_cards[idx] = card_id
 
-        # Fill the rest of the hand from the shuffled deck
+        # Fill the rest of the hand from the shuffled deck. Dealt cards stay in the list;
+        # the cursor marks the next card to draw (card 0 was already mapped to 100 above)
+        self.deck_cursor = 0
         fill_idx = len(forced_cards)
-        draw_count = max(0, self.hand - fill_idx)
-        drawn = self.deck[:draw_count] if draw_count > 0 else []
-        for offset, card_id in enumerate(drawn):
-            slot_idx = fill_idx + offset
-            if slot_idx < self.hand:
-                self.hand_cards[slot_idx] = 100 if card_id == 0 else card_id
-
-        # Remove dealt cards from deck
-        self.deck = self.deck[draw_count:] if len(self.deck) > draw_count else []
+        draw_count = min(max(0, self.hand - fill_idx), self._deck_remaining())
+        for slot_idx in range(fill_idx, fill_idx + draw_count):
+            self.hand_cards[slot_idx] = self._draw_from_deck()
         
         # Drag and drop state
         self.dragged_card_index = None  # Index of card being dragged, or None
@@ -2571,39 +2644,52 @@ class GameplayPage:
         self.pending_draws = 0  # Cards to draw after end-turn animations finish
         
         # Market placeholders positions (for drop detection)
-        self.market_placeholders = []  # Will be populated in draw method: [{'market': 0-2, 'slot': 0-2, 'rect': Rect}]
+        self.market_placeholders = []  # Populated on the first draw: [{'market': 0-2, 'slot': 0-2, 'rect': Rect}]
+        # Bounding boxes of all market / hand placeholders, to reject drops outside them in one test
+        self._market_bbox = None
+        self._bottom_bbox = None
         # Bottom hand placeholders positions
-        self.bottom_placeholders = []  # Populated in draw: [{'slot': int, 'rect': Rect}]
-        
-        # Cards placed on market placeholders: {market: {slot: card_id}}
-        self.market_cards = {0: {}, 1: {}, 2: {}}  # Store cards on market placeholders
-        # Original hand slot for each card on market: {market: {slot: hand_index}}
-        self.market_card_origins = {0: {}, 1: {}, 2: {}}
-        # Locked state for market cards after end turn: {market: {slot: bool}}
-        self.market_cards_locked = {0: {}, 1: {}, 2: {}}
-        # CardTurns tracking for cards on market: {market: {slot: turns_remaining}}
-        self.market_card_turns = {0: {}, 1: {}, 2: {}}
-
-        # Card jump animation state for cards 11-18: {market: {slot: {'offset_y': float, 'velocity': float, 'start_time': int}}}
-        self.card_jump_animations = {0: {}, 1: {}, 2: {}}
+        self.bottom_placeholders = []  # [{'slot': int, 'rect': Rect}], built by _recompute_hand_slot_rects
+        # Hand slot click rects, fixed until self.hand changes
+        self.hand_slot_positions = []  # [(slot_x, slot_y)]
+        self.hand_slot_rects = []  # [Rect]
+        self._recompute_hand_slot_rects()
+        
+        # Cards placed on market placeholders: [market][slot] -> card_id or None
+        self.market_cards = [[None] * 3 for _ in range(3)]  # Store cards on market placeholders
+        # Per market: first empty slot and last occupied slot (None if full / empty).
+        # Kept in sync by _set_market_card / _clear_market_card.
+        self.market_first_free = [0, 0, 0]
+        self.market_last_occupied = [None, None, None]
+        # Original hand slot for each card on market: [market][slot] -> hand_index or None
+        self.market_card_origins = [[None] * 3 for _ in range(3)]
+        # Locked state for market cards after end turn: [market][slot] -> bool
+        self.market_cards_locked = [[False] * 3 for _ in range(3)]
+        # CardTurns tracking for cards on market: [market][slot] -> turns_remaining or None
+        self.market_card_turns = [[None] * 3 for _ in range(3)]
+
+        # Card jump animation state for cards 11-18: [market][slot] -> {'offset_y': float, 'velocity': float, 'start_time': int} or None
+        self.card_jump_animations = [[None] * 3 for _ in range(3)]
         
         # Queue for processing cards 11-18 sequentially: list of (market, slot) tuples
-        self.cards_11_14_queue = []
+        self.cards_11_14_queue = collections.deque()
         self.current_card_processing = None  # (market, slot) currently being processed
         self.card_processing_start_time = 0
         self.card_processing_delay = 300  # ms delay between processing each card
 
         # Hand compaction animation state (after end turn)
-        self.hand_compact_anim = []  # [{'card_id', 'from_index', 'to_index', 'from_pos', 'to_pos', 'progress'}]
+        self.hand_compact_anim = []  # [{'card_id', 'from_index', 'to_index', 'from_pos', 'to_pos'}]
         self.hand_compact_target_hand = None  # final hand_cards order after compaction
         self.hand_compact_draw_count = 0  # how many cards to draw after compaction
         self.hand_compact_start_time = 0
         self.hand_compact_duration = 300  # ms
+        self.hand_compact_progress = 0.0  # 0..1, shared by all moves
         
         # Hand draw animation state (cards flying in from bottom of screen)
-        self.hand_draw_anim = []  # [{'card_id', 'target_slot', 'target_pos', 'from_pos', 'progress'}]
+        self.hand_draw_anim = []  # [{'card_id', 'target_slot', 'target_pos', 'from_pos'}]
         self.hand_draw_start_time = 0
         self.hand_draw_duration = 400  # ms
+        self.hand_draw_progress = 0.0  # 0..1, shared by all drawn cards
         
         # Win/Lose state
         self.win_lose_state = None  # None, "win", or "lose"
@@ -2611,12 +2697,12 @@ class GameplayPage:
         
         # Load WinLose.png
         winlose_path = os.path.join("GameplayPage", "WinLose.png")
-        if os.path.exists(winlose_path):
+        if asset_exists(winlose_path):
             winlose_original = pygame.image.load(winlose_path).convert_alpha()
             # Scale to 1/3 of screen size (3 times smaller)
             winlose_width = SCREEN_WIDTH // 3
             winlose_height = SCREEN_HEIGHT // 3
-            self.win_lose_image = pygame.transform.smoothscale(winlose_original, (winlose_width, winlose_height)).convert_alpha()
+            self.win_lose_image = pygame.transform.smoothscale(winlose_original, (winlose_width, winlose_height))
             # Calculate centered position
             self.win_lose_x = (SCREEN_WIDTH - winlose_width) // 2
             # Use float positions + dt-based movement for smooth sliding
@@ -2635,13 +2721,13 @@ class GameplayPage:
         
         # Load Ok1.png button (for win)
         ok1_path = os.path.join("GameplayPage", "Ok1.png")
-        if os.path.exists(ok1_path):
+        if asset_exists(ok1_path):
             ok1_original = pygame.image.load(ok1_path).convert_alpha()
             # Scale button larger - make it more visible
             ok_scale = 1.0  # Full size or larger
-            w, h = ok1_original.get_width(), ok1_original.get_height()
+            w, h = ok1_original.get_size()
             ok_size = (int(w * ok_scale), int(h * ok_scale))
-            self.ok1_button = pygame.transform.smoothscale(ok1_original, ok_size).convert_alpha()
+            self.ok1_button = pygame.transform.smoothscale(ok1_original, ok_size)
             self.ok_button_base_size = ok_size
         else:
             print("WARNING: Ok1.png not found:", ok1_path)
@@ -2649,13 +2735,13 @@ class GameplayPage:
         
         # Load Ok2.png button (for lose)
         ok2_path = os.path.join("GameplayPage", "Ok2.png")
-        if os.path.exists(ok2_path):
+        if asset_exists(ok2_path):
             ok2_original = pygame.image.load(ok2_path).convert_alpha()
             # Scale button larger - make it more visible
             ok_scale = 1.0  # Full size or larger
-            w, h = ok2_original.get_width(), ok2_original.get_height()
+            w, h = ok2_original.get_size()
             ok_size = (int(w * ok_scale), int(h * ok_scale))
-            self.ok2_button = pygame.transform.smoothscale(ok2_original, ok_size).convert_alpha()
+            self.ok2_button = pygame.transform.smoothscale(ok2_original, ok_size)
             # Use same size for both buttons
             if not hasattr(self, 'ok_button_base_size'):
                 self.ok_button_base_size = ok_size
@@ -2678,6 +2764,36 @@ class GameplayPage:
         # Cache for WinLose window reward card images
         self.winlose_card_images = {}
     
+    @classmethod
+    def for_round(cls, screen, font_path, difficulty, goal, level_number, boss_index, round_num, defeated_count=0, clock=None):
+        """Regular E/M/H round played on the way to a boss"""
+        return cls(
+            screen,
+            font_path,
+            difficulty,
+            goal=goal,
+            level_number=level_number,
+            boss_index=boss_index,
+            round_num=round_num,
+            defeated_count=defeated_count,
+            clock=clock,
+        )
+    
+    @classmethod
+    def for_boss(cls, screen, font_path, goal, level_number, boss_index, defeated_count=0, clock=None):
+        """Boss fight (always uses the "e" layout; defeated_count decides if it is the final boss)"""
+        return cls(
+            screen,
+            font_path,
+            "e",
+            goal=goal,
+            level_number=level_number,
+            is_boss_fight=True,
+            boss_index=boss_index,
+            defeated_count=defeated_count,
+            clock=clock,
+        )
+    
     def _load_winlose_card(self, card_number):
         """Load and cache a reward card image for WinLose window. For cards 11-18, uses base card and draws CardAction/CardTurns."""
         # Safety net: legacy configs may still reference card 0
@@ -2692,41 +2808,31 @@ class GameplayPage:
         market_card_ratio = 99 / 171.0
         target_height = int(target_width / market_card_ratio)
         
-        # Get base card ID
-        if card_number in (1, 2, 3, 4, 100):
-            # Base cards use their own images
-            base_card_id = card_number
-        elif card_number in [11, 12, 13, 14]:
-            base_card_id = 11
-        elif card_number in [15, 16]:
-            base_card_id = 15
-        elif card_number in [17, 18]:
-            base_card_id = 17
-        else:
-            base_card_id = card_number
+        # Get base card ID (11-18 share a base image)
+        base_card_id = CARD_BASE_IDS.get(card_number, card_number)
         
-        card_path = os.path.join("Cards", f"Card_{base_card_id}.png")
-        if not os.path.exists(card_path):
-            print(f"WARNING: WinLose card base not found: {card_path}")
+        card_path = card_image_path(base_card_id)
+        if not card_path:
+            print(f"WARNING: WinLose card base not found: Card_{base_card_id}.png")
             self.winlose_card_images[card_number] = None
             return None
         
-        # Load base card image
-        card_image = pygame.image.load(card_path).convert_alpha()
+        # Load base card image (cached original; the scaled copy is drawn on, so it stays private)
+        card_image = load_image(card_path)
         
         # Scale to final WinLose size
-        card_surface = pygame.transform.smoothscale(card_image, (target_width, target_height)).convert_alpha()
+        card_surface = pygame.transform.smoothscale(card_image, (target_width, target_height))
         
         # Draw CardAction and CardTurns if this card has them
-        if card_number in self.card_actions or card_number in self.card_turns:
+        if card_number in CARD_ACTIONS or card_number in CARD_TURNS:
             # Draw CardAction
-            if card_number in self.card_actions:
-                action_value = self.card_actions[card_number]
+            if card_number in CARD_ACTIONS:
+                action_value = CARD_ACTIONS[card_number]
                 self._draw_winlose_card_action(card_surface, action_value, card_number, target_width, target_height)
             
             # Draw CardTurns
-            if card_number in self.card_turns:
-                turns_value = self.card_turns[card_number]
+            if card_number in CARD_TURNS:
+                turns_value = CARD_TURNS[card_number]
                 self._draw_winlose_card_turns(card_surface, turns_value, card_number, target_width, target_height)
         
         self.winlose_card_images[card_number] = card_surface
@@ -2741,14 +2847,8 @@ class GameplayPage:
         if scaled_font_size < 1:
             scaled_font_size = 1
         
-        gadugib_path = "Gadugib.ttf"
-        if os.path.exists(gadugib_path):
-            font_path_use = gadugib_path
-        else:
-            font_path_use = self.font_path
-        
         try:
-            font = pygame.font.Font(font_path_use, scaled_font_size)
+            font = get_font(self.card_font_base, scaled_font_size)
             action_text = font.render(str(action_value), True, PAPER_COLOR)
             
             plus_x = card_width - 25 * scale_factor
@@ -2773,14 +2873,8 @@ class GameplayPage:
         if turns_font_size < 1:
             turns_font_size = 1
         
-        gadugib_path = "Gadugib.ttf"
-        if os.path.exists(gadugib_path):
-            font_path_use = gadugib_path
-        else:
-            font_path_use = self.font_path
-        
         try:
-            font = pygame.font.Font(font_path_use, turns_font_size)
+            font = get_font(self.card_font_base, turns_font_size)
             turns_text = font.render(str(turns_value), True, PAPER_COLOR)
             
             base_bottom_height = 244.0
@@ -2791,7 +2885,7 @@ class GameplayPage:
             turns_x = card_center_x + 10 * scale_factor
             turns_y = card_height - offset_from_bottom
             
-            if card_id in (17, 18):
+            if card_id in CARD_MULTIPLIER_IDS:
                 base_market_width_for_adjust = 99.0
                 base_market_height_for_adjust = 171.0
                 x_scale = card_width / base_market_width_for_adjust if base_market_width_for_adjust else 1.0
@@ -2822,13 +2916,48 @@ class GameplayPage:
         earned_cards = earned_reward_cards.get(level_number, [])
         if earned_cards:
             base_deck.extend(earned_cards)
-            print(f"Added {len(earned_cards)} earned reward card(s) to level {level_number} deck: {earned_cards}")
+            if DEBUG:
+                print(f"Added {len(earned_cards)} earned reward card(s) to level {level_number} deck: {earned_cards}")
 
         # Safety net: old saves/configs may still reference card 0; map it to 100.
         base_deck = [100 if c == 0 else c for c in base_deck]
         
         return base_deck
 
+    def _card_image(self, card_id, size):
+        """Card face for card_id scaled to size, loaded on first use (None if the file is missing).
+
+        Aliased cards (CARD_BASE_IDS, e.g. 12-14 -> Card_11) share their base's surfaces.
+        """
+        key = (card_id, size)
+        if key in self._card_images:
+            return self._card_images[key]
+        image = None
+        if card_id is not None:
+            base_id = CARD_BASE_IDS.get(card_id, card_id)
+            card_path = card_image_path(base_id)
+            if card_path:
+                # Market/side variants are scaled from the (largest) bottom-size copy
+                source_size = None if size == self.card_size_bottom else self.card_size_bottom
+                try:
+                    image = load_image(card_path, size, source_size=source_size)
+                except Exception as e:
+                    print(f"ERROR loading card base {base_id}: {e}")
+            else:
+                print(f"WARNING: Card file not found for card base {base_id} (Card_{base_id}.png / Card {base_id}.png)")
+        self._card_images[key] = image
+        return image
+
+    def _deck_remaining(self):
+        """Number of cards left to draw from the deck."""
+        return len(self.deck) - self.deck_cursor
+
+    def _draw_from_deck(self):
+        """Return the top card of the deck and advance the cursor (no list copy or shift)."""
+        card_id = self.deck[self.deck_cursor]
+        self.deck_cursor += 1
+        return card_id
+
     def get_card_type(self, card_id):
         """Return card Type from Cards.csv (defaults to 1)."""
         if card_id is None:
@@ -2837,6 +2966,195 @@ class GameplayPage:
             return int(self.card_types.get(card_id, 1))
         except Exception:
             return 1
+
+    def _recompute_hand_slot_rects(self):
+        """Rebuild the hand placeholders, slot positions and click rects (call whenever self.hand changes)."""
+        self.bottom_placeholders = []
+        self.hand_slot_positions = []
+        self.hand_slot_rects = []
+        self._bottom_bbox = None
+        if not self.bottom_frame or self.hand <= 0:
+            return
+        # Same spacing pattern as the hand placeholders in draw
+        bf_w, bf_h = self.bottom_frame_size
+        bf_x = (SCREEN_WIDTH - bf_w) // 2 - 200
+        bf_y = SCREEN_HEIGHT - bf_h - 150
+
+        ph_w = 138  # Bottom placeholder width (40% larger)
+        ph_h = 240  # Bottom placeholder height (40% larger)
+        base_spacing = (bf_w - ph_w * self.hand) / (self.hand + 1)
+        spacing = base_spacing * 0.7
+        total_width = ph_w * self.hand + spacing * (self.hand - 1)
+        start_x = bf_x + (bf_w - total_width) / 2
+        # Slightly lower hand area so cards don't overlap the top edge of the bottom frame
+        start_y = bf_y + (bf_h - ph_h) // 2 + 10
+
+        for i in range(self.hand):
+            slot_x = start_x + i * (ph_w + spacing)
+            slot_y = start_y
+            ph_rect = pygame.Rect(slot_x, slot_y, ph_w, ph_h)
+            self.bottom_placeholders.append({'slot': i, 'rect': ph_rect})
+            self.hand_slot_positions.append((slot_x, slot_y))
+            # Cards are 4px larger than the placeholder and centered on it
+            self.hand_slot_rects.append(ph_rect.inflate(4, 4))
+        self._bottom_bbox = self.bottom_placeholders[0]['rect'].unionall(
+            [ph['rect'] for ph in self.bottom_placeholders[1:]]
+        )
+
+    def _click_hand(self, mouse_pos):
+        """Start dragging the hand card under mouse_pos. Returns True if one was picked up."""
+        hand_cards = self.hand_cards
+        # Slot rects are cached by _recompute_hand_slot_rects
+        for i, card_rect in enumerate(self.hand_slot_rects):
+            if i >= len(hand_cards) or hand_cards[i] is None:
+                continue
+            if card_rect.collidepoint(mouse_pos):
+                slot_x, slot_y = self.hand_slot_positions[i]
+                self.dragged_card_index = i
+                self.drag_offset = (mouse_pos[0] - slot_x, mouse_pos[1] - slot_y)
+                self.dragged_card_pos = mouse_pos
+                self.dragged_card_source = "hand"
+                return True
+        return False
+
+    def _click_market(self, mouse_pos):
+        """Start dragging the last unlocked market card under mouse_pos. Returns True if picked up."""
+        market_cards = self.market_cards
+        market_cards_locked = self.market_cards_locked
+        market_last_occupied = self.market_last_occupied
+        for ph_info in self.market_placeholders:
+            market = ph_info["market"]
+            slot = ph_info["slot"]
+            if market_cards[market][slot] is None:
+                continue
+            # Skip cards, которые уже заблокированы после конца хода
+            if market_cards_locked[market][slot]:
+                continue
+            # Only allow dragging the last (rightmost) card in this market
+            if slot != market_last_occupied[market]:
+                continue
+            rect = ph_info["rect"]
+            if rect.collidepoint(mouse_pos):
+                self.dragged_card_index = None  # not used for market
+                self.dragged_card_source = "market"
+                self.dragged_card_market = market
+                self.dragged_card_market_slot = slot
+                self.drag_offset = (mouse_pos[0] - rect.x, mouse_pos[1] - rect.y)
+                self.dragged_card_pos = mouse_pos
+                return True
+        return False
+
+    def _click_side_top(self, mouse_pos):
+        """Start dragging the latest right-side TOP card (Type=2). Returns True if picked up."""
+        if self.dragged_card_source is not None:
+            return False
+        # Only allow dragging the last (rightmost / latest) side card, and only if not locked
+        side_cards_top = self.side_cards_top
+        occupied = [i for i, cid in enumerate(side_cards_top) if cid is not None]
+        if not occupied:
+            return False
+        last_slot = occupied[-1]
+        if self.side_cards_locked_top.get(last_slot):
+            return False
+        for ph_info in self.side_placeholders_top:
+            if ph_info.get("slot") != last_slot:
+                continue
+            rect = ph_info["rect"]
+            if rect.collidepoint(mouse_pos):
+                self.dragged_card_source = "side_top"
+                self.dragged_card_side_slot = last_slot
+                self.drag_offset = (mouse_pos[0] - rect.x, mouse_pos[1] - rect.y)
+                self.dragged_card_pos = mouse_pos
+                return True
+        return False
+
+    def _click_arrow(self, mouse_pos, now):
+        """Trade and animate the buy/sell arrow under mouse_pos. Returns True if one was hit."""
+        for entry in self.arrow_entries:
+            if not entry["rect"].collidepoint(mouse_pos):
+                continue
+
+            frame_idx = entry.get("frame_index")
+            if frame_idx is None:
+                continue
+
+            # Buy/sell in the market this arrow belongs to
+            self._arrow_trades[entry["arrow_type"]](frame_idx)
+
+            # Start animation (if entry has frames)
+            if entry.get("frames"):
+                entry["animating"] = True
+                entry["idx"] = 0
+                entry["start"] = now
+                if self.arrow_sound:
+                    self.arrow_sound.play()
+            return True
+        return False
+
+    def _click_end_turn(self, mouse_pos, now):
+        """End the turn if the End Turn button is under mouse_pos. Returns True if it was clicked."""
+        if not (self.end_button_rect and self.end_button_rect.collidepoint(mouse_pos)):
+            return False
+        # Don't allow EndTurn if price animation is in progress
+        if self.current_price_animation is not None:
+            return True
+
+        # Play sound
+        if self.arrow_sound:
+            self.arrow_sound.play()
+        # Calculate price changes based on probability distributions
+        animation_queue = self.update_stock_prices()
+        # Lock all currently played market cards for future turns
+        self._lock_market_cards()
+        # Lock all currently played side (Type=2) cards for future turns
+        self._lock_side_cards()
+        # Queue animations for markets
+        if animation_queue:
+            self.price_animation_queue = collections.deque(animation_queue)
+            # Start first animation if queue is not empty
+            if self.price_animation_queue:
+                next_anim = self.price_animation_queue.popleft()
+                # Apply price change when animation starts
+                self._apply_price_change(next_anim['market'], next_anim['price_change'])
+                self.current_price_animation = {
+                    'market': next_anim['market'],
+                    'type': next_anim['type'],
+                    'frame_idx': 0,
+                    'last_update': now
+                }
+                # Play sound for first animation
+                if self.typewriter_sound:
+                    self.typewriter_sound.play()
+        else:
+            # No animations needed, increment day immediately
+            # CRITICAL: Check win/lose conditions BEFORE changing day
+            # If Day == LastTurn, game MUST end here
+            self._check_win_lose()
+
+            # If game ended, stop here - don't change day
+            if self.win_lose_state is not None:
+                # Game ended, don't do anything else
+                pass
+            elif self.Day < self.LastTurn:
+                # Game continues, increment day
+                self.Day += 1
+                # Check again after increment (in case we won on this turn)
+                self._check_win_lose()
+            else:
+                # Day == LastTurn but game didn't end - FORCE END
+                print(f"ERROR: Day==LastTurn but game didn't end! Forcing end.")
+                if self.Money >= self.Goal:
+                    self.win_lose_state = "win"
+                else:
+                    self.win_lose_state = "lose"
+                    # Reset earned cards for this level when player loses
+                    self._reset_earned_cards_for_level()
+                if self.win_lose_image:
+                    winlose_height = self.win_lose_image.get_height()
+                    self.win_lose_y = float(-winlose_height)
+            # Draw cards that were delayed until animations finished
+            self._draw_pending_cards()
+        return True
     
     def handle_input(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -2871,19 +3189,23 @@ class GameplayPage:
                         if event.button == 1:  # Left click
                             # Check if click is on Ok button
                             if self.ok_button_rect.collidepoint(event.pos):
-                                print(f"Ok button clicked! State: {self.win_lose_state}, Button: {'Ok1' if self.win_lose_state == 'win' else 'Ok2'}")
+                                if DEBUG:
+                                    print(f"Ok button clicked! State: {self.win_lose_state}, Button: {'Ok1' if self.win_lose_state == 'win' else 'Ok2'}")
                                 if self.win_lose_state == "lose":
                                     # Lost: return to level selection screen
-                                    print("Returning to level_select")
+                                    if DEBUG:
+                                        print("Returning to level_select")
                                     return "level_select"
                                 elif self.win_lose_state == "win":
                                     # Won: return to round selection (boss victory handling is done in main loop)
                                     # The main loop will check if it's a boss fight and handle level 1 boss defeat
-                                    print("Returning to round_select")
+                                    if DEBUG:
+                                        print("Returning to round_select")
                                     return "round_select"
                             else:
                                 # Debug: print click position and button rect
-                                print(f"WinLose screen active. Click at: {event.pos}, Ok button rect: {self.ok_button_rect if hasattr(self, 'ok_button_rect') else 'None'}, win_lose_y: {self.win_lose_y}, State: {self.win_lose_state}")
+                                if DEBUG:
+                                    print(f"WinLose screen active. Click at: {event.pos}, Ok button rect: {self.ok_button_rect if hasattr(self, 'ok_button_rect') else 'None'}, win_lose_y: {self.win_lose_y}, State: {self.win_lose_state}")
                     
                     # Skip other events when WinLose screen is shown (but allow QUIT and MOUSEBUTTONDOWN which are handled above)
                     if event.type != pygame.QUIT and event.type != pygame.MOUSEBUTTONDOWN:
@@ -2896,267 +3218,20 @@ class GameplayPage:
             # Handle drag and drop
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    # Check if clicking on a card in hand (only if not already dragging)
-                    if self.dragged_card_index is None:
-                        # Calculate hand card positions (same spacing pattern as market placeholders, но плотнее)
-                        if self.bottom_frame and self.hand > 0:
-                            bf_w = self.bottom_frame.get_width()
-                            bf_h = self.bottom_frame.get_height()
-                            bf_x = (SCREEN_WIDTH - bf_w) // 2 - 200
-                            bf_y = SCREEN_HEIGHT - bf_h - 150
-                            
-                            ph_w = 138  # Bottom placeholder width (40% larger)
-                            ph_h = 240  # Bottom placeholder height (40% larger)
-                            # Equal spacing, но немного уплотнённые (меньше промежутков)
-                            base_spacing = (bf_w - ph_w * self.hand) / (self.hand + 1)
-                            spacing = base_spacing * 0.7
-                            total_width = ph_w * self.hand + spacing * (self.hand - 1)
-                            start_x = bf_x + (bf_w - total_width) / 2
-                            # Slightly lower hand area so cards don't overlap the top edge of the bottom frame
-                            start_y = bf_y + (bf_h - ph_h) // 2 + 10
-                            
-                            # Check if clicking on a card
-                            for i in range(self.hand):
-                                if i >= len(self.hand_cards) or self.hand_cards[i] is None:
-                                    continue
-                                slot_x = start_x + i * (ph_w + spacing)
-                                slot_y = start_y
-                                card_rect = pygame.Rect(slot_x - 2, slot_y - 2, self.card_size_bottom[0], self.card_size_bottom[1])
-                                if card_rect.collidepoint(mouse_pos):
-                                    self.dragged_card_index = i
-                                    self.drag_offset = (mouse_pos[0] - slot_x, mouse_pos[1] - slot_y)
-                                    self.dragged_card_pos = mouse_pos
-                                    self.dragged_card_source = "hand"
-                                    break
-                    # Check if clicking a card on market placeholders (only if not already dragging)
-                    if self.dragged_card_index is None:
-                        for ph_info in self.market_placeholders:
-                            market = ph_info["market"]
-                            slot = ph_info["slot"]
-                            if slot in self.market_cards[market] and self.market_cards[market][slot] is not None:
-                                # Skip cards, которые уже заблокированы после конца хода
-                                if self.market_cards_locked[market].get(slot):
-                                    continue
-                                # Only allow dragging the last (rightmost) card in this market
-                                occupied_slots = [s for s, cid in self.market_cards[market].items() if cid is not None]
-                                if not occupied_slots:
-                                    continue
-                                last_slot = max(occupied_slots)
-                                if slot != last_slot:
-                                    continue
-                                if ph_info["rect"].collidepoint(mouse_pos):
-                                    self.dragged_card_index = None  # not used for market
-                                    self.dragged_card_source = "market"
-                                    self.dragged_card_market = market
-                                    self.dragged_card_market_slot = slot
-                                    self.drag_offset = (mouse_pos[0] - ph_info["rect"].x, mouse_pos[1] - ph_info["rect"].y)
-                                    self.dragged_card_pos = mouse_pos
-                                    break
-
-                    # Check if clicking a card on the right-side TOP panel (Type=2), only if not already dragging
-                    if self.dragged_card_index is None and self.dragged_card_source is None:
-                        # Only allow dragging the last (rightmost / latest) side card, and only if not locked
-                        occupied = [i for i, cid in enumerate(self.side_cards_top) if cid is not None]
-                        last_slot = max(occupied) if occupied else None
-                        if last_slot is not None:
-                            for ph_info in self.side_placeholders_top:
-                                slot = ph_info.get("slot")
-                                if slot is None or slot != last_slot:
-                                    continue
-                                if self.side_cards_top[slot] is None:
-                                    continue
-                                if self.side_cards_locked_top.get(slot):
-                                    continue
-                                if ph_info["rect"].collidepoint(mouse_pos):
-                                    self.dragged_card_source = "side_top"
-                                    self.dragged_card_side_slot = slot
-                                    self.drag_offset = (
-                                        mouse_pos[0] - ph_info["rect"].x,
-                                        mouse_pos[1] - ph_info["rect"].y,
-                                    )
-                                    self.dragged_card_pos = mouse_pos
-                                    break
-                    
-                    # Only process arrows/buttons if not dragging a card
-                    if self.dragged_card_index is None:
-                        mouse_pos = event.pos
-                        for entry in self.arrow_entries:
-                            if not entry["rect"].collidepoint(mouse_pos):
-                                continue
-                            
-                            frame_idx = entry.get("frame_index")
-                            if frame_idx is None:
-                                continue
-                            
-                            # Top arrow (arrow_type == 0) - Buy maximum shares with available money
-                            if entry.get("arrow_type") == 0:
-                                # Determine which market and get price
-                                price = None
-                                if frame_idx == 0:  # Market A
-                                    price = self.Aprice
-                                elif frame_idx == 1:  # Market B
-                                    price = self.BPrice
-                                elif frame_idx == 2:  # Market C
-                                    price = self.CPrice
-                                
-                                if price and price > 0:
-                                    # Calculate how many shares we can buy
-                                    shares_to_buy = self.Money // price
-                                    if shares_to_buy > 0:
-                                        # Calculate cost
-                                        cost = shares_to_buy * price
-                                        # Update money
-                                        self.Money -= cost
-                                        # Check win/lose conditions
-                                        self._check_win_lose()
-                                        # Update quantity in corresponding market
-                                        if frame_idx == 0:
-                                            self.Aquantity += shares_to_buy
-                                        elif frame_idx == 1:
-                                            self.Bquantity += shares_to_buy
-                                        elif frame_idx == 2:
-                                            self.Cquantity += shares_to_buy
-                            
-                            # Second arrow from top (arrow_type == 1) - Buy ONE share in THIS market
-                            elif entry.get("arrow_type") == 1:
-                                # Determine which market and get price
-                                price = None
-                                if frame_idx == 0:  # Market A
-                                    price = self.Aprice
-                                elif frame_idx == 1:  # Market B
-                                    price = self.BPrice
-                                elif frame_idx == 2:  # Market C
-                                    price = self.CPrice
-                                
-                                if price and price > 0 and self.Money >= price:
-                                    # Buy one share
-                                    self.Money -= price
-                                    # Check win/lose conditions
-                                    self._check_win_lose()
-                                    if frame_idx == 0:
-                                        self.Aquantity += 1
-                                    elif frame_idx == 1:
-                                        self.Bquantity += 1
-                                    elif frame_idx == 2:
-                                        self.Cquantity += 1
-                            
-                            # Third arrow from top (arrow_type == 2) - Sell ONE share from THIS market
-                            elif entry.get("arrow_type") == 2:
-                                # Determine which market and sell one share
-                                if frame_idx == 0:  # Market A
-                                    if self.Aquantity > 0:
-                                        self.Money += self.Aprice
-                                        self.Aquantity -= 1
-                                        # Check win/lose conditions
-                                        self._check_win_lose()
-                                elif frame_idx == 1:  # Market B
-                                    if self.Bquantity > 0:
-                                        self.Money += self.BPrice
-                                        self.Bquantity -= 1
-                                        # Check win/lose conditions
-                                        self._check_win_lose()
-                                elif frame_idx == 2:  # Market C
-                                    if self.Cquantity > 0:
-                                        self.Money += self.CPrice
-                                        self.Cquantity -= 1
-                                        # Check win/lose conditions
-                                        self._check_win_lose()
-                            
-                            # Bottom arrow (arrow_type == 3) - Sell all shares from THIS market only
-                            elif entry.get("arrow_type") == 3:
-                                # Determine which market and sell only its shares
-                                if frame_idx == 0:  # Market A
-                                    total_money = self.Aquantity * self.Aprice
-                                    self.Money += total_money
-                                    self.Aquantity = 0
-                                    # Check win/lose conditions
-                                    self._check_win_lose()
-                                elif frame_idx == 1:  # Market B
-                                    total_money = self.Bquantity * self.BPrice
-                                    self.Money += total_money
-                                    self.Bquantity = 0
-                                    # Check win/lose conditions
-                                    self._check_win_lose()
-                                elif frame_idx == 2:  # Market C
-                                    total_money = self.Cquantity * self.CPrice
-                                    self.Money += total_money
-                                    self.Cquantity = 0
-                                    # Check win/lose conditions
-                                    self._check_win_lose()
-                            
-                            # Start animation (if entry has frames)
-                            if entry.get("frames"):
-                                entry["animating"] = True
-                                entry["idx"] = 0
-                                entry["last"] = pygame.time.get_ticks()
-                                if self.arrow_sound:
-                                    self.arrow_sound.play()
-                            break
-                    
-                    # Check if End Turn button was clicked (outside arrow loop)
-                    if self.end_button_rect and self.end_button_rect.collidepoint(mouse_pos):
-                        # Don't allow EndTurn if price animation is in progress
-                        if self.current_price_animation is not None:
-                            break
-                        
-                        # Play sound
-                        if self.arrow_sound:
-                            self.arrow_sound.play()
-                        # Calculate price changes based on probability distributions
-                        animation_queue = self.update_stock_prices()
-                        # Lock all currently played market cards for future turns
-                        self._lock_market_cards()
-                        # Lock all currently played side (Type=2) cards for future turns
-                        self._lock_side_cards()
-                        # Queue animations for markets
-                        if animation_queue:
-                            self.price_animation_queue = animation_queue.copy()
-                            # Start first animation if queue is not empty
-                            if self.price_animation_queue:
-                                next_anim = self.price_animation_queue.pop(0)
-                                # Apply price change when animation starts
-                                self._apply_price_change(next_anim['market'], next_anim['price_change'])
-                                self.current_price_animation = {
-                                    'market': next_anim['market'],
-                                    'type': next_anim['type'],
-                                    'frame_idx': 0,
-                                    'last_update': pygame.time.get_ticks()
-                                }
-                                # Play sound for first animation
-                                if self.typewriter_sound:
-                                    self.typewriter_sound.play()
-                        else:
-                            # No animations needed, increment day immediately
-                            # CRITICAL: Check win/lose conditions BEFORE changing day
-                            # If Day == LastTurn, game MUST end here
-                            self._check_win_lose()
-                            
-                            # If game ended, stop here - don't change day
-                            if self.win_lose_state is not None:
-                                # Game ended, don't do anything else
-                                pass
-                            elif self.Day < self.LastTurn:
-                                # Game continues, increment day
-                                self.Day += 1
-                                # Check again after increment (in case we won on this turn)
-                                self._check_win_lose()
-                            else:
-                                # Day == LastTurn but game didn't end - FORCE END
-                                print(f"ERROR: Day==LastTurn but game didn't end! Forcing end.")
-                                if self.Money >= self.Goal:
-                                    self.win_lose_state = "win"
-                                else:
-                                    self.win_lose_state = "lose"
-                                    # Reset earned cards for this level when player loses
-                                    self._reset_earned_cards_for_level()
-                                if self.win_lose_image:
-                                    winlose_height = self.win_lose_image.get_height()
-                                    self.win_lose_y = float(-winlose_height)
-                            # Draw cards that were delayed until animations finished
-                            self._draw_pending_cards()
+                    # One timestamp for everything this click starts (arrow / price animations)
+                    now = pygame.time.get_ticks()
+                    # Pick up a card (hand, market, right-side top panel) or press an arrow
+                    if self.dragged_card_index is None and not (
+                        self._click_hand(mouse_pos)
+                        or self._click_market(mouse_pos)
+                        or self._click_side_top(mouse_pos)
+                    ):
+                        self._click_arrow(event.pos, now)
+                    if self._click_end_turn(mouse_pos, now):
                         break  # Exit event processing after button click
             
-            # MOUSEMOTION events are handled in run() loop for smoother updates
+            # MOUSEMOTION is blocked at the SDL queue (set_blocked(None) + set_allowed at the top);
+            # the dragged card follows pygame.mouse.get_pos() in run() instead
             
             if event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1 and (
@@ -3164,6 +3239,9 @@ class GameplayPage:
                     or self.dragged_card_source in ("market", "side_top")
                 ):
                     dropped = False
+                    # Drops outside every market / hand placeholder skip those loops entirely
+                    over_market = self._market_bbox is not None and self._market_bbox.collidepoint(event.pos)
+                    over_hand = self._bottom_bbox is not None and self._bottom_bbox.collidepoint(event.pos)
                     # Determine dragged hand card type (if dragging from hand)
                     dragged_hand_card_id = None
                     dragged_hand_card_type = 1
@@ -3181,7 +3259,7 @@ class GameplayPage:
                                 if ph_info.get("slot") == src_slot:
                                     dropped = True
                                 break
-                        if not dropped:
+                        if not dropped and over_hand:
                             # Only allow drop to the ORIGINAL hand slot of this card
                             for ph_info in self.bottom_placeholders:
                                 if not ph_info["rect"].collidepoint(event.pos):
@@ -3230,7 +3308,7 @@ class GameplayPage:
                                     break
 
                     # Try to drop card on market placeholder (only if NOT dragging a Type=2 card from hand)
-                    if not (
+                    if over_market and not (
                         self.dragged_card_source == "side_top"
                         or (self.dragged_card_source == "hand" and dragged_hand_card_type == 2)
                     ):
@@ -3245,30 +3323,26 @@ class GameplayPage:
                                     and market == self.dragged_card_market
                                     and slot == self.dragged_card_market_slot
                                 ):
-                                    if slot in self.market_cards[market] and self.market_cards[market][slot] is not None:
+                                    if self.market_cards[market][slot] is not None:
                                         continue
                                 # Moving from hand to market
                                 if self.dragged_card_source == "hand" and self.dragged_card_index is not None:
                                     # Only allow drop to the FIRST free placeholder of this market
                                     # (index of the first empty slot or None if market full)
-                                    first_free = None
-                                    for s in range(3):
-                                        if self.market_cards[market].get(s) is None:
-                                            first_free = s
-                                            break
+                                    first_free = self.market_first_free[market]
                                     if first_free is None or slot != first_free:
                                         continue
                                     if self.dragged_card_index < len(self.hand_cards):
                                         card_id = self.hand_cards[self.dragged_card_index]
                                         if card_id is not None:
-                                            self.market_cards[market][slot] = card_id
+                                            self._set_market_card(market, slot, card_id)
                                             # Remember original hand slot for this market card
                                             self.market_card_origins[market][slot] = self.dragged_card_index
                                             # Новая сыгранная карта пока НЕ заблокирована
                                             self.market_cards_locked[market][slot] = False
                                             # Initialize CardTurns for cards 11-18
-                                            if card_id in self.card_turns:
-                                                self.market_card_turns[market][slot] = self.card_turns[card_id]
+                                            if card_id in CARD_TURNS:
+                                                self.market_card_turns[market][slot] = CARD_TURNS[card_id]
                                             # Remove from hand slot
                                             self.hand_cards[self.dragged_card_index] = None
                                             # Mark pending draw for empty slot
@@ -3286,32 +3360,30 @@ class GameplayPage:
                                     # Only allow drop to FIRST free placeholder of other markets
                                     if market == src_market:
                                         continue
-                                    first_free = None
-                                    for s in range(3):
-                                        if self.market_cards[market].get(s) is None:
-                                            first_free = s
-                                            break
+                                    first_free = self.market_first_free[market]
                                     if first_free is None or slot != first_free:
                                         continue
-                                    card_id = self.market_cards[src_market].get(src_slot)
+                                    card_id = self.market_cards[src_market][src_slot]
                                     if card_id is not None:
-                                        self.market_cards[market][slot] = card_id
-                                        self.market_cards[src_market][src_slot] = None
+                                        self._set_market_card(market, slot, card_id)
+                                        self._clear_market_card(src_market, src_slot)
                                         # Move origin info along with the card
-                                        origin_slot = self.market_card_origins[src_market].pop(src_slot, None)
+                                        origin_slot = self.market_card_origins[src_market][src_slot]
+                                        self.market_card_origins[src_market][src_slot] = None
                                         if origin_slot is not None:
                                             self.market_card_origins[market][slot] = origin_slot
                                         # Переносим флаг заблокированности вместе с картой
-                                        locked_flag = self.market_cards_locked[src_market].pop(src_slot, False)
-                                        self.market_cards_locked[market][slot] = locked_flag
+                                        self.market_cards_locked[market][slot] = self.market_cards_locked[src_market][src_slot]
+                                        self.market_cards_locked[src_market][src_slot] = False
                                         # Move CardTurns along with the card
-                                        turns = self.market_card_turns[src_market].pop(src_slot, None)
+                                        turns = self.market_card_turns[src_market][src_slot]
+                                        self.market_card_turns[src_market][src_slot] = None
                                         if turns is not None:
                                             self.market_card_turns[market][slot] = turns
                                         dropped = True
                                         break
                     # Try to drop card on hand placeholder (return or move to another hand slot)
-                    if not dropped:
+                    if not dropped and over_hand:
                         for ph_info in self.bottom_placeholders:
                             if ph_info['rect'].collidepoint(event.pos):
                                 slot = ph_info['slot']
@@ -3330,18 +3402,18 @@ class GameplayPage:
                                     # Only allow drop to the ORIGINAL hand slot of this card
                                     src_market = self.dragged_card_market
                                     src_slot = self.dragged_card_market_slot
-                                    origin_slot = self.market_card_origins[src_market].get(src_slot)
+                                    origin_slot = self.market_card_origins[src_market][src_slot]
                                     if origin_slot is not None and slot == origin_slot and self.hand_cards[slot] is None:
-                                        card_id = self.market_cards[src_market].get(src_slot)
+                                        card_id = self.market_cards[src_market][src_slot]
                                         if card_id is not None:
                                             self.hand_cards[slot] = card_id
-                                            self.market_cards[src_market][src_slot] = None
+                                            self._clear_market_card(src_market, src_slot)
                                             # Clear origin mapping
-                                            self.market_card_origins[src_market].pop(src_slot, None)
+                                            self.market_card_origins[src_market][src_slot] = None
                                             # Слот на рынке освобождается и больше не заблокирован
-                                            self.market_cards_locked[src_market].pop(src_slot, None)
+                                            self.market_cards_locked[src_market][src_slot] = False
                                             # Clear CardTurns when card returns to hand
-                                            self.market_card_turns[src_market].pop(src_slot, None)
+                                            self.market_card_turns[src_market][src_slot] = None
                                             if self.pending_draws > 0:
                                                 self.pending_draws -= 1
                                             dropped = True
@@ -3372,7 +3444,8 @@ class GameplayPage:
                 if self.win_lose_image:
                     winlose_height = self.win_lose_image.get_height()
                     self.win_lose_y = float(-winlose_height)
-                print(f"WIN on LastTurn: Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
+                if DEBUG:
+                    print(f"WIN on LastTurn: Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
                 # Add reward card to deck
                 self._add_reward_card_to_deck()
             else:
@@ -3383,7 +3456,8 @@ class GameplayPage:
                 if self.win_lose_image:
                     winlose_height = self.win_lose_image.get_height()
                     self.win_lose_y = float(-winlose_height)
-                print(f"LOSE on LastTurn: Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
+                if DEBUG:
+                    print(f"LOSE on LastTurn: Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
             return
         
         # Check win condition for other days (can win early)
@@ -3394,7 +3468,8 @@ class GameplayPage:
             if self.win_lose_image:
                 winlose_height = self.win_lose_image.get_height()
                 self.win_lose_y = float(-winlose_height)
-            print(f"WIN (early): Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
+            if DEBUG:
+                print(f"WIN (early): Money={self.Money}, Goal={self.Goal}, Day={self.Day}, LastTurn={self.LastTurn}")
             # Add reward card to deck
             self._add_reward_card_to_deck()
             return
@@ -3412,15 +3487,17 @@ class GameplayPage:
                 reward_string = boss_entry.get("Reward") if isinstance(boss_entry, dict) else None
                 if reward_string:
                     apply_boss_reward(reward_string, self)
-                    print(f"Applied boss reward for boss {boss_number} (level {self.level_number}, index {self.boss_index}): {reward_string}")
-                else:
+                    if DEBUG:
+                        print(f"Applied boss reward for boss {boss_number} (level {self.level_number}, index {self.boss_index}): {reward_string}")
+                elif DEBUG:
                     print(f"No boss reward found for boss {boss_number} (level {self.level_number}, index {self.boss_index})")
             
             # IMPORTANT: After boss victory, reset earned cards for this level - deck returns to initial state
             # Only boss reward (like Dobor) is preserved, not the cards earned in rounds
             if self.level_number in earned_reward_cards:
                 earned_reward_cards[self.level_number] = []
-                print(f"Reset earned cards for level {self.level_number} after boss victory - deck returns to initial state")
+                if DEBUG:
+                    print(f"Reset earned cards for level {self.level_number} after boss victory - deck returns to initial state")
             
             return  # Boss rewards are applied, no card reward
         
@@ -3481,16 +3558,20 @@ class GameplayPage:
                             reward_card_number2 = 100
                         earned_reward_cards[self.level_number].append(reward_card_number2)
                         self.last_earned_cards.append(reward_card_number2)
-                        print(f"Earned reward cards {reward_card_number1} (from Reward1) and {reward_card_number2} (from Reward2) for level {self.level_number}, round {round_num}, button {button}")
+                        if DEBUG:
+                            print(f"Earned reward cards {reward_card_number1} (from Reward1) and {reward_card_number2} (from Reward2) for level {self.level_number}, round {round_num}, button {button}")
                     else:
-                        print(f"Earned reward card {reward_card_number1} (Reward2 skipped) for level {self.level_number}, round {round_num}, button {button}")
-                else:
+                        if DEBUG:
+                            print(f"Earned reward card {reward_card_number1} (Reward2 skipped) for level {self.level_number}, round {round_num}, button {button}")
+                elif DEBUG:
                     print(f"Earned reward card {reward_card_number1} (randomly selected from {reward1_list}) for level {self.level_number}, round {round_num}, button {button}")
                 
-                print(f"Earned cards for level {self.level_number}: {earned_reward_cards[self.level_number]}")
+                if DEBUG:
+                    print(f"Earned cards for level {self.level_number}: {earned_reward_cards[self.level_number]}")
             else:
-                print(f"No reward cards in Reward1 for level {self.level_number}, round {round_num}, button {button}")
-        else:
+                if DEBUG:
+                    print(f"No reward cards in Reward1 for level {self.level_number}, round {round_num}, button {button}")
+        elif DEBUG:
             print(f"No reward data found for level {self.level_number}, round {round_num}, button {button}")
     
     def _reset_earned_cards_for_level(self):
@@ -3498,23 +3579,25 @@ class GameplayPage:
         global earned_reward_cards, global_dobor, forced_start_hand_cards_by_level
         if self.level_number in earned_reward_cards:
             earned_reward_cards[self.level_number] = []
-            print(f"Reset earned cards for level {self.level_number} due to defeat")
+            if DEBUG:
+                print(f"Reset earned cards for level {self.level_number} due to defeat")
         # Reset forced starting-hand cards (e.g., RedCard boss reward) when player loses the level
         if self.level_number in forced_start_hand_cards_by_level:
             forced_start_hand_cards_by_level[self.level_number] = []
-            print(f"Reset forced starting-hand cards for level {self.level_number} due to defeat")
+            if DEBUG:
+                print(f"Reset forced starting-hand cards for level {self.level_number} due to defeat")
         # Reset Dobor to default value (1) when player loses
         global_dobor = 1
         self.Dobor = 1
-        print(f"Reset Dobor to 1 due to defeat")
+        if DEBUG:
+            print(f"Reset Dobor to 1 due to defeat")
     
-    def update_win_lose_animation(self):
+    def update_win_lose_animation(self, now):
         """Update WinLose screen slide animation"""
         if self.win_lose_state is None or not self.win_lose_image:
             return
 
         # dt-based slide from top (smooth regardless of FPS)
-        now = pygame.time.get_ticks()
         dt = (now - getattr(self, "_winlose_last_tick", now)) / 1000.0
         self._winlose_last_tick = now
         dt = _clamp_dt_seconds(dt)
@@ -3527,52 +3610,30 @@ class GameplayPage:
         Returns list of {'market': 0-2, 'type': 'unchanged'|'rise'|'fall', 'price_change': int} 
         Prices are NOT updated here - they will be updated when animation starts."""
         animation_queue = []
-        
-        # Stock A: 15% no change, 85% price increases
-        rand_a = random.random() * 100  # 0-100
-        if rand_a <= 15:
-            # Price stays the same - add to animation queue
-            animation_queue.append({'market': 0, 'type': 'unchanged', 'price_change': 0})
-        else:  # 85% - price increases
-            animation_queue.append({'market': 0, 'type': 'rise', 'price_change': self.StepA})
-        
-        # Stock B: 10% price decreases, 20% no change, 70% price increases
-        rand_b = random.random() * 100  # 0-100
-        if rand_b <= 10:
-            # Price decreases
-            animation_queue.append({'market': 1, 'type': 'fall', 'price_change': -self.StepB})
-        elif rand_b <= 30:  # 10-30 = 20%
-            # Price stays the same - add to animation queue
-            animation_queue.append({'market': 1, 'type': 'unchanged', 'price_change': 0})
-        else:  # 30-100 = 70% - price increases
-            animation_queue.append({'market': 1, 'type': 'rise', 'price_change': self.StepB})
-        
-        # Stock C: 30% price decreases, 20% no change, 50% price increases
-        rand_c = random.random() * 100  # 0-100
-        if rand_c <= 30:
-            # Price decreases
-            animation_queue.append({'market': 2, 'type': 'fall', 'price_change': -self.StepC})
-        elif rand_c <= 50:  # 30-50 = 20%
-            # Price stays the same - add to animation queue
-            animation_queue.append({'market': 2, 'type': 'unchanged', 'price_change': 0})
-        else:  # 50-100 = 50% - price increases
-            animation_queue.append({'market': 2, 'type': 'rise', 'price_change': self.StepC})
-        
+        for market, odds in enumerate(STOCK_PRICE_ODDS):
+            roll = random.random() * 100  # 0-100
+            # Last bound is 100, so the loop always breaks
+            for bound, anim_type, sign in odds:
+                if roll <= bound:
+                    break
+            animation_queue.append(
+                {'market': market, 'type': anim_type, 'price_change': sign * self.step[market]}
+            )
         return animation_queue
 
-    def update_arrow_animation(self):
+    def update_arrow_animation(self, now):
         if not self.arrow_entries or not self.arrow_anim_frames:
             return
-        now = pygame.time.get_ticks()
         for entry in self.arrow_entries:
             if not entry["animating"]:
                 continue
-            if now - entry["last"] >= self.arrow_anim_interval:
-                entry["last"] = now
-                entry["idx"] += 1
-                if entry["idx"] >= len(self.arrow_anim_sequence):
-                    entry["animating"] = False
-                    entry["idx"] = 0
+            # Step index follows directly from the time since the click
+            elapsed = now - entry["start"]
+            if elapsed >= ARROW_ANIM_TOTAL_MS:
+                entry["animating"] = False
+                entry["idx"] = 0
+            else:
+                entry["idx"] = elapsed // ARROW_ANIM_INTERVAL_MS
 
     def _finish_price_animations_and_advance_day(self):
         """Finalize price animations, card processing, and day progression."""
@@ -3598,19 +3659,19 @@ class GameplayPage:
 
         self._draw_pending_cards()
 
-    def update_price_animation(self):
+    def update_price_animation(self, now):
         """Update price animation - plays sequentially for each market"""
         if not self.current_price_animation:
             # Check if there are more animations in queue
             if self.price_animation_queue:
-                next_anim = self.price_animation_queue.pop(0)
+                next_anim = self.price_animation_queue.popleft()
                 # Apply price change when animation starts
                 self._apply_price_change(next_anim['market'], next_anim['price_change'])
                 self.current_price_animation = {
                     'market': next_anim['market'],
                     'type': next_anim['type'],
                     'frame_idx': 0,
-                    'last_update': pygame.time.get_ticks()
+                    'last_update': now
                 }
                 # Play sound for new animation
                 if self.typewriter_sound:
@@ -3630,14 +3691,14 @@ class GameplayPage:
         if not frames:
             # No frames available, skip to next animation
             if self.price_animation_queue:
-                next_anim = self.price_animation_queue.pop(0)
+                next_anim = self.price_animation_queue.popleft()
                 # Apply price change when animation starts
                 self._apply_price_change(next_anim['market'], next_anim['price_change'])
                 self.current_price_animation = {
                     'market': next_anim['market'],
                     'type': next_anim['type'],
                     'frame_idx': 0,
-                    'last_update': pygame.time.get_ticks()
+                    'last_update': now
                 }
                 if self.typewriter_sound:
                     self.typewriter_sound.play()
@@ -3645,8 +3706,7 @@ class GameplayPage:
                 self._finish_price_animations_and_advance_day()
             return
         
-        now = pygame.time.get_ticks()
-        if now - self.current_price_animation['last_update'] >= self.price_animation_interval:
+        if now - self.current_price_animation['last_update'] >= PRICE_ANIM_INTERVAL_MS:
             self.current_price_animation['last_update'] = now
             self.current_price_animation['frame_idx'] += 1
             
@@ -3654,7 +3714,7 @@ class GameplayPage:
             if self.current_price_animation['frame_idx'] >= len(frames):
                 # Animation completed, move to next in queue
                 if self.price_animation_queue:
-                    next_anim = self.price_animation_queue.pop(0)
+                    next_anim = self.price_animation_queue.popleft()
                     # Apply price change when animation starts
                     self._apply_price_change(next_anim['market'], next_anim['price_change'])
                     self.current_price_animation = {
@@ -3672,71 +3732,59 @@ class GameplayPage:
     def _process_cards_11_14(self):
         """Queue cards 11-18 for sequential processing after all price animations finish."""
         # Build queue of cards to process in order: market 0, 1, 2, and for each market slots 0, 1, 2
-        self.cards_11_14_queue = []
-        for market in (0, 1, 2):
-            for slot in (0, 1, 2):
-                card_id = self.market_cards[market].get(slot)
-                if card_id is None:
-                    continue
-                # Only process cards 11-18
-                if card_id not in (11, 12, 13, 14, 15, 16, 17, 18):
-                    continue
-                # Check CardTurns - only process if > 0
-                turns_remaining = self.market_card_turns[market].get(slot)
-                if turns_remaining is not None and turns_remaining > 0:
-                    self.cards_11_14_queue.append((market, slot))
+        self.cards_11_14_queue = collections.deque()
+        for market, slot in MARKET_SLOTS:
+            card_id = self.market_cards[market][slot]
+            if card_id is None:
+                continue
+            # Only process cards 11-18
+            if card_id not in CARD_PRICE_OPS:
+                continue
+            # Check CardTurns - only process if > 0
+            turns_remaining = self.market_card_turns[market][slot]
+            if turns_remaining is not None and turns_remaining > 0:
+                self.cards_11_14_queue.append((market, slot))
         
         # Start processing first card if queue is not empty
         if self.cards_11_14_queue:
-            self.current_card_processing = self.cards_11_14_queue.pop(0)
+            self.current_card_processing = self.cards_11_14_queue.popleft()
             self.card_processing_start_time = pygame.time.get_ticks()
     
-    def update_cards_11_14_processing(self):
+    def update_cards_11_14_processing(self, now):
         """Update sequential processing of cards 11-18. Process one card at a time with delay."""
         if self.current_card_processing is None:
             # Check if there are more cards in queue
             if self.cards_11_14_queue:
-                self.current_card_processing = self.cards_11_14_queue.pop(0)
-                self.card_processing_start_time = pygame.time.get_ticks()
+                self.current_card_processing = self.cards_11_14_queue.popleft()
+                self.card_processing_start_time = now
             return
         
-        now = pygame.time.get_ticks()
         if now - self.card_processing_start_time < self.card_processing_delay:
             # Still waiting for delay
             return
         
         # Process current card
         market, slot = self.current_card_processing
-        card_id = self.market_cards[market].get(slot)
+        card_id = self.market_cards[market][slot]
         
         if card_id is not None:
             # Check CardTurns again (in case it changed)
-            turns_remaining = self.market_card_turns[market].get(slot)
+            turns_remaining = self.market_card_turns[market][slot]
             if turns_remaining is not None and turns_remaining > 0:
                 # Apply CardAction to price
-                card_action = self.card_actions.get(card_id, 0)
+                is_multiplier, card_action = CARD_PRICE_OPS.get(card_id, (False, 0))
                 if card_action != 0:
                     # Cards 17 and 18 multiply price by CardAction, others add/subtract
-                    if card_id in (17, 18):
-                        if market == 0:  # Stock A
-                            self.Aprice = max(2, int(self.Aprice * card_action))
-                        elif market == 1:  # Stock B
-                            self.BPrice = max(2, int(self.BPrice * card_action))
-                        elif market == 2:  # Stock C
-                            self.CPrice = max(2, int(self.CPrice * card_action))
+                    if is_multiplier:
+                        self.price[market] = max(2, int(self.price[market] * card_action))
                     else:
-                        if market == 0:  # Stock A
-                            self.Aprice = max(2, self.Aprice + card_action)
-                        elif market == 1:  # Stock B
-                            self.BPrice = max(2, self.BPrice + card_action)
-                        elif market == 2:  # Stock C
-                            self.CPrice = max(2, self.CPrice + card_action)
+                        self.price[market] = max(2, self.price[market] + card_action)
                 
                 # Start jump animation for the card
                 self.card_jump_animations[market][slot] = {
                     'offset_y': 0.0,
                     'velocity': -15.0,  # Initial upward velocity
-                    'start_time': pygame.time.get_ticks()
+                    'start_time': now
                 }
                 
                 # Decrement CardTurns
@@ -3745,51 +3793,94 @@ class GameplayPage:
         # Move to next card
         self.current_card_processing = None
         if self.cards_11_14_queue:
-            self.current_card_processing = self.cards_11_14_queue.pop(0)
-            self.card_processing_start_time = pygame.time.get_ticks()
+            self.current_card_processing = self.cards_11_14_queue.popleft()
+            self.card_processing_start_time = now
     
     def update_card_jump_animations(self):
         """Update jump animations for cards 11-18. Simple physics: velocity decreases due to gravity."""
         gravity = 0.8
-        now = pygame.time.get_ticks()
-        
-        for market in (0, 1, 2):
-            slots_to_remove = []
-            for slot, anim in list(self.card_jump_animations[market].items()):
+
+        for market_anims in self.card_jump_animations:
+            for slot, anim in enumerate(market_anims):
+                if anim is None:
+                    continue
                 # Update velocity (apply gravity)
                 anim['velocity'] += gravity
                 # Update position
                 anim['offset_y'] += anim['velocity']
                 
-                # If card has landed (offset_y >= 0 and velocity > 0), remove animation
+                # If card has landed (offset_y >= 0 and velocity > 0), remove animation.
+                # Rows are fixed-size lists, so clearing a slot in place is safe while iterating.
                 if anim['offset_y'] >= 0 and anim['velocity'] > 0:
-                    slots_to_remove.append(slot)
+                    market_anims[slot] = None
                 # Clamp offset_y to prevent going too far down
-                if anim['offset_y'] > 0:
+                elif anim['offset_y'] > 0:
                     anim['offset_y'] = 0
-            
-            # Remove finished animations
-            for slot in slots_to_remove:
-                self.card_jump_animations[market].pop(slot, None)
     
+    def _buy_max_shares(self, market):
+        """Top arrow: buy as many shares of the market as the money allows."""
+        price = self.price[market]
+        shares_to_buy = self.Money // price
+        if shares_to_buy > 0:
+            self.Money -= shares_to_buy * price
+            self._check_win_lose()
+            self.quantity[market] += shares_to_buy
+
+    def _buy_one_share(self, market):
+        """Second arrow: buy one share of the market if affordable."""
+        price = self.price[market]
+        if self.Money >= price:
+            self.Money -= price
+            self._check_win_lose()
+            self.quantity[market] += 1
+
+    def _sell_one_share(self, market):
+        """Third arrow: sell one share of the market if any are held."""
+        if self.quantity[market] > 0:
+            self.Money += self.price[market]
+            self.quantity[market] -= 1
+            self._check_win_lose()
+
+    def _sell_all_shares(self, market):
+        """Bottom arrow: sell every share held in the market."""
+        self.Money += self.quantity[market] * self.price[market]
+        self.quantity[market] = 0
+        self._check_win_lose()
+
+    def _set_market_card(self, market, slot, card_id):
+        """Place card_id on a market slot and refresh that market's slot index."""
+        self.market_cards[market][slot] = card_id
+        self._refresh_market_slots(market)
+
+    def _clear_market_card(self, market, slot):
+        """Empty a market slot and refresh that market's slot index."""
+        self.market_cards[market][slot] = None
+        self._refresh_market_slots(market)
+
+    def _refresh_market_slots(self, market):
+        """Recompute market_first_free / market_last_occupied for one market (3 slots)."""
+        cards = self.market_cards[market]
+        first_free = None
+        last_occupied = None
+        for s in range(3):
+            if cards[s] is None:
+                if first_free is None:
+                    first_free = s
+            else:
+                last_occupied = s
+        self.market_first_free[market] = first_free
+        self.market_last_occupied[market] = last_occupied
+
     def _apply_price_change(self, market, price_change):
         """Apply price change to the specified market. Ensures price doesn't drop below 2."""
-        if market == 0:  # Stock A
-            new_price = self.Aprice + price_change
-            self.Aprice = max(2, new_price)  # Minimum price is 2
-        elif market == 1:  # Stock B
-            new_price = self.BPrice + price_change
-            self.BPrice = max(2, new_price)  # Minimum price is 2
-        elif market == 2:  # Stock C
-            new_price = self.CPrice + price_change
-            self.CPrice = max(2, new_price)  # Minimum price is 2
+        if market in (0, 1, 2):
+            self.price[market] = max(2, self.price[market] + price_change)  # Minimum price is 2
 
     def _lock_market_cards(self):
         """Помечает все текущие карты на рынке как сыгранные и заблокированные до конца игры."""
-        for market in (0, 1, 2):
-            for slot, card_id in list(self.market_cards[market].items()):
-                if card_id is not None:
-                    self.market_cards_locked[market][slot] = True
+        for market, slot in MARKET_SLOTS:
+            if self.market_cards[market][slot] is not None:
+                self.market_cards_locked[market][slot] = True
 
     def _lock_side_cards(self):
         """Lock all currently played Type=2 cards on the right-side TOP panel for future turns."""
@@ -3822,51 +3913,28 @@ class GameplayPage:
             # Добор без анимации — всегда добраем, если есть свободные слоты и карты в колоде
             start_idx = len(existing_cards)
             slots_available = self.hand - start_idx
-            if self.Dobor > 0 and self.deck and slots_available > 0:
-                draw_limit = min(self.Dobor, len(self.deck), slots_available)
+            if self.Dobor > 0 and self._deck_remaining() > 0 and slots_available > 0:
+                draw_limit = min(self.Dobor, self._deck_remaining(), slots_available)
                 for offset in range(draw_limit):
-                    card_id = self.deck.pop(0)
+                    card_id = self._draw_from_deck()
                     if card_id == 0:
                         card_id = 100
                     self.hand_cards[start_idx + offset] = card_id
                 self.pending_draws = 0
             return
 
-        # Геометрия нижней рамки и плейсхолдеров (как в draw)
-        bf_w = self.bottom_frame.get_width()
-        bf_h = self.bottom_frame.get_height()
-        bf_x = (SCREEN_WIDTH - bf_w) // 2 - 200
-        bf_y = SCREEN_HEIGHT - bf_h - 150
-
-        ph_w = 138
-        ph_h = 240
-        margin_x = 20
-        available_width = bf_w - margin_x * 2
-        if self.hand > 1:
-            spacing = max(5, (available_width - ph_w * self.hand) // (self.hand - 1))
-        else:
-            spacing = 0
-        total_width = ph_w * self.hand + spacing * (self.hand - 1)
-        start_x = bf_x + (bf_w - total_width) // 2
-        # Slightly lower hand area so cards don't overlap the top edge of the bottom frame
-        start_y = bf_y + (bf_h - ph_h) // 2 + 10
-
-        # Координаты слотов руки
-        slot_positions = []
-        for i in range(self.hand):
-            slot_x = start_x + i * (ph_w + spacing)
-            slot_y = start_y
-            slot_positions.append((slot_x, slot_y))
+        # Координаты слотов руки (те же, что в draw; кэшируются в _recompute_hand_slot_rects)
+        slot_positions = self.hand_slot_positions
 
         # 2) Текущее содержимое и целевой порядок (уплотнение влево)
         existing = [(idx, card) for idx, card in enumerate(self.hand_cards) if card is not None]
         if not existing:
             # В руке вообще нет карт — просто добираем без анимации - всегда добраем, если есть карты в колоде
-            if self.Dobor > 0 and len(self.deck) > 0 and self.hand > 0:
-                draw_limit = min(self.Dobor, len(self.deck), self.hand)
+            if self.Dobor > 0 and self._deck_remaining() > 0 and self.hand > 0:
+                draw_limit = min(self.Dobor, self._deck_remaining(), self.hand)
                 self.hand_cards = [None] * self.hand
                 for i in range(draw_limit):
-                    card_id = self.deck.pop(0)
+                    card_id = self._draw_from_deck()
                     if card_id == 0:
                         card_id = 100
                     self.hand_cards[i] = card_id
@@ -3893,19 +3961,18 @@ class GameplayPage:
                     "to_index": new_index,
                     "from_pos": from_pos,
                     "to_pos": to_pos,
-                    "progress": 0.0,
                 }
             )
 
         # 4) Считаем, сколько карт нужно добрать после компактации - всегда добраем, если есть свободные слоты и карты в колоде
         free_slots_after = self.hand - len(existing)
         max_draw_by_slots = free_slots_after
-        draw_limit = min(self.Dobor, len(self.deck), max_draw_by_slots) if free_slots_after > 0 and len(self.deck) > 0 else 0
+        draw_limit = min(self.Dobor, self._deck_remaining(), max_draw_by_slots) if free_slots_after > 0 and self._deck_remaining() > 0 else 0
 
         if not moves:
             # Ничего не двигается — применяем целевой порядок и запускаем анимацию добора
             self.hand_cards = target_hand
-            if draw_limit > 0 and len(self.deck) > 0:
+            if draw_limit > 0 and self._deck_remaining() > 0:
                 start_idx = len(existing)
                 # Запускаем анимацию добора вместо мгновенного добора
                 if self.bottom_frame:
@@ -3918,7 +3985,7 @@ class GameplayPage:
                         from_x = target_x
                         from_y = SCREEN_HEIGHT + 100  # За экраном снизу
                         
-                        card_id = self.deck.pop(0)  # Извлекаем карту из колоды
+                        card_id = self._draw_from_deck()  # Извлекаем карту из колоды
                         if card_id == 0:
                             card_id = 100
                         self.hand_draw_anim.append({
@@ -3926,13 +3993,13 @@ class GameplayPage:
                             'target_slot': target_slot,
                             'target_pos': (target_x, target_y),
                             'from_pos': (from_x, from_y),
-                            'progress': 0.0,
                         })
                     self.hand_draw_start_time = pygame.time.get_ticks()
+                    self.hand_draw_progress = 0.0
                 else:
                     # Без рамки — мгновенный добор
                     for offset in range(draw_limit):
-                        card_id = self.deck.pop(0)
+                        card_id = self._draw_from_deck()
                         if card_id == 0:
                             card_id = 100
                         self.hand_cards[start_idx + offset] = card_id
@@ -3944,19 +4011,17 @@ class GameplayPage:
         self.hand_compact_target_hand = target_hand
         self.hand_compact_draw_count = draw_limit
         self.hand_compact_start_time = pygame.time.get_ticks()
+        self.hand_compact_progress = 0.0
 
-    def update_hand_compact_animation(self):
+    def update_hand_compact_animation(self, now):
         """Обновление анимации сдвига карт в руке после конца хода."""
         if not self.hand_compact_anim:
             return
 
-        now = pygame.time.get_ticks()
         elapsed = now - self.hand_compact_start_time
         progress = min(1.0, max(0.0, elapsed / max(1, self.hand_compact_duration)))
-
-        # Обновляем прогресс для всех движений
-        for entry in self.hand_compact_anim:
-            entry["progress"] = progress
+        # Один общий прогресс на все движения (draw читает его напрямую)
+        self.hand_compact_progress = progress
 
         # Если анимация завершена, применяем итоговое состояние
         if progress >= 1.0:
@@ -3967,7 +4032,7 @@ class GameplayPage:
             # 2) Запускаем анимацию добора карт (вместо мгновенного добора)
             if (
                 self.hand_compact_draw_count > 0
-                and len(self.deck) > 0
+                and self._deck_remaining() > 0
                 and any(card is None for card in self.hand_cards)
             ):
                 # Ищем первый свободный слот
@@ -3977,35 +4042,22 @@ class GameplayPage:
                 if first_free is not None:
                     slots_available = self.hand - first_free
                     draw_count = min(
-                        self.hand_compact_draw_count, slots_available, len(self.deck)
+                        self.hand_compact_draw_count, slots_available, self._deck_remaining()
                     )
                     
-                # Подготовка геометрии для анимации (как в draw, с тем же более плотным spacing и центрированием)
+                    # Позиции слотов уже посчитаны в _recompute_hand_slot_rects (как в draw)
                     if self.bottom_frame:
-                        bf_w = self.bottom_frame.get_width()
-                        bf_h = self.bottom_frame.get_height()
-                        bf_x = (SCREEN_WIDTH - bf_w) // 2 - 200
-                        bf_y = SCREEN_HEIGHT - bf_h - 150
-                        
-                        ph_w = 138
-                        ph_h = 240
-                        base_spacing = (bf_w - ph_w * self.hand) / (self.hand + 1)
-                        spacing = base_spacing * 0.7
-                        total_width = ph_w * self.hand + spacing * (self.hand - 1)
-                        start_x = bf_x + (bf_w - total_width) / 2
-                        start_y = bf_y + (bf_h - ph_h) // 2
-                        
+                        slot_positions = self.hand_slot_positions
                         # Создаём анимации для каждой новой карты
                         self.hand_draw_anim = []
                         for offset in range(draw_count):
                             target_slot = first_free + offset
-                            target_x = start_x + target_slot * (ph_w + spacing)
-                            target_y = start_y
+                            target_x, target_y = slot_positions[target_slot]
                             # Стартовая позиция: снизу экрана, по центру целевого слота по X
                             from_x = target_x
                             from_y = SCREEN_HEIGHT + 100  # За экраном снизу
                             
-                            card_id = self.deck.pop(0)  # Извлекаем карту из колоды
+                            card_id = self._draw_from_deck()  # Извлекаем карту из колоды
                             if card_id == 0:
                                 card_id = 100
                             self.hand_draw_anim.append({
@@ -4013,13 +4065,13 @@ class GameplayPage:
                                 'target_slot': target_slot,
                                 'target_pos': (target_x, target_y),
                                 'from_pos': (from_x, from_y),
-                                'progress': 0.0,
                             })
-                        self.hand_draw_start_time = pygame.time.get_ticks()
+                        self.hand_draw_start_time = now
+                        self.hand_draw_progress = 0.0
                     else:
                         # Без рамки — мгновенный добор
                         for offset in range(draw_count):
-                            card_id = self.deck.pop(0)
+                            card_id = self._draw_from_deck()
                             if card_id == 0:
                                 card_id = 100
                             self.hand_cards[first_free + offset] = card_id
@@ -4030,18 +4082,15 @@ class GameplayPage:
             self.hand_compact_target_hand = None
             self.hand_compact_draw_count = 0
     
-    def update_hand_draw_animation(self):
+    def update_hand_draw_animation(self, now):
         """Обновление анимации добора карт (карты прилетают снизу экрана)."""
         if not self.hand_draw_anim:
             return
         
-        now = pygame.time.get_ticks()
         elapsed = now - self.hand_draw_start_time
         progress = min(1.0, max(0.0, elapsed / max(1, self.hand_draw_duration)))
-        
-        # Обновляем прогресс для всех анимаций добора
-        for entry in self.hand_draw_anim:
-            entry["progress"] = progress
+        # Один общий прогресс на все анимации добора
+        self.hand_draw_progress = progress
         
         # Если анимация завершена, физически добавляем карты в руку
         if progress >= 1.0:
@@ -4064,74 +4113,73 @@ class GameplayPage:
         CardAction is displayed near the + sign and scales with card size."""
         if card_id is None:
             return
-        if card_id not in self.card_actions:
+        if card_id not in CARD_ACTIONS:
             return
         
-        action_value = self.card_actions[card_id]
+        action_value = CARD_ACTIONS[card_id]
         
         # Validate card_size
         if not card_size or len(card_size) < 2 or card_size[0] <= 0:
             return
         
-        # Calculate scale factor based on card size
-        # Market cards: (99, 171), Bottom cards: (142, 244)
-        # Use width ratio for scaling
-        base_market_width = 99
-        scale_factor = card_size[0] / base_market_width
-        
-        # Calculate font size based on scale (base font_small is 36, reduced by 15%, then by 10%)
-        base_font_size = 36
-        base_font_size_reduced = int(base_font_size * 0.85 * 0.9)  # Reduce by 15%, then by 10% more
-        scaled_font_size = int(base_font_size_reduced * scale_factor)
-        
-        # Ensure minimum font size (at least 1 pixel)
-        if scaled_font_size < 1:
-            scaled_font_size = 1
+        # Scale, font and offsets depend only on the card width (market/bottom/side), so compute them once per width
+        geom = self._card_action_geom_cache.get(card_size[0])
+        if geom is None:
+            # Calculate scale factor based on card size
+            # Market cards: (99, 171), Bottom cards: (142, 244)
+            # Use width ratio for scaling
+            base_market_width = 99
+            scale_factor = card_size[0] / base_market_width
+            
+            # Calculate font size based on scale (base font_small is 36, reduced by 15%, then by 10%)
+            base_font_size = 36
+            base_font_size_reduced = int(base_font_size * 0.85 * 0.9)  # Reduce by 15%, then by 10% more
+            scaled_font_size = int(base_font_size_reduced * scale_factor)
+            
+            # Ensure minimum font size (at least 1 pixel)
+            if scaled_font_size < 1:
+                scaled_font_size = 1
 
-        # Prepare (and cache) font for CardAction, prefer Gadugib if available
-        if not hasattr(self, "card_action_font_cache"):
-            self.card_action_font_cache = {}
-        if not hasattr(self, "card_action_font_base"):
-            gadugib_path = "Gadugib.ttf"
-            if os.path.exists(gadugib_path):
-                self.card_action_font_base = gadugib_path
-            else:
-                self.card_action_font_base = self.font_path
-        font_key = scaled_font_size
-        scaled_font = self.card_action_font_cache.get(font_key)
-        if scaled_font is None:
+            # Shared font for CardAction (font file is resolved in __init__)
             try:
-                scaled_font = pygame.font.Font(self.card_action_font_base, scaled_font_size)
-                self.card_action_font_cache[font_key] = scaled_font
+                scaled_font = get_font(self.card_font_base, scaled_font_size)
             except Exception as e:
                 print(f"ERROR creating font for CardAction (size {scaled_font_size}): {e}")
                 return
-        
-        # Ensure font is valid before using
-        if scaled_font is None:
-            return
-        
-        # Assume + sign is in upper right area, approximately at (card_width - 25, 10)
-        # CardAction is displayed near the + sign
-        # Scale the offset positions too
-        plus_x = card_x + card_size[0] - 25 * scale_factor  # Approximate position of + sign (from right edge)
-        plus_y = card_y + 10 * scale_factor  # Approximate position from top
-        # Current offset: move 29px left and 14px down relative to the + sign (scaled)
-        # Adjusted: moved 4px down from previous position
-        action_x = plus_x - 29 * scale_factor
-        action_y = plus_y + 14 * scale_factor
+            
+            # Assume + sign is in upper right area, approximately at (card_width - 25, 10)
+            # CardAction is displayed near the + sign
+            # Scale the offset positions too
+            plus_x = card_size[0] - 25 * scale_factor  # Approximate position of + sign (from right edge)
+            plus_y = 10 * scale_factor  # Approximate position from top
+            # Current offset: move 29px left and 14px down relative to the + sign (scaled)
+            # Adjusted: moved 4px down from previous position
+            geom = (
+                scaled_font,
+                plus_x - 29 * scale_factor,
+                plus_y + 14 * scale_factor,
+                11 * scale_factor,  # extra left shift for the minus sign of cards 15/16
+            )
+            self._card_action_geom_cache[card_size[0]] = geom
+        scaled_font, offset_x, offset_y, minus_shift = geom
+        action_x = card_x + offset_x
+        action_y = card_y + offset_y
         
         # For cards 15 and 16, shift left by 11 pixels to compensate for minus sign
         if card_id in (15, 16):
-            action_x -= 11 * scale_factor
+            action_x -= minus_shift
         
-        # Render CardAction text using scaled font with PAPER_COLOR
-        try:
-            action_text = scaled_font.render(str(action_value), True, PAPER_COLOR)
-            if action_text:
-                self.screen.blit(action_text, (action_x, action_y))
-        except Exception as e:
-            print(f"ERROR rendering CardAction text: {e}")
+        # Render CardAction text using scaled font with PAPER_COLOR (once per value and card width)
+        text_key = (action_value, card_size[0])
+        action_text = self._card_action_text_cache.get(text_key)
+        if action_text is None:
+            try:
+                action_text = scaled_font.render(str(action_value), True, PAPER_COLOR)
+            except Exception as e:
+                print(f"ERROR rendering CardAction text: {e}")
+                return
+            self._card_action_text_cache[text_key] = action_text
+        self.screen.blit(action_text, (action_x, action_y))
     
     def draw_card_turns(self, card_id, card_x, card_y, card_size, turns_remaining=None):
         """Draw CardTurns value at the bottom of a card after "Turns:" text.
@@ -4139,17 +4187,17 @@ class GameplayPage:
         card_size: tuple (width, height) of the card
         CardTurns is displayed at the bottom and scales with card size.
         Font size is 20% smaller than CardAction.
-        turns_remaining: optional remaining turns value (for market cards), if None uses base value from card_turns."""
+        turns_remaining: optional remaining turns value (for market cards), if None uses base value from CARD_TURNS."""
         if card_id is None:
             return
-        if card_id not in self.card_turns:
+        if card_id not in CARD_TURNS:
             return
         
         # Use provided turns_remaining if available, otherwise use base value
         if turns_remaining is not None:
             turns_value = turns_remaining
         else:
-            turns_value = self.card_turns[card_id]
+            turns_value = CARD_TURNS[card_id]
         
         # Validate card_size
         if not card_size or len(card_size) < 2 or card_size[0] <= 0:
@@ -4170,24 +4218,12 @@ class GameplayPage:
         if turns_font_size < 1:
             turns_font_size = 1
         
-        # Prepare (and cache) font for CardTurns, prefer Gadugib if available
-        if not hasattr(self, "card_turns_font_cache"):
-            self.card_turns_font_cache = {}
-        if not hasattr(self, "card_turns_font_base"):
-            gadugib_path = "Gadugib.ttf"
-            if os.path.exists(gadugib_path):
-                self.card_turns_font_base = gadugib_path
-            else:
-                self.card_turns_font_base = self.font_path
-        font_key = turns_font_size
-        scaled_font = self.card_turns_font_cache.get(font_key)
-        if scaled_font is None:
-            try:
-                scaled_font = pygame.font.Font(self.card_turns_font_base, turns_font_size)
-                self.card_turns_font_cache[font_key] = scaled_font
-            except Exception as e:
-                print(f"ERROR creating font for CardTurns (size {turns_font_size}): {e}")
-                return
+        # Shared font for CardTurns (font file is resolved in __init__)
+        try:
+            scaled_font = get_font(self.card_font_base, turns_font_size)
+        except Exception as e:
+            print(f"ERROR creating font for CardTurns (size {turns_font_size}): {e}")
+            return
         
         # Ensure font is valid before using
         if scaled_font is None:
@@ -4215,7 +4251,7 @@ class GameplayPage:
                 # Cards 17-18 use a slightly different base card art layout; align the number
                 # with the "Turns:" label to match cards 11-16.
                 # Empirically: 17/18 were ~7px too far right and ~4px too high (at bottom-card size).
-                if card_id in (17, 18):
+                if card_id in CARD_MULTIPLIER_IDS:
                     x_scale = float(card_size[0]) / 142.0 if card_size[0] else 1.0
                     y_scale = float(card_size[1]) / 244.0 if card_size[1] else 1.0
                     turns_x -= 7.0 * x_scale
@@ -4227,8 +4263,8 @@ class GameplayPage:
             print(f"ERROR rendering CardTurns text: {e}")
     
     def draw(self):
-        # Clear market placeholders list at start of draw
-        self.market_placeholders = []
+        # Market placeholder rects never move, so the list is only built on the first draw
+        build_market_placeholders = not self.market_placeholders
 
         # Determine dragged hand card type (for zone highlight / drop rules)
         dragged_hand_card_id = None
@@ -4249,8 +4285,7 @@ class GameplayPage:
         
         # Draw three top frames (for columns A, B, C)
         if self.frame:
-            frame_width = self.frame.get_width()
-            frame_height = self.frame.get_height()
+            frame_width, frame_height = self.frame_size
             spacing = 10  # Space between frames
             
             # Calculate starting x position to center the three frames, then move left 200px
@@ -4293,7 +4328,7 @@ class GameplayPage:
             right_bot_h = side_ph_h + 2 * bot_pad_y
             # Align the TOP border of the 3-slot frame with the TOP border of the hand (bottom) frame.
             if self.bottom_frame:
-                bf_h = self.bottom_frame.get_height()
+                bf_h = self.bottom_frame_size[1]
                 bf_y = SCREEN_HEIGHT - bf_h - 150
                 # Bottom Frame.png has a small transparent padding; add a tiny offset so the visible
                 # top border aligns with the 3-slot frame border.
@@ -4344,8 +4379,8 @@ class GameplayPage:
 
             # Draw frames (reuse Frame.png scaled to desired sizes)
             try:
-                right_frame_top_img = pygame.transform.smoothscale(self.frame, (right_frame_w, right_top_h)).convert_alpha()
-                right_frame_bot_img = pygame.transform.smoothscale(self.frame, (right_frame_w, right_bot_h)).convert_alpha()
+                right_frame_top_img = pygame.transform.smoothscale(self.frame, (right_frame_w, right_top_h))
+                right_frame_bot_img = pygame.transform.smoothscale(self.frame, (right_frame_w, right_bot_h))
                 self.screen.blit(right_frame_top_img, (right_frame_x, right_top_y))
                 self.screen.blit(right_frame_bot_img, (right_frame_x, right_bot_y))
             except Exception:
@@ -4395,47 +4430,39 @@ class GameplayPage:
                         # Use fixed logo height (128) to ensure all QP Blocks are at the same level
                         bundle_x = logo_x
                         bundle_y = logo_y + 128 + 5 + 30  # Fixed logo height (128) + 5px spacing + 30px down
-                        self.screen.blit(self.bundle_image, (bundle_x, bundle_y))
+                        bundle_w, bundle_h = self.bundle_size
+                        # Dollar image sits below the bundle image
+                        dollar_x = bundle_x + 10  # 10px to the right
+                        dollar_y = bundle_y + bundle_h + 5  # 5px spacing below bundle image
+                        # Both images are single shared surfaces: draw them in one batched call
+                        if self.dollar_image:
+                            self.screen.fblits(((self.bundle_image, (bundle_x, bundle_y)), (self.dollar_image, (dollar_x, dollar_y))))
+                        else:
+                            self.screen.blit(self.bundle_image, (bundle_x, bundle_y))
                         
                         # Calculate text_x position (used for both quantity and price)
-                        text_x = bundle_x + self.bundle_image.get_width() + 10  # 10px spacing from bundle image
+                        text_x = bundle_x + bundle_w + 10  # 10px spacing from bundle image
                         
                         # Draw quantity text next to the bundle image (related data)
-                        quantity = None
-                        if i == 0:
-                            quantity = self.Aquantity
-                        elif i == 1:
-                            quantity = self.Bquantity
-                        elif i == 2:
-                            quantity = self.Cquantity
+                        quantity = self.quantity[i]
                         
                         if quantity is not None:
                             # Position text to the right of the bundle image, vertically centered
                             quantity_text = self.font_small.render(str(quantity), True, PAPER_COLOR)
                             # Center text vertically with bundle image
-                            text_y = bundle_y + (self.bundle_image.get_height() - quantity_text.get_height()) // 2
+                            text_y = bundle_y + (bundle_h - quantity_text.get_height()) // 2
                             self.screen.blit(quantity_text, (text_x, text_y))
                         
-                        # Draw Dollar image below the bundle image
+                        # Price field next to the Dollar image (drawn with the bundle above)
                         if self.dollar_image:
-                            dollar_x = bundle_x + 10  # 10px to the right
-                            dollar_y = bundle_y + self.bundle_image.get_height() + 5  # 5px spacing below bundle image
-                            self.screen.blit(self.dollar_image, (dollar_x, dollar_y))
-                            
                             # Draw price text at the same level as Dollar image
-                            price = None
-                            if i == 0:
-                                price = self.Aprice
-                            elif i == 1:
-                                price = self.BPrice
-                            elif i == 2:
-                                price = self.CPrice
+                            price = self.price[i]
                             
                             if price is not None:
                                 price_text = self.font_small.render(str(price), True, PAPER_COLOR)
                                 price_text_x = text_x  # Same x position as quantity field
                                 # Center text vertically with Dollar image
-                                price_text_y = dollar_y + (self.dollar_image.get_height() - price_text.get_height()) // 2
+                                price_text_y = dollar_y + (self.dollar_size[1] - price_text.get_height()) // 2
                                 self.screen.blit(price_text, (price_text_x, price_text_y))
 
                 # Draw arrows inside each frame (stacked vertically), size 60x60, start 25px from top
@@ -4445,6 +4472,7 @@ class GameplayPage:
                     spacing_middle = 4  # reduced spacing between middle arrows (2-3)
                     # Order: top outer up, middle Arrow1 up, middle Arrow1 down, bottom outer down
                     arrows = [self.arrow_up, self.arrow_mid_up, self.arrow_mid_down, self.arrow_down]
+                    arrow_frames = (self.arrow_anim_frames, self.arrow_mid_up_frames, self.arrow_mid_down_frames, self.arrow_down_frames)
                     total_height = (
                         len(arrows) * arrow_size
                         + spacing_outer * 2
@@ -4462,55 +4490,19 @@ class GameplayPage:
                             ay = start_y + arrow_size * 2 + spacing_outer + spacing_middle
                         else:  # idx == 3
                             ay = start_y + arrow_size * 3 + spacing_outer * 2 + spacing_middle
-                        # Choose animated frame for outer arrows if animating
-                        # Determine image (animated only for outer arrows per entry state)
+                        # Animated frame if this arrow's entry is animating; arrow_type == idx
                         img_to_draw = arrow_img
-                        if idx == 0 and self.arrow_anim_frames:
-                            rect = pygame.Rect(arrow_x, ay, arrow_size, arrow_size)
-                            entry = next((e for e in self.arrow_entries if e["rect"].topleft == rect.topleft), None)
-                            if not entry:
-                                entry = {"rect": rect, "animating": False, "idx": 0, "last": 0, "frames": self.arrow_anim_frames, "arrow_type": 0, "frame_index": i}
-                                self.arrow_entries.append(entry)
-                            if entry["animating"]:
-                                frame_idx = self.arrow_anim_sequence[entry["idx"]]
-                                img_to_draw = entry["frames"][frame_idx] if entry["frames"] else arrow_img
-                            self.screen.blit(img_to_draw, rect.topleft)
-                        elif idx == 1 and self.arrow_mid_up_frames:
-                            # Middle up arrow with animation
-                            rect = pygame.Rect(arrow_x, ay, arrow_size, arrow_size)
-                            entry = next((e for e in self.arrow_entries if e["rect"].topleft == rect.topleft), None)
-                            if not entry:
-                                entry = {"rect": rect, "animating": False, "idx": 0, "last": 0, "frames": self.arrow_mid_up_frames, "arrow_type": 1, "frame_index": i}
-                                self.arrow_entries.append(entry)
-                            if entry["animating"]:
-                                frame_idx = self.arrow_anim_sequence[entry["idx"]]
-                                img_to_draw = entry["frames"][frame_idx] if entry["frames"] else arrow_img
-                            else:
-                                img_to_draw = arrow_img
-                            self.screen.blit(img_to_draw, rect.topleft)
-                        elif idx == 2 and self.arrow_mid_down_frames:
-                            # Middle down arrow with animation
-                            rect = pygame.Rect(arrow_x, ay, arrow_size, arrow_size)
-                            entry = next((e for e in self.arrow_entries if e["rect"].topleft == rect.topleft), None)
-                            if not entry:
-                                entry = {"rect": rect, "animating": False, "idx": 0, "last": 0, "frames": self.arrow_mid_down_frames, "arrow_type": 2, "frame_index": i}
-                                self.arrow_entries.append(entry)
-                            if entry["animating"]:
-                                frame_idx = self.arrow_anim_sequence[entry["idx"]]
-                                img_to_draw = entry["frames"][frame_idx] if entry["frames"] else arrow_img
-                            else:
-                                img_to_draw = arrow_img
-                            self.screen.blit(img_to_draw, rect.topleft)
-                        elif idx == 3 and self.arrow_down_frames:
-                            rect = pygame.Rect(arrow_x, ay, arrow_size, arrow_size)
-                            entry = next((e for e in self.arrow_entries if e["rect"].topleft == rect.topleft), None)
-                            if not entry:
-                                entry = {"rect": rect, "animating": False, "idx": 0, "last": 0, "frames": self.arrow_down_frames, "arrow_type": 3, "frame_index": i}
+                        frames = arrow_frames[idx]
+                        if frames:
+                            # Entries (and their hitbox Rects) are created once per arrow and reused
+                            entry = self._arrow_entry_at.get((i, idx))
+                            if entry is None:
+                                entry = {"rect": pygame.Rect(arrow_x, ay, arrow_size, arrow_size), "animating": False, "idx": 0, "start": 0, "frames": frames, "arrow_type": idx, "frame_index": i}
                                 self.arrow_entries.append(entry)
+                                self._arrow_entry_at[(i, idx)] = entry
                             if entry["animating"]:
-                                frame_idx = self.arrow_anim_sequence[entry["idx"]]
-                                img_to_draw = entry["frames"][frame_idx] if entry["frames"] else arrow_img
-                            self.screen.blit(img_to_draw, rect.topleft)
+                                img_to_draw = frames[ARROW_ANIM_SEQUENCE[entry["idx"]]]
+                            self.screen.blit(img_to_draw, entry["rect"].topleft)
                         else:
                             self.screen.blit(img_to_draw, (arrow_x, ay))
                 
@@ -4525,7 +4517,6 @@ class GameplayPage:
                     ph_start_x = frame_x + spacing  # Start from equal margin
                     ph_start_y = frame_y + frame_height - ph_h - 30  # 30px from bottom of frame (moved up 20px total)
                     
-                    # Clear market placeholders list and repopulate
                     for ph_idx in range(num_placeholders):
                         ph_x = ph_start_x + ph_idx * (ph_w + spacing)
                         # Move left and right placeholders 7px closer to the center placeholder
@@ -4534,18 +4525,21 @@ class GameplayPage:
                         elif ph_idx == 2:
                             ph_x -= 7   # right placeholder moves left
                         ph_y = ph_start_y
-                        ph_rect = pygame.Rect(ph_x, ph_y, ph_w, ph_h)
-                        self.market_placeholders.append({
-                            'market': i,
-                            'slot': ph_idx,
-                            'rect': ph_rect
-                        })
+                        if build_market_placeholders:
+                            ph_rect = pygame.Rect(ph_x, ph_y, ph_w, ph_h)
+                            self.market_placeholders.append({
+                                'market': i,
+                                'slot': ph_idx,
+                                'rect': ph_rect
+                            })
+                            self._market_bbox = ph_rect if self._market_bbox is None else self._market_bbox.union(ph_rect)
+                        else:
+                            ph_rect = self.market_placeholders[i * num_placeholders + ph_idx]['rect']
                         self.screen.blit(self.placeholder_market, (ph_x, ph_y))
                         
                         # Draw card on market placeholder if one is placed there
                         if (
-                            ph_idx in self.market_cards[i]
-                            and self.market_cards[i][ph_idx] is not None
+                            self.market_cards[i][ph_idx] is not None
                             and not (
                                 self.dragged_card_source == "market"
                                 and self.dragged_card_market == i
@@ -4553,31 +4547,28 @@ class GameplayPage:
                             )
                         ):
                             card_id = self.market_cards[i][ph_idx]
-                            if card_id in self.card_images_market and self.card_images_market[card_id]:
+                            card_image = self._card_image(card_id, self.card_size_market)
+                            if card_image:
                                 # Use pre-scaled market card (no scaling on every frame)
                                 # Center card on placeholder
                                 card_x = ph_x - 1  # Center horizontally
                                 card_y = ph_y - 1  # Center vertically
                                 # Apply jump animation offset if card is jumping
-                                jump_anim = self.card_jump_animations[i].get(ph_idx)
+                                jump_anim = self.card_jump_animations[i][ph_idx]
                                 if jump_anim:
                                     card_y += int(jump_anim['offset_y'])
-                                self.screen.blit(self.card_images_market[card_id], (card_x, card_y))
+                                self.screen.blit(card_image, (card_x, card_y))
                                 # Draw CardAction if this card has one
                                 self.draw_card_action(card_id, card_x, card_y, self.card_size_market)
                                 # Draw CardTurns if this card has one - use remaining turns from market_card_turns
-                                remaining_turns = self.market_card_turns[i].get(ph_idx)
+                                remaining_turns = self.market_card_turns[i][ph_idx]
                                 self.draw_card_turns(card_id, card_x, card_y, self.card_size_market, turns_remaining=remaining_turns)
                         # Highlight available market placeholder for dropping a card
                         highlight = False
                         # When dragging from hand: only FIRST free slot in each market is valid
                         if self.dragged_card_source == "hand" and dragged_hand_card_type != 2:
                             # find first free slot for this market
-                            first_free = None
-                            for s in range(num_placeholders):
-                                if self.market_cards[i].get(s) is None:
-                                    first_free = s
-                                    break
+                            first_free = self.market_first_free[i]
                             if first_free is not None and ph_idx == first_free:
                                 highlight = True
                         # When dragging from market:
@@ -4590,11 +4581,7 @@ class GameplayPage:
                             else:
                                 # 2) for other markets, highlight only their FIRST free placeholder
                                 if i != src_market:
-                                    first_free = None
-                                    for s in range(num_placeholders):
-                                        if self.market_cards[i].get(s) is None:
-                                            first_free = s
-                                            break
+                                    first_free = self.market_first_free[i]
                                     if first_free is not None and ph_idx == first_free:
                                         highlight = True
                         if highlight:
@@ -4626,8 +4613,8 @@ class GameplayPage:
             # ------------------------------------------------------------
             # Draw placeholders inside the right-side framed areas
             # ------------------------------------------------------------
-            self.side_placeholders_top = []
-            self.side_placeholders_bottom = []
+            # Side placeholder rects never move: build them on the first draw, then reuse
+            build_side_placeholders = not self.side_placeholders_top
             ph_img = self.placeholder_side or self.placeholder_market
             if ph_img:
                 # If dragging a Type=2 card from hand, highlight ONLY the first free slot
@@ -4649,11 +4636,14 @@ class GameplayPage:
                 pad_y = max(10.0, (right_top_h - rows * ph_h) / (rows + 1))
                 for r in range(rows):
                     for c in range(cols):
-                        x = right_frame_x + pad_x * (c + 1) + ph_w * c
-                        y = right_top_y + pad_y * (r + 1) + ph_h * r
-                        rect = pygame.Rect(int(round(x)), int(round(y)), ph_w, ph_h)
                         slot = r * cols + c
-                        self.side_placeholders_top.append({"slot": slot, "rect": rect})
+                        if build_side_placeholders:
+                            x = right_frame_x + pad_x * (c + 1) + ph_w * c
+                            y = right_top_y + pad_y * (r + 1) + ph_h * r
+                            rect = pygame.Rect(int(round(x)), int(round(y)), ph_w, ph_h)
+                            self.side_placeholders_top.append({"slot": slot, "rect": rect})
+                        else:
+                            rect = self.side_placeholders_top[slot]["rect"]
                         self.screen.blit(ph_img, rect.topleft)
 
                         # Draw card if placed in this top slot
@@ -4664,11 +4654,7 @@ class GameplayPage:
                         if card_id is not None and not (
                             self.dragged_card_source == "side_top" and self.dragged_card_side_slot == slot
                         ):
-                            img = (
-                                self.card_images_side.get(card_id)
-                                or self.card_images_market.get(card_id)
-                                or self.card_images_bottom.get(card_id)
-                            )
+                            img = self._card_image(card_id, self.card_size_side)
                             if img:
                                 card_x = rect.x - 1
                                 card_y = rect.y - 1
@@ -4686,17 +4672,18 @@ class GameplayPage:
                 pad_x = max(10.0, (right_frame_w - cols * ph_w) / (cols + 1))
                 pad_y = max(10.0, (right_bot_h - rows * ph_h) / (rows + 1))
                 for c in range(cols):
-                    x = right_frame_x + pad_x * (c + 1) + ph_w * c
-                    y = right_bot_y + pad_y
-                    rect = pygame.Rect(int(round(x)), int(round(y)), ph_w, ph_h)
-                    slot = c
-                    self.side_placeholders_bottom.append({"slot": slot, "rect": rect})
+                    if build_side_placeholders:
+                        x = right_frame_x + pad_x * (c + 1) + ph_w * c
+                        y = right_bot_y + pad_y
+                        rect = pygame.Rect(int(round(x)), int(round(y)), ph_w, ph_h)
+                        self.side_placeholders_bottom.append({"slot": c, "rect": rect})
+                    else:
+                        rect = self.side_placeholders_bottom[c]["rect"]
                     self.screen.blit(ph_img, rect.topleft)
 
         # Draw bottom frame (strategy cards area)
         if self.bottom_frame:
-            bf_w = self.bottom_frame.get_width()
-            bf_h = self.bottom_frame.get_height()
+            bf_w, bf_h = self.bottom_frame_size
             # Position symmetrically with the three upper frames (same left offset of 200px)
             bf_x = (SCREEN_WIDTH - bf_w) // 2 - 200
             # Position it above bottom margin similar to screenshot, moved up 50px
@@ -4705,26 +4692,11 @@ class GameplayPage:
 
             # Draw hand placeholders evenly inside bottom frame
             if self.hand > 0:
-                self.bottom_placeholders = []
                 ph_w = 138   # Bottom placeholder width (40% larger than 96)
                 ph_h = 240  # Bottom placeholder height (40% larger than 168)
-                # Equal spacing pattern, но чуть плотнее (меньше промежутков), при этом группа по центру рамки
-                base_spacing = (bf_w - ph_w * self.hand) / (self.hand + 1)
-                spacing = base_spacing * 0.7
-                total_width = ph_w * self.hand + spacing * (self.hand - 1)
-                start_x = bf_x + (bf_w - total_width) / 2
-                # Slightly lower hand area so cards don't overlap the top edge of the bottom frame
-                start_y = bf_y + (bf_h - ph_h) // 2 + 10
-                # Slightly lower hand area so cards don't overlap the top edge of the bottom frame
-                start_y = bf_y + (bf_h - ph_h) // 2 + 10
-
-                for i in range(self.hand):
-                    slot_x = start_x + i * (ph_w + spacing)
-                    slot_y = start_y
-                    self.bottom_placeholders.append({
-                        'slot': i,
-                        'rect': pygame.Rect(slot_x, slot_y, ph_w, ph_h)
-                    })
+                # Slot positions are laid out once by _recompute_hand_slot_rects
+                for i, (slot_x, slot_y) in enumerate(self.hand_slot_positions):
+                    ph_rect = self.bottom_placeholders[i]['rect']
                     # Draw placeholder
                     if self.placeholder_bottom:
                         self.screen.blit(self.placeholder_bottom, (slot_x, slot_y))
@@ -4749,17 +4721,14 @@ class GameplayPage:
                                 if draw_entry["target_slot"] == i:
                                     drawing_to_this_slot = True
                                     break
-                        if (
-                            not moving_from_this_slot
-                            and not drawing_to_this_slot
-                            and card_id is not None
-                            and card_id in self.card_images_bottom
-                            and self.card_images_bottom[card_id]
-                        ):
+                        card_image = None
+                        if not moving_from_this_slot and not drawing_to_this_slot:
+                            card_image = self._card_image(card_id, self.card_size_bottom)
+                        if card_image:
                             # Center card on placeholder (card is 4px larger)
                             card_x = slot_x - 2  # Center horizontally
                             card_y = slot_y - 2  # Center vertically
-                            self.screen.blit(self.card_images_bottom[card_id], (card_x, card_y))
+                            self.screen.blit(card_image, (card_x, card_y))
                             # Draw CardAction if this card has one
                             self.draw_card_action(card_id, card_x, card_y, self.card_size_bottom)
                             # Draw CardTurns if this card has one
@@ -4769,9 +4738,8 @@ class GameplayPage:
                     if self.dragged_card_source == "market":
                         src_market = self.dragged_card_market
                         src_slot = self.dragged_card_market_slot
-                        origin_slot = self.market_card_origins[src_market].get(src_slot)
+                        origin_slot = self.market_card_origins[src_market][src_slot]
                         if origin_slot is not None and i == origin_slot and self.hand_cards[i] is None:
-                            ph_rect = pygame.Rect(slot_x, slot_y, ph_w, ph_h)
                             pygame.draw.rect(self.screen, GOLD, ph_rect, 4)
                     # Highlight available hand placeholder when dragging from side-top:
                     # only the ORIGINAL hand slot of this card
@@ -4779,39 +4747,40 @@ class GameplayPage:
                         src_slot = self.dragged_card_side_slot
                         origin_slot = self.side_card_origins_top.get(src_slot)
                         if origin_slot is not None and i == origin_slot and self.hand_cards[i] is None:
-                            ph_rect = pygame.Rect(slot_x, slot_y, ph_w, ph_h)
                             pygame.draw.rect(self.screen, GOLD, ph_rect, 4)
         
         # Draw dragged card on top of everything
         if self.dragged_card_source == "hand" and self.dragged_card_index is not None and self.dragged_card_index < len(self.hand_cards):
             card_id = self.hand_cards[self.dragged_card_index]
-            if card_id in self.card_images_bottom and self.card_images_bottom[card_id]:
+            card_image = self._card_image(card_id, self.card_size_bottom)
+            if card_image:
                 # Draw card at mouse position with offset
                 card_x = self.dragged_card_pos[0] - self.drag_offset[0]
                 card_y = self.dragged_card_pos[1] - self.drag_offset[1]
-                self.screen.blit(self.card_images_bottom[card_id], (card_x, card_y))
+                self.screen.blit(card_image, (card_x, card_y))
                 # Draw CardAction if this card has one
                 self.draw_card_action(card_id, card_x, card_y, self.card_size_bottom)
                 # Draw CardTurns if this card has one
                 self.draw_card_turns(card_id, card_x, card_y, self.card_size_bottom)
         # Draw dragged card from market on top
         if self.dragged_card_source == "market" and self.dragged_card_market is not None:
-            card_id = self.market_cards[self.dragged_card_market].get(self.dragged_card_market_slot)
-            if card_id is not None and card_id in self.card_images_market and self.card_images_market[card_id]:
+            card_id = self.market_cards[self.dragged_card_market][self.dragged_card_market_slot]
+            card_image = self._card_image(card_id, self.card_size_market)
+            if card_image:
                 card_x = self.dragged_card_pos[0] - self.drag_offset[0]
                 card_y = self.dragged_card_pos[1] - self.drag_offset[1]
-                self.screen.blit(self.card_images_market[card_id], (card_x, card_y))
+                self.screen.blit(card_image, (card_x, card_y))
                 # Draw CardAction if this card has one
                 self.draw_card_action(card_id, card_x, card_y, self.card_size_market)
                 # Draw CardTurns if this card has one - use remaining turns from market_card_turns
-                remaining_turns = self.market_card_turns[self.dragged_card_market].get(self.dragged_card_market_slot)
+                remaining_turns = self.market_card_turns[self.dragged_card_market][self.dragged_card_market_slot]
                 self.draw_card_turns(card_id, card_x, card_y, self.card_size_market, turns_remaining=remaining_turns)
         # Draw dragged card from side-top on top
         if self.dragged_card_source == "side_top" and self.dragged_card_side_slot is not None:
             slot = self.dragged_card_side_slot
             card_id = self.side_cards_top[slot] if 0 <= slot < len(self.side_cards_top) else None
             if card_id is not None:
-                img = self.card_images_side.get(card_id) or self.card_images_market.get(card_id)
+                img = self._card_image(card_id, self.card_size_side)
                 if img:
                     card_x = self.dragged_card_pos[0] - self.drag_offset[0]
                     card_y = self.dragged_card_pos[1] - self.drag_offset[1]
@@ -4821,21 +4790,17 @@ class GameplayPage:
 
         # Draw hand compaction animations on top (когда карты плавно сдвигаются влево)
         if self.hand_compact_anim:
+            t = self.hand_compact_progress  # already clamped to 0..1
             for move in self.hand_compact_anim:
                 card_id = move["card_id"]
-                if (
-                    card_id is None
-                    or card_id not in self.card_images_bottom
-                    or not self.card_images_bottom[card_id]
-                ):
+                card_image = self._card_image(card_id, self.card_size_bottom)
+                if not card_image:
                     continue
                 (from_x, from_y) = move["from_pos"]
                 (to_x, to_y) = move["to_pos"]
-                t = move.get("progress", 0.0)
-                t = max(0.0, min(1.0, t))
                 card_x = from_x + (to_x - from_x) * t - 2
                 card_y = from_y + (to_y - from_y) * t - 2
-                self.screen.blit(self.card_images_bottom[card_id], (card_x, card_y))
+                self.screen.blit(card_image, (card_x, card_y))
                 # Draw CardAction if this card has one
                 self.draw_card_action(card_id, card_x, card_y, self.card_size_bottom)
                 # Draw CardTurns if this card has one
@@ -4843,21 +4808,17 @@ class GameplayPage:
         
         # Draw hand draw animations on top (когда карты прилетают снизу экрана)
         if self.hand_draw_anim:
+            t = self.hand_draw_progress  # already clamped to 0..1
             for draw_entry in self.hand_draw_anim:
                 card_id = draw_entry["card_id"]
-                if (
-                    card_id is None
-                    or card_id not in self.card_images_bottom
-                    or not self.card_images_bottom[card_id]
-                ):
+                card_image = self._card_image(card_id, self.card_size_bottom)
+                if not card_image:
                     continue
                 (from_x, from_y) = draw_entry["from_pos"]
                 (to_x, to_y) = draw_entry["target_pos"]
-                t = draw_entry.get("progress", 0.0)
-                t = max(0.0, min(1.0, t))
                 card_x = from_x + (to_x - from_x) * t - 2
                 card_y = from_y + (to_y - from_y) * t - 2
-                self.screen.blit(self.card_images_bottom[card_id], (card_x, card_y))
+                self.screen.blit(card_image, (card_x, card_y))
                 # Draw CardAction if this card has one
                 self.draw_card_action(card_id, card_x, card_y, self.card_size_bottom)
                 # Draw CardTurns if this card has one
@@ -4940,7 +4901,7 @@ class GameplayPage:
             
             if not ok_button:
                 # Debug: why button is not shown
-                if self.win_lose_state == "lose":
+                if DEBUG and self.win_lose_state == "lose":
                     print(f"DEBUG: Ok2 button not shown. ok2_button exists: {self.ok2_button is not None}, win_lose_state: {self.win_lose_state}")
         
         pygame.display.flip()
@@ -4949,67 +4910,64 @@ class GameplayPage:
         while True:
             result = self.handle_input()
             
-            if result == "quit":
+            if result == RESULT_QUIT:
                 pygame.quit()
                 sys.exit()
             
-            if result == "back":
-                return "back"
+            if result == RESULT_BACK:
+                return RESULT_BACK
             
-            if result == "round_select":
-                return "round_select"
+            if result == RESULT_ROUND_SELECT:
+                return RESULT_ROUND_SELECT
             
-            if result == "level_select":
-                return "level_select"
+            if result == RESULT_LEVEL_SELECT:
+                return RESULT_LEVEL_SELECT
             
             # Update dragged card position every frame for maximum smoothness
-            # This ensures position is updated even if MOUSEMOTION events are missed
+            # (MOUSEMOTION is blocked at the SDL queue, so this poll is the only position source)
             if self.dragged_card_source is not None:
                 self.dragged_card_pos = pygame.mouse.get_pos()
             
+            # One tick reading per frame, shared by all animation updates
+            now = pygame.time.get_ticks()
+
             # Update arrow animation timing
-            self.update_arrow_animation()
+            self.update_arrow_animation(now)
             
             # Update price animation timing
-            self.update_price_animation()
+            self.update_price_animation(now)
 
             # Update card jump animations
             self.update_card_jump_animations()
             
             # Update sequential processing of cards 11-18
-            self.update_cards_11_14_processing()
+            self.update_cards_11_14_processing(now)
 
             # Update hand compaction animation after end turn
-            self.update_hand_compact_animation()
+            self.update_hand_compact_animation(now)
             
             # Update hand draw animation (cards flying in from bottom)
-            self.update_hand_draw_animation()
+            self.update_hand_draw_animation(now)
             
             # Update win/lose screen animation
-            self.update_win_lose_animation()
+            self.update_win_lose_animation(now)
 
             self.draw()
             self.clock.tick(FPS)
 
 
 class BossPage:
-    def __init__(self, screen, font_path, level_number, defeated_count=0, last_defeated_rect=None, saved_lines=None, defeated_bosses=None):
+    def __init__(self, screen, font_path, level_number, defeated_count=0, last_defeated_rect=None, saved_lines=None, defeated_bosses=None, clock=None):
         self.screen = screen
-        self.clock = pygame.time.Clock()
-        self.level_number = level_number
-        self.defeated_count = defeated_count
-        self.last_defeated_rect = last_defeated_rect
-        self.saved_lines = list(saved_lines) if saved_lines else []
-        self.defeated_bosses = list(defeated_bosses) if defeated_bosses else []
-        self.clicked_boss_filename = None
+        self.clock = clock if clock is not None else pygame.time.Clock()
         self.boss_image_cache = {}
-        self.clicked_boss_rect = None
+        self.boss_assets_cache = {}  # boss filename -> (image, base_name, animation_frames)
         
         # Load Back3.png from UI folder (same as level selection screen)
         back3_path = os.path.join("UI", "Back3.png")
         if os.path.exists(back3_path):
             self.background = pygame.image.load(back3_path).convert()
-            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
         else:
             print("WARNING: Back3.png not found:", back3_path)
             self.background = None
@@ -5018,57 +4976,136 @@ class BossPage:
         koordinates_path = os.path.join("RoundPage", "Koordinates.png")
         if os.path.exists(koordinates_path):
             self.koordinates = pygame.image.load(koordinates_path).convert_alpha()
-            self.koordinates = pygame.transform.smoothscale(self.koordinates, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert_alpha()
+            self.koordinates = pygame.transform.smoothscale(self.koordinates, (SCREEN_WIDTH, SCREEN_HEIGHT))
         else:
             print("WARNING: Koordinates.png not found:", koordinates_path)
             self.koordinates = None
         
-        # Load bosses for current round index based on defeated_count
-        round_index = self.defeated_count if self.defeated_count >= 0 else 0
-        bosses_for_round = LEVEL_BOSS_ROUNDS.get(self.level_number, [[]])
-        if round_index >= len(bosses_for_round):
-            round_index = len(bosses_for_round) - 1 if bosses_for_round else 0
-        self.current_boss_filenames = bosses_for_round[round_index] if bosses_for_round else []
-        
-        # Boss collections
-        self.bosses = []  # Default boss images (non-animated)
-        self.boss_rects = []
-        self.boss_animation_frames = []  # Animation frames for each boss
-        self.boss_base_names = []  # Base names for finding animation folders
-        
         # Animation sequence: 0,1,2,3,2,1,0,4,5,6,5,4,0 and loop
         self.animation_sequence = [0, 1, 2, 3, 2, 1, 0, 4, 5, 6, 5, 4]
         self.animation_frame_duration = 100  # milliseconds per frame
-        self.boss_hover_states = {}  # Track which boss is hovered and animation state
         
         # Load PopUp.png
         popup_path = os.path.join("Bosses", "PopUp.png")
         if os.path.exists(popup_path):
             popup_original = pygame.image.load(popup_path).convert_alpha()
             # Scale to 250x375 pixels
-            self.popup_image = pygame.transform.smoothscale(popup_original, (250, 375)).convert_alpha()
+            self.popup_image = pygame.transform.smoothscale(popup_original, (250, 375))
         else:
             print(f"WARNING: PopUp.png not found: {popup_path}")
             self.popup_image = None
         
-        # PopUp animation state
         # Start fully hidden above the screen (+50px extra so it never "peeks" on page entry)
         self.popup_hidden_y = (
             -float(self.popup_image.get_height()) - 50.0 if self.popup_image else -400.0
         )
+        self.popup_speed_pps = 1400.0  # pixels per second
+        
+        # Load font for PopUp text
+        self.popup_font = get_font(font_path, 24)
+        
+        # Load PopUpReward text from Lang.csv (header before reward text)
+        self.popup_reward_header = get_text("PopUpReward", "PopUpReward")
+        
+        # Load Pen sound
+        pen_sound_path = os.path.join("Sounds", "Pen.mp3")
+        if os.path.exists(pen_sound_path):
+            self.pen_sound = pygame.mixer.Sound(pen_sound_path)
+        else:
+            print(f"WARNING: Pen.mp3 not found at {pen_sound_path}")
+            self.pen_sound = None
+        
+        # Line drawing style
+        self.line_color = (110, 90, 70)
+        self.line_width = 10
+        
+        self.reset(
+            level_number,
+            defeated_count=defeated_count,
+            last_defeated_rect=last_defeated_rect,
+            saved_lines=saved_lines,
+            defeated_bosses=defeated_bosses,
+        )
+    
+    def _load_boss_assets(self, boss_filename):
+        """Load (and cache) a boss image, its base name and its hover animation frames."""
+        if boss_filename in self.boss_assets_cache:
+            return self.boss_assets_cache[boss_filename]
+        
+        boss_path = os.path.join("Bosses", boss_filename)
+        if not os.path.exists(boss_path):
+            print(f"WARNING: Boss file not found: {boss_path}")
+            assets = (None, None, [])
+            self.boss_assets_cache[boss_filename] = assets
+            return assets
+        
+        boss_image = pygame.image.load(boss_path).convert_alpha()
+        # Scale to 100x100
+        boss_image = pygame.transform.smoothscale(boss_image, (100, 100))
+        
+        # Extract base name (e.g., "1_Watt.png" -> "1_Watt")
+        base_name = os.path.splitext(boss_filename)[0]
+        
+        # Load animation frames from boss folder
+        boss_folder = os.path.join("Bosses", base_name)
+        animation_frames = []
+        if os.path.exists(boss_folder) and os.path.isdir(boss_folder):
+            # Load frames 0-6
+            for frame_num in range(7):
+                frame_filename = f"{base_name}{frame_num}.png"
+                frame_path = os.path.join(boss_folder, frame_filename)
+                if os.path.exists(frame_path):
+                    frame_image = pygame.image.load(frame_path).convert_alpha()
+                    frame_image = pygame.transform.smoothscale(frame_image, (100, 100))
+                    animation_frames.append(frame_image)
+                else:
+                    print(f"WARNING: Animation frame not found: {frame_path}")
+        else:
+            print(f"WARNING: Boss animation folder not found: {boss_folder}")
+        
+        assets = (boss_image, base_name, animation_frames)
+        self.boss_assets_cache[boss_filename] = assets
+        return assets
+    
+    def reset(self, level_number, defeated_count=0, last_defeated_rect=None, saved_lines=None, defeated_bosses=None):
+        """Re-apply per-visit state (level, progress, lines) without reloading static assets."""
+        self.level_number = level_number
+        self.defeated_count = defeated_count
+        self.last_defeated_rect = last_defeated_rect
+        # Shared with the caller's list: never mutated in place (copy-on-write on boss click)
+        self.saved_lines = saved_lines if isinstance(saved_lines, list) else list(saved_lines or [])
+        self.defeated_bosses = list(defeated_bosses) if defeated_bosses else []
+        self.clicked_boss_filename = None
+        self.clicked_boss_rect = None
+        
+        # Load bosses for current round index based on defeated_count
+        round_index = self.defeated_count if self.defeated_count >= 0 else 0
+        bosses_for_round = LEVEL_BOSS_ROUNDS.get(self.level_number, [[]])
+        if round_index >= len(bosses_for_round):
+            round_index = len(bosses_for_round) - 1 if bosses_for_round else 0
+        self.current_boss_filenames = bosses_for_round[round_index] if bosses_for_round else []
+        
+        # Boss collections
+        self.bosses = []  # Default boss images (non-animated)
+        self.boss_rects = []
+        self.boss_animation_frames = []  # Animation frames for each boss
+        self.boss_base_names = []  # Base names for finding animation folders
+        self.boss_hover_states = {}  # Track which boss is hovered and animation state
+        
+        # PopUp animation state
         self.popup_y = float(self.popup_hidden_y)  # Start above screen (hidden) - float for smooth motion
         self.popup_x = 0
         self.popup_target_y = float(self.popup_hidden_y)  # Target Y position
-        self.popup_speed_pps = 1400.0  # pixels per second
         self._popup_last_tick = pygame.time.get_ticks()
         self.current_hovered_boss_index = None  # Track which boss is hovered for PopUp
         self.popup_boss_index = None  # Track which boss text to show (persists until PopUp hides)
         
-        # Load font for PopUp text
-        self.popup_font = pygame.font.Font(font_path, 24)
-        
-        # Load PopUpReward text from Lang.csv (header before reward text)
-        self.popup_reward_header = get_text("PopUpReward", "PopUpReward")
+        # What was last pushed to the display (see _present_frame)
+        self._needs_full_flip = True
+        self._last_popup_rect = None
+        self._last_popup_boss_index = None
+        self._last_line = None
+        self._last_boss_frames = ()
         
         # Determine bosses_required for this level
         rounds_config = load_rounds_config()
@@ -5097,57 +5134,17 @@ class BossPage:
                     reward_key = f"Boss{boss_number}Reward"
                     self.boss_rewards[boss_idx] = get_text(reward_key, reward_key)
         
-        # Load Pen sound
-        pen_sound_path = os.path.join("Sounds", "Pen.mp3")
-        if os.path.exists(pen_sound_path):
-            self.pen_sound = pygame.mixer.Sound(pen_sound_path)
-        else:
-            print(f"WARNING: Pen.mp3 not found at {pen_sound_path}")
-            self.pen_sound = None
-        
         # Line drawing state
-        self.line_color = (110, 90, 70)
-        self.line_width = 10
         self.current_line = None  # (start_x, start_y, end_x, end_y) when hovering
-        # saved_lines already copied in __init__
+        # saved_lines already set above
         self.last_hovered_boss = None  # Track to play sound only once per hover
         
         if self.current_boss_filenames:
             for boss_filename in self.current_boss_filenames:
-                boss_path = os.path.join("Bosses", boss_filename)
-                if os.path.exists(boss_path):
-                    boss_image = pygame.image.load(boss_path).convert_alpha()
-                    # Scale to 100x100
-                    boss_image = pygame.transform.smoothscale(boss_image, (100, 100)).convert_alpha()
-                    self.bosses.append(boss_image)
-                    
-                    # Extract base name (e.g., "1_Watt.png" -> "1_Watt")
-                    base_name = os.path.splitext(boss_filename)[0]
-                    self.boss_base_names.append(base_name)
-                    
-                    # Load animation frames from boss folder
-                    boss_folder = os.path.join("Bosses", base_name)
-                    animation_frames = []
-                    if os.path.exists(boss_folder) and os.path.isdir(boss_folder):
-                        # Load frames 0-6
-                        for frame_num in range(7):
-                            frame_filename = f"{base_name}{frame_num}.png"
-                            frame_path = os.path.join(boss_folder, frame_filename)
-                            if os.path.exists(frame_path):
-                                frame_image = pygame.image.load(frame_path).convert_alpha()
-                                frame_image = pygame.transform.smoothscale(frame_image, (100, 100)).convert_alpha()
-                                animation_frames.append(frame_image)
-                            else:
-                                print(f"WARNING: Animation frame not found: {frame_path}")
-                    else:
-                        print(f"WARNING: Boss animation folder not found: {boss_folder}")
-                    
-                    self.boss_animation_frames.append(animation_frames)
-                else:
-                    print(f"WARNING: Boss file not found: {boss_path}")
-                    self.bosses.append(None)
-                    self.boss_base_names.append(None)
-                    self.boss_animation_frames.append([])
+                boss_image, base_name, animation_frames = self._load_boss_assets(boss_filename)
+                self.bosses.append(boss_image)
+                self.boss_base_names.append(base_name)
+                self.boss_animation_frames.append(animation_frames)
         
         # Load defeated bosses passed in state (keep their positions)
         if saved_lines and isinstance(saved_lines, dict) and saved_lines.get("defeated_bosses"):
@@ -5230,7 +5227,7 @@ class BossPage:
                 self.last_hovered_boss = hovered_boss
         else:
             # Move PopUp back above screen when not hovering
-            self.popup_target_y = float(getattr(self, "popup_hidden_y", -400.0))
+            self.popup_target_y = float(self.popup_hidden_y)
             self.current_hovered_boss_index = None
             # Don't clear popup_boss_index here - let it persist until PopUp is hidden
             self.current_line = None  # Clear line when not hovering
@@ -5254,6 +5251,10 @@ class BossPage:
             if event.type == pygame.QUIT:
                 return "quit"
             
+            # Window content was lost (uncovered/restored): push the whole frame again
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._needs_full_flip = True
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return "back"
@@ -5265,14 +5266,14 @@ class BossPage:
                         if boss_rect.collidepoint(mouse_pos):
                             # Save line coordinates when clicking
                             if self.current_line:
-                                self.saved_lines.append(self.current_line)
+                                self.saved_lines = self.saved_lines + [self.current_line]
                             # Remember clicked boss rect
                             self.clicked_boss_rect = boss_rect.copy()
                             # Remember clicked boss filename
                             if i < len(self.current_boss_filenames):
                                 self.clicked_boss_filename = self.current_boss_filenames[i]
-                            # Return boss selection (level_number, boss_index)
-                            return f"boss_{self.level_number}_{i}"
+                            # Return boss selection as ("boss", level_number, boss_index)
+                            return ("boss", self.level_number, i)
         
         return None
     
@@ -5289,10 +5290,10 @@ class BossPage:
         
         # Update PopUp position with dt-based smooth animation (stable across FPS)
         now = pygame.time.get_ticks()
-        dt = (now - getattr(self, "_popup_last_tick", now)) / 1000.0
+        dt = (now - self._popup_last_tick) / 1000.0
         self._popup_last_tick = now
         dt = _clamp_dt_seconds(dt)
-        max_delta = float(getattr(self, "popup_speed_pps", 0.0)) * dt
+        max_delta = self.popup_speed_pps * dt
         self.popup_y = move_towards(float(self.popup_y), float(self.popup_target_y), max_delta)
         
         # Draw saved lines (if bosses were clicked)
@@ -5308,9 +5309,8 @@ class BossPage:
         
         # Draw defeated bosses (persist on screen)
         for defeated in self.defeated_bosses:
-            filename = defeated.get("filename")
-            rect = defeated.get("rect")
-            if not filename or not rect:
+            filename = defeated.filename
+            if not filename:
                 continue
             if filename in self.boss_image_cache:
                 img = self.boss_image_cache[filename]
@@ -5319,13 +5319,14 @@ class BossPage:
                 img = None
                 if os.path.exists(path):
                     img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.smoothscale(img, (100, 100)).convert_alpha()
+                    img = pygame.transform.smoothscale(img, (100, 100))
                 self.boss_image_cache[filename] = img
             if img:
-                self.screen.blit(img, rect.topleft)
+                self.screen.blit(img, (defeated.x, defeated.y))
         
         # Update animations and draw bosses
         current_time = pygame.time.get_ticks()
+        boss_frames = []  # Frame shown for each boss this frame (-1 = default image)
         
         for i, (boss_image, boss_rect) in enumerate(zip(self.bosses, self.boss_rects)):
             # Check if this boss is being hovered and has animation frames
@@ -5345,17 +5346,22 @@ class BossPage:
                 # Draw animated frame if available
                 if frame_index < len(self.boss_animation_frames[i]):
                     self.screen.blit(self.boss_animation_frames[i][frame_index], boss_rect.topleft)
+                    boss_frames.append(frame_index)
                 else:
                     # Fallback to default image if frame not available
                     self.screen.blit(boss_image, boss_rect.topleft)
+                    boss_frames.append(-1)
             else:
                 # Draw default boss image when not hovered
                 self.screen.blit(boss_image, boss_rect.topleft)
+                boss_frames.append(-1)
         
         # Draw PopUp if it's visible (not completely above screen)
+        popup_rect = None
         if self.popup_image and self.popup_y > -self.popup_image.get_height():
             popup_y_draw = int(round(self.popup_y))
-            self.screen.blit(self.popup_image, (self.popup_x, popup_y_draw))
+            # Grows to cover the text drawn on the PopUp (used as its dirty rect)
+            popup_rect = self.screen.blit(self.popup_image, (self.popup_x, popup_y_draw))
             
             # Draw text on PopUp if a boss text is available (persists until PopUp hides)
             if self.popup_boss_index is not None and self.popup_boss_index in self.boss_texts:
@@ -5370,8 +5376,7 @@ class BossPage:
                 current_width = 0
                 
                 for word in words:
-                    word_surface = self.popup_font.render(word + " ", True, PAPER_COLOR)
-                    word_width = word_surface.get_width()
+                    word_width = self.popup_font.size(word + " ")[0]
                     
                     if current_width + word_width <= max_width:
                         current_line.append(word)
@@ -5392,14 +5397,14 @@ class BossPage:
                 
                 for i, line in enumerate(lines):
                     text_surface = self.popup_font.render(line, True, PAPER_COLOR)
-                    self.screen.blit(text_surface, (text_start_x, text_start_y + i * line_height))
+                    popup_rect.union_ip(self.screen.blit(text_surface, (text_start_x, text_start_y + i * line_height)))
                 
                 # Then, draw PopUpReward header and boss reward below the description (if available)
                 if self.popup_boss_index in self.boss_rewards:
                     # Draw PopUpReward header ("Награда за победу:")
                     reward_header_y = text_start_y + len(lines) * line_height + 15  # 15px spacing between description and header
                     header_surface = self.popup_font.render(self.popup_reward_header, True, PAPER_COLOR)
-                    self.screen.blit(header_surface, (text_start_x, reward_header_y))
+                    popup_rect.union_ip(self.screen.blit(header_surface, (text_start_x, reward_header_y)))
                     reward_text = self.boss_rewards[self.popup_boss_index]
                     
                     # Split reward text into multiple lines
@@ -5409,8 +5414,7 @@ class BossPage:
                     reward_current_width = 0
                     
                     for word in reward_words:
-                        word_surface = self.popup_font.render(word + " ", True, PAPER_COLOR)
-                        word_width = word_surface.get_width()
+                        word_width = self.popup_font.size(word + " ")[0]
                         
                         if reward_current_width + word_width <= max_width:
                             reward_current_line.append(word)
@@ -5429,36 +5433,79 @@ class BossPage:
                     
                     for i, line in enumerate(reward_lines):
                         reward_surface = self.popup_font.render(line, True, PAPER_COLOR)
-                        self.screen.blit(reward_surface, (text_start_x, reward_start_y + i * line_height))
+                        popup_rect.union_ip(self.screen.blit(reward_surface, (text_start_x, reward_start_y + i * line_height)))
         else:
             # PopUp is completely hidden, clear the boss index for text
             if self.popup_boss_index is not None:
                 self.popup_boss_index = None
         
-        pygame.display.flip()
+        self._present_frame(popup_rect, boss_frames)
+    
+    def _present_frame(self, popup_rect, boss_frames):
+        """Push the frame to the display: skip it, update dirty rects or flip, depending on what changed"""
+        if self._needs_full_flip:
+            pygame.display.flip()
+            self._needs_full_flip = False
+        else:
+            dirty_rects = []
+            # PopUp slid or switched boss text
+            if popup_rect != self._last_popup_rect or self.popup_boss_index != self._last_popup_boss_index:
+                dirty_rects.extend(rect for rect in (self._last_popup_rect, popup_rect) if rect)
+            # Hover line appeared, moved or disappeared
+            if self.current_line != self._last_line:
+                for line in (self._last_line, self.current_line):
+                    if line:
+                        start_x, start_y, end_x, end_y = line
+                        line_rect = pygame.Rect(min(start_x, end_x), min(start_y, end_y), abs(end_x - start_x), abs(end_y - start_y))
+                        dirty_rects.append(line_rect.inflate(self.line_width * 2, self.line_width * 2))
+            # Boss hover animation advanced or stopped
+            for i, frame in enumerate(boss_frames):
+                if i >= len(self._last_boss_frames) or frame != self._last_boss_frames[i]:
+                    dirty_rects.append(self.boss_rects[i])
+            
+            if dirty_rects:
+                # Many or large rects cost more than a single flip
+                screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+                if len(dirty_rects) > 50 or sum(rect.w * rect.h for rect in dirty_rects) > screen_area // 4:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty_rects)
+        
+        self._last_popup_rect = popup_rect
+        self._last_popup_boss_index = self.popup_boss_index
+        self._last_line = self.current_line
+        self._last_boss_frames = tuple(boss_frames)
     
     def run(self):
+        # Other pages drew over the display since this page was last shown
+        self._needs_full_flip = True
+        
         while True:
             result = self.handle_input()
             
-            if result == "quit":
+            if result == RESULT_QUIT:
                 pygame.quit()
                 sys.exit()
             
-            if result == "back":
-                return "back"
+            if result == RESULT_BACK:
+                return RESULT_BACK
             
-            if result and result.startswith("boss_"):
+            if isinstance(result, tuple) and result[0] == "boss":
                 return result
             
             self.draw()
             self.clock.tick(FPS)
+    
+    def close(self):
+        """Drop cached boss images/animation frames (called when navigation ends)"""
+        self.boss_assets_cache.clear()
+        self.boss_image_cache.clear()
 
 
 class RoundPage:
-    def __init__(self, screen, font_path, level_number, boss_index, boss_filename=None, test_mode=False, defeated_count=0):
+    def __init__(self, screen, font_path, level_number, boss_index, boss_filename=None, test_mode=False, defeated_count=0, clock=None):
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.clock = clock if clock is not None else pygame.time.Clock()
         self.level_number = level_number
         self.boss_index = boss_index
         self.boss_filename = boss_filename
@@ -5479,7 +5526,7 @@ class RoundPage:
         back3_path = os.path.join("UI", "Back3.png")
         if os.path.exists(back3_path):
             self.background = pygame.image.load(back3_path).convert()
-            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.background = pygame.transform.smoothscale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
         else:
             print("WARNING: Back3.png not found:", back3_path)
             self.background = None
@@ -5488,7 +5535,7 @@ class RoundPage:
         koordinates_path = os.path.join("RoundPage", "Koordinates.png")
         if os.path.exists(koordinates_path):
             self.koordinates = pygame.image.load(koordinates_path).convert_alpha()
-            self.koordinates = pygame.transform.smoothscale(self.koordinates, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert_alpha()
+            self.koordinates = pygame.transform.smoothscale(self.koordinates, (SCREEN_WIDTH, SCREEN_HEIGHT))
         else:
             print("WARNING: Koordinates.png not found:", koordinates_path)
             self.koordinates = None
@@ -5504,7 +5551,7 @@ class RoundPage:
             # Scale down by 5x (divide by 5)
             new_width = button_e_original.get_width() // 5
             new_height = button_e_original.get_height() // 5
-            self.button_e = pygame.transform.smoothscale(button_e_original, (new_width, new_height)).convert_alpha()
+            self.button_e = pygame.transform.smoothscale(button_e_original, (new_width, new_height))
         else:
             print("WARNING: LevelButtonE not found:", button_e_path)
             self.button_e = None
@@ -5514,7 +5561,7 @@ class RoundPage:
             # Scale down by 5x (divide by 5)
             new_width = button_m_original.get_width() // 5
             new_height = button_m_original.get_height() // 5
-            self.button_m = pygame.transform.smoothscale(button_m_original, (new_width, new_height)).convert_alpha()
+            self.button_m = pygame.transform.smoothscale(button_m_original, (new_width, new_height))
         else:
             print("WARNING: LevelButtonM not found:", button_m_path)
             self.button_m = None
@@ -5524,7 +5571,7 @@ class RoundPage:
             # Scale down by 5x (divide by 5)
             new_width = button_h_original.get_width() // 5
             new_height = button_h_original.get_height() // 5
-            self.button_h = pygame.transform.smoothscale(button_h_original, (new_width, new_height)).convert_alpha()
+            self.button_h = pygame.transform.smoothscale(button_h_original, (new_width, new_height))
         else:
             print("WARNING: LevelButtonH not found:", button_h_path)
             self.button_h = None
@@ -5561,27 +5608,34 @@ class RoundPage:
         # For example, Robert Fulton (boss 3) has "LevelRounds=LevelRounds+1" in BossRewards.csv
         # Use defeated_count to correctly determine boss number (especially for level 2, round 1 bosses 4 and 5)
         boss_number = self.boss_number
-        print(f"DEBUG RoundPage.__init__: level_number={self.level_number}, boss_index={self.boss_index}, defeated_count={self.defeated_count}, boss_number={boss_number}, rounds_required before={self.rounds_required}")
+        if DEBUG:
+            print(f"DEBUG RoundPage.__init__: level_number={self.level_number}, boss_index={self.boss_index}, defeated_count={self.defeated_count}, boss_number={boss_number}, rounds_required before={self.rounds_required}")
         if boss_number:
             boss_rewards = load_boss_rewards()
             boss_entry = boss_rewards.get(boss_number)
-            print(f"DEBUG: boss_entry={boss_entry}, type={type(boss_entry)}")
+            if DEBUG:
+                print(f"DEBUG: boss_entry={boss_entry}, type={type(boss_entry)}")
             if boss_entry and isinstance(boss_entry, dict):
                 func_string = boss_entry.get("Functionalities", "").strip()
-                print(f"DEBUG: func_string='{func_string}'")
+                if DEBUG:
+                    print(f"DEBUG: func_string='{func_string}'")
                 if func_string:
                     old_rounds = self.rounds_required
                     self._apply_level_rounds_functionality(func_string)
-                    print(f"DEBUG: Applied functionality. rounds_required: {old_rounds} -> {self.rounds_required}")
-                else:
+                    if DEBUG:
+                        print(f"DEBUG: Applied functionality. rounds_required: {old_rounds} -> {self.rounds_required}")
+                elif DEBUG:
                     print(f"DEBUG: func_string is empty or None")
-            else:
+            elif DEBUG:
                 print(f"DEBUG: boss_entry is None or not a dict")
-        else:
+        elif DEBUG:
             print(f"DEBUG: boss_number is None or falsy")
         
         # Track completed rounds: integers starting at 1
         self.completed_rounds = set()
+        # Cached get_current_active_round() result; cleared when a round is completed
+        self._active_round_cached = False
+        self._active_round = None
         # Store selected button per round: {round_num: {"key": "e/m/h", "rect": Rect}}
         self.round_selections = {}
         
@@ -5720,7 +5774,7 @@ class RoundPage:
             # Scale down by 2x and then reduce by 20% (reduce to 40% of original size)
             scaled_width = int((original_width // 2) * 0.8)
             scaled_height = int((original_height // 2) * 0.8)
-            self.popup_image = pygame.transform.smoothscale(popup_original, (scaled_width, scaled_height)).convert_alpha()
+            self.popup_image = pygame.transform.smoothscale(popup_original, (scaled_width, scaled_height))
             # Store popup width for positioning calculations
             self.popup_width = scaled_width
         else:
@@ -5740,13 +5794,22 @@ class RoundPage:
         self._popup_last_tick = pygame.time.get_ticks()
         self.popup_button = None  # Track which button text to show (persists until PopUp hides)
         
+        # Dirty-rect display updates: full flip on the first frame and whenever the page changes
+        self._needs_full_flip = True
+        self._last_scene_key = None
+        self._last_popup_rect = None
+        
         # Load font for PopUp text
-        self.popup_font = pygame.font.Font(font_path, 24)
+        self.popup_font = get_font(font_path, 24)
+        self._line_height = self.popup_font.get_height() + 5  # 5px spacing between PopUp text lines
         
         # Load PopUpRound text from Lang.csv
         self.popup_round_text = get_text("PopUpRound", "PopUpRound")
         # Load PopUpReward text from Lang.csv
         self.popup_reward_text = get_text("PopUpReward", "PopUpReward")
+        # Specialized PopUp draw function (see _make_popup_draw_fn), rebuilt when its key changes
+        self._popup_draw_fn = None
+        self._popup_draw_fn_key = None
         
         # Store boss reward text for PopUp on RoundPage.
         # Prefer deriving the boss number from the filename so this works for any boss roster.
@@ -5811,23 +5874,25 @@ class RoundPage:
                                 reward_entry = {
                                     'reward1': reward1_list,
                                     'reward2': reward2_list if reward2_list else None,
-                                    'text': reward_text if reward_text else None
+                                    'text': reward_text if reward_text else None,
+                                    # Translated Text, resolved once here instead of in the PopUp drawing code
+                                    'text_value': get_text(reward_text, reward_text) if reward_text else None
                                 }
                                 self.rewards[(level, round_num, button)] = reward_entry
-            except Exception as e:
+            except (OSError, ValueError, csv.Error) as e:
                 print(f"ERROR loading rewards file: {e}")
-                import traceback
                 traceback.print_exc()
         
         # Load RandomDropGain.png image for random rewards
         random_drop_path = os.path.join("RoundPage", "RandomDropGain.png")
         if os.path.exists(random_drop_path):
             random_drop_original = pygame.image.load(random_drop_path).convert_alpha()
-            # Scale to match PopUp card size (100x172)
+            # Scale to the PopUp card size (100x172 shown at 75%) once here, not on every draw
             target_width = 100
             market_card_ratio = 99 / 171.0
             target_height = int(target_width / market_card_ratio)
-            self.random_drop_image = pygame.transform.smoothscale(random_drop_original, (target_width, target_height)).convert_alpha()
+            popup_size = (int(target_width * 0.75), int(target_height * 0.75))
+            self.random_drop_image = pygame.transform.smoothscale(random_drop_original, popup_size)
         else:
             print(f"WARNING: RandomDropGain.png not found: {random_drop_path}")
             self.random_drop_image = None
@@ -5836,43 +5901,28 @@ class RoundPage:
         random_red_path = os.path.join("RoundPage", "RandomRed.png")
         if os.path.exists(random_red_path):
             random_red_original = pygame.image.load(random_red_path).convert_alpha()
-            # Scale to match PopUp card size (100x172)
+            # Scale to the PopUp card size (100x172 shown at 75%) once here, not on every draw
             target_width = 100
             market_card_ratio = 99 / 171.0
             target_height = int(target_width / market_card_ratio)
-            self.random_red_image = pygame.transform.smoothscale(random_red_original, (target_width, target_height)).convert_alpha()
+            popup_size = (int(target_width * 0.75), int(target_height * 0.75))
+            self.random_red_image = pygame.transform.smoothscale(random_red_original, popup_size)
         else:
             print(f"WARNING: RandomRed.png not found: {random_red_path}")
             self.random_red_image = None
         
         # Cache for loaded reward card images
         self.reward_card_images = {}
+        # CardAction/CardTurns font file for reward cards (prefer Gadugib), resolved once
+        self.card_font_base = "Gadugib.ttf" if asset_exists("Gadugib.ttf") else font_path
+        # Cache of PopUp reward card layouts: {(level, round, button): ((Surface, x_offset), ...)}
+        self._popup_layout_cache = {}
         
-        # Card base mapping: which base image to use for each card
-        # Cards 11, 12, 13, 14 use Card_11.png as base
-        # Cards 15, 16 use Card_15.png as base
-        # Cards 17, 18 use Card_17.png as base
-        self.card_base_mapping = {}
-        for card_id in (1, 2, 3, 4, 100):
-            self.card_base_mapping[card_id] = card_id  # Original cards use their own images
-        self.card_base_mapping[11] = 11
-        self.card_base_mapping[12] = 11
-        self.card_base_mapping[13] = 11
-        self.card_base_mapping[14] = 11
-        self.card_base_mapping[15] = 15
-        self.card_base_mapping[16] = 15
-        self.card_base_mapping[17] = 17
-        self.card_base_mapping[18] = 17
-        
-        # Card actions and turns for dynamic cards
-        self.card_actions = {
-            11: 2, 12: 2, 13: 4, 14: 4,
-            15: -2, 16: -2, 17: 2, 18: 2
-        }
-        self.card_turns = {
-            11: 1, 13: 1, 12: 2, 14: 2,
-            15: 1, 16: 2, 17: 1, 18: 2
-        }
+        # Preload the reward cards (and their PopUp layouts) for this level, so hovering a round
+        # button never loads images from disk inside draw()
+        for reward_key, reward_data in self.rewards.items():
+            if reward_key[0] == self.level_number:
+                self._get_reward_cards_layout(reward_key, reward_data)
         
         # Load Pen sound
         pen_sound_path = os.path.join("Sounds", "Pen.mp3")
@@ -6066,38 +6116,231 @@ class RoundPage:
         target_height = int(target_width / market_card_ratio)
         
         # Check if this card uses a base card (cards 11-18)
-        base_card_id = self.card_base_mapping.get(card_number, card_number)
-        card_path = os.path.join("Cards", f"Card_{base_card_id}.png")
+        base_card_id = CARD_BASE_IDS.get(card_number, card_number)
+        card_path = card_image_path(base_card_id)
         
-        if not os.path.exists(card_path):
-            print(f"WARNING: Reward card base not found: {card_path}")
+        if not card_path:
+            print(f"WARNING: Reward card base not found: Card_{base_card_id}.png")
             self.reward_card_images[card_number] = None
             return None
         
-        # Load base card image
-        card_image = pygame.image.load(card_path).convert_alpha()
+        # Load base card image (cached original; the scaled copy below is the one drawn on)
+        card_image = load_image(card_path)
         
-        # First scale to final PopUp size
-        card_surface = pygame.transform.smoothscale(card_image, (target_width, target_height)).convert_alpha()
+        # First scale to the 100px card size the CardAction/CardTurns offsets are tuned for
+        # (smoothscale keeps card_image's display format, no second convert needed)
+        card_surface = pygame.transform.smoothscale(card_image, (target_width, target_height))
         
         # If this card has CardAction or CardTurns, draw them on the scaled card
-        if card_number in self.card_actions or card_number in self.card_turns:
+        if card_number in CARD_ACTIONS or card_number in CARD_TURNS:
             # Draw CardAction if this card has one
-            if card_number in self.card_actions:
-                action_value = self.card_actions[card_number]
+            if card_number in CARD_ACTIONS:
+                action_value = CARD_ACTIONS[card_number]
                 self._draw_card_action_on_surface(card_surface, action_value, card_number, target_width, target_height)
             
             # Draw CardTurns if this card has one
-            if card_number in self.card_turns:
-                turns_value = self.card_turns[card_number]
+            if card_number in CARD_TURNS:
+                turns_value = CARD_TURNS[card_number]
                 self._draw_card_turns_on_surface(card_surface, turns_value, card_number, target_width, target_height)
+        
+        # The PopUp shows reward cards at 75%; scale the finished card once here instead of on every draw
+        card_surface = pygame.transform.smoothscale(
+            card_surface, (int(target_width * 0.75), int(target_height * 0.75))
+        )
+        self.reward_card_images[card_number] = card_surface
+        return card_surface
+    
+    def _get_reward_cards_layout(self, reward_key, reward_data):
+        """Return PopUp reward card slots for a (level, round, button) key as (surface, x_offset) pairs.
+
+        x_offset is relative to the PopUp's left edge. The result only depends on Rewards.csv data,
+        so it is built once per key and reused by every draw() call.
+        """
+        layout = self._popup_layout_cache.get(reward_key)
+        if layout is not None:
+            return layout
+        
+        slots = []
+        reward1_list = reward_data.get('reward1', [])
+        # Normalize Reward2 once (Rewards.csv stores a list of cards or None) and use the list everywhere below
+        reward2 = reward_data.get('reward2')
+        reward2_list = reward2 if isinstance(reward2, list) else ([reward2] if reward2 is not None else [])
+        
+        if reward1_list:
+            reward1_surface = self._get_reward_slot_surface(reward1_list)
+            # Optional Reward2, so E can show 2 rewards even when Reward2 is a single card
+            reward2_surface = self._get_reward_slot_surface(reward2_list) if reward2_list else None
             
-            self.reward_card_images[card_number] = card_surface
-            return card_surface
+            if reward1_surface is not None:
+                # Calculate total width for cards with spacing
+                card_spacing_between = 10  # Spacing between cards
+                total_cards_width = reward1_surface.get_width()
+                if reward2_surface is not None:
+                    total_cards_width += card_spacing_between + reward2_surface.get_width()
+                
+                # Center both cards together: Reward1 on the left, Reward2 on the right
+                cards_start_x = (self.popup_width - total_cards_width) // 2
+                slots.append((reward1_surface, cards_start_x))
+                if reward2_surface is not None:
+                    cards_start_x += reward1_surface.get_width() + card_spacing_between
+                    slots.append((reward2_surface, cards_start_x))
+        
+        layout = tuple(slots)
+        self._popup_layout_cache[reward_key] = layout
+        return layout
+    
+    def _get_reward_slot_surface(self, reward_list):
+        """Return the PopUp image for one Rewards.csv reward slot (Reward1 or Reward2).
+
+        Random rewards show an icon instead of a card: the "Red Card" token -> RandomRed.png,
+        a legacy pool of several cards 10-19 -> RandomDropGain.png. Otherwise the first card is shown.
+        """
+        has_random_red = REWARD_TOKEN_RANDOM_RED in reward_list
+        if has_random_red and self.random_red_image:
+            return self.random_red_image
+        has_random_reward = (not has_random_red) and len(reward_list) > 1 and any(
+            isinstance(card, int) and 10 <= card <= 19 for card in reward_list
+        )
+        if has_random_reward and self.random_drop_image:
+            return self.random_drop_image
+        return self._load_reward_card(reward_list[0])
+    
+    def _make_popup_draw_fn(self, current_active_round):
+        """Resolve everything the PopUp shows for the hovered button/boss and return a blit-only function.
+
+        The returned function takes the animated PopUp y and returns the blitted Rect; draw() rebuilds it
+        only when the hovered button, the active round or the language changes.
+        """
+        screen_blit = self.screen.blit
+        # Plain PopUp background when no button or boss is hovered
+        if self.popup_button is None:
+            popup_image = self.popup_image
+            return lambda popup_y_draw: screen_blit(popup_image, (self.popup_x, popup_y_draw))
+        
+        if self.popup_button == "boss":
+            # Boss is hovered - show the same structure as regular rounds:
+            # PopUpRound + Goal$, then PopUpReward + boss reward text below.
+            if self.level_number == 2:
+                e_boss_goal = get_level2_goal(None, "e", self.boss_selection, True)
+                m_boss_goal = get_level2_goal(None, "m", self.boss_selection, True)
+                goal_value = e_boss_goal if e_boss_goal is not None else (m_boss_goal if m_boss_goal is not None else 0)
+            elif self.level_number == 3:
+                e_boss_goal = get_level3_goal(None, "e", self.defeated_count, True)
+                m_boss_goal = get_level3_goal(None, "m", self.defeated_count, True)
+                goal_value = e_boss_goal if e_boss_goal is not None else (m_boss_goal if m_boss_goal is not None else 0)
+            else:
+                boss_key = (self.level_number, self.boss_index)
+                goal_value = self.boss_goals.get(boss_key, 0)
+            if self.is_apper_boss:
+                goal_value = apper_goal_boost(goal_value) or 0
         else:
-            # Regular card, already scaled
-            self.reward_card_images[card_number] = card_surface
-            return card_surface
+            # Button is hovered
+            # Get goal value - for level 2, use current round; for others use button_goals
+            if self.level_number == 2:
+                if current_active_round is not None:
+                    goal_value = get_level2_goal(current_active_round, self.popup_button, self.boss_selection, False) or 0
+                else:
+                    goal_value = self.button_goals.get(self.popup_button, 0) or 0
+            elif self.level_number == 3:
+                if current_active_round is not None:
+                    goal_value = get_level3_goal(current_active_round, self.popup_button, self.defeated_count, False) or 0
+                else:
+                    goal_value = self.button_goals.get(self.popup_button, 0) or 0
+            else:
+                goal_value = self.button_goals.get(self.popup_button, 0) or 0
+            if self.is_apper_boss:
+                goal_value = apper_goal_boost(goal_value) or 0
+        
+        # Build text: PopUpRound text + goal + "$"
+        full_text = f"{self.popup_round_text} {goal_value}$"
+        
+        # Rewards.csv entry for the hovered round button, shared by the reward text and reward card
+        round_num = None
+        reward_key = None
+        reward_data = None
+        if self.popup_button in ("e", "m", "h"):
+            # Determine round number - use current active round
+            round_num = current_active_round
+            if round_num is None:
+                # Fallback: for level 2 use rounds_required, for others use button-based logic
+                if self.level_number == 2:
+                    round_num = self.rounds_required
+                elif self.popup_button == "e":
+                    round_num = 1
+                elif self.popup_button == "m":
+                    round_num = 2
+                else:
+                    round_num = 3
+            reward_key = (self.level_number, round_num, self.popup_button.upper())
+            reward_data = self.rewards.get(reward_key)
+        
+        composite = self._build_popup_composite(full_text, reward_key, reward_data)
+        return lambda popup_y_draw: screen_blit(composite, (self.popup_x, popup_y_draw))
+    
+    def _build_popup_composite(self, full_text, reward_key, reward_data):
+        """Render the PopUp background, texts and reward cards into one Surface in PopUp-local coordinates."""
+        items = []  # (surface, (x, y)) to draw on top of the PopUp background
+        
+        # Split text into multiple lines to fit in PopUp
+        popup_text_width = self.popup_width - 60  # Leave more padding (30px on each side) to prevent text overflow
+        lines = wrap_text_cached(full_text, self.popup_font, popup_text_width)
+        
+        # Draw text lines on PopUp on Round Page
+        text_start_x = 30  # Left padding + 30px right
+        text_start_y = 115  # Top padding + 5px down
+        line_height = self._line_height
+        
+        for i, line in enumerate(lines):
+            text_surface = self.popup_font.render(line, True, PAPER_COLOR)
+            items.append((text_surface, (text_start_x, text_start_y + i * line_height)))
+        
+        # Draw boss reward text below goal text (for boss hover)
+        if self.popup_button == "boss":
+            reward_text_y = text_start_y + len(lines) * line_height
+            reward_text_surface = self.popup_font.render(self.popup_reward_text, True, PAPER_COLOR)
+            items.append((reward_text_surface, (text_start_x, reward_text_y)))
+            
+            if self.boss_text:
+                boss_reward_lines = wrap_text_cached(self.boss_text, self.popup_font, popup_text_width)
+                reward_text_y += line_height
+                for i, line in enumerate(boss_reward_lines):
+                    reward_surface = self.popup_font.render(line, True, PAPER_COLOR)
+                    items.append((reward_surface, (text_start_x, reward_text_y + i * line_height)))
+        elif reward_key is not None:
+            # Round button E/M/H: reward text, its Rewards.csv description, then the reward cards
+            reward_text_y = text_start_y + len(lines) * line_height
+            reward_text_surface = self.popup_font.render(self.popup_reward_text, True, PAPER_COLOR)
+            items.append((reward_text_surface, (text_start_x, reward_text_y)))
+            
+            if reward_data:
+                # Draw additional text from Rewards.csv Text column if present
+                additional_text_lines_count = 0
+                additional_text_value = reward_data.get('text_value')
+                if additional_text_value:
+                    # Wrap additional text to fit in PopUp width
+                    additional_text_lines = wrap_text_cached(additional_text_value, self.popup_font, popup_text_width)
+                    additional_text_lines_count = len(additional_text_lines)
+                    for i, line in enumerate(additional_text_lines):
+                        additional_text_surface = self.popup_font.render(line, True, PAPER_COLOR)
+                        items.append((additional_text_surface, (text_start_x, reward_text_y + (i + 1) * line_height)))
+                
+                # Reward cards go below the reward text and its description
+                card_spacing = 5  # Spacing between reward text and card
+                card_y = reward_text_y + line_height + (additional_text_lines_count * line_height) + card_spacing
+                for card_surface, card_offset_x in self._get_reward_cards_layout(reward_key, reward_data):
+                    items.append((card_surface, (card_offset_x, card_y)))
+        
+        popup_width, popup_height = self.popup_image.get_size()
+        for item_surface, (item_x, item_y) in items:
+            popup_height = max(popup_height, item_y + item_surface.get_height())
+        composite = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+        composite.blit(self.popup_image, (0, 0))
+        composite.blits(items, doreturn=False)
+        return composite.convert_alpha()
+    
+    def _get_card_font(self, size):
+        """Return the shared CardAction/CardTurns font (prefer Gadugib) for a size."""
+        return get_font(self.card_font_base, size)
     
     def _draw_card_action_on_surface(self, surface, action_value, card_id, card_width, card_height):
         """Draw CardAction value on a card surface"""
@@ -6109,15 +6352,8 @@ class RoundPage:
         if scaled_font_size < 1:
             scaled_font_size = 1
         
-        # Load font (prefer Gadugib)
-        gadugib_path = "Gadugib.ttf"
-        if os.path.exists(gadugib_path):
-            font_path_use = gadugib_path
-        else:
-            font_path_use = self.font_path
-        
         try:
-            font = pygame.font.Font(font_path_use, scaled_font_size)
+            font = self._get_card_font(scaled_font_size)
             action_text = font.render(str(action_value), True, PAPER_COLOR)
             
             # Position near + sign (upper right area)
@@ -6145,15 +6381,8 @@ class RoundPage:
         if turns_font_size < 1:
             turns_font_size = 1
         
-        # Load font (prefer Gadugib)
-        gadugib_path = "Gadugib.ttf"
-        if os.path.exists(gadugib_path):
-            font_path_use = gadugib_path
-        else:
-            font_path_use = self.font_path
-        
         try:
-            font = pygame.font.Font(font_path_use, turns_font_size)
+            font = self._get_card_font(turns_font_size)
             turns_text = font.render(str(turns_value), True, PAPER_COLOR)
             
             # Position at bottom center
@@ -6166,7 +6395,7 @@ class RoundPage:
             turns_y = card_height - offset_from_bottom
             
             # Adjust for cards 17-18 - use market card sizes as base (same as GameplayPage uses card_size)
-            if card_id in (17, 18):
+            if card_id in CARD_MULTIPLIER_IDS:
                 # For PopUp cards, use market card sizes (99x171) as base, not bottom card sizes
                 base_market_width = 99.0
                 base_market_height = 171.0
@@ -6210,7 +6439,7 @@ class RoundPage:
                 if os.path.exists(boss_path):
                     boss_image = pygame.image.load(boss_path).convert_alpha()
                     # Scale to 100x100 (same as on BossPage)
-                    self.boss_icon = pygame.transform.smoothscale(boss_image, (100, 100)).convert_alpha()
+                    self.boss_icon = pygame.transform.smoothscale(boss_image, (100, 100))
                     
                     # Position boss relative to last selected round icon: +200 X, -70 Y
                     anchor_rect = self._get_prev_selection_rect() or self.button_e_rect or self.button_m_rect or self.button_h_rect
@@ -6233,7 +6462,7 @@ class RoundPage:
                             frame_path = os.path.join(boss_folder, frame_filename)
                             if os.path.exists(frame_path):
                                 frame_image = pygame.image.load(frame_path).convert_alpha()
-                                frame_image = pygame.transform.smoothscale(frame_image, (100, 100)).convert_alpha()
+                                frame_image = pygame.transform.smoothscale(frame_image, (100, 100))
                                 animation_frames.append(frame_image)
                             else:
                                 print(f"WARNING: Animation frame not found: {frame_path}")
@@ -6294,6 +6523,7 @@ class RoundPage:
             round_num = self.get_current_active_round()
         if round_num is not None and round_num <= self.rounds_required:
             self.completed_rounds.add(round_num)
+            self._active_round_cached = False
         # Reload boss icon if needed
         self._load_boss_icon_if_needed()
     
@@ -6305,10 +6535,15 @@ class RoundPage:
     
     def get_current_active_round(self):
         """Get the current active round number (first uncompleted round)"""
+        if self._active_round_cached:
+            return self._active_round
+        self._active_round = None  # All rounds completed, boss is active
         for round_num in range(1, self.rounds_required + 1):
             if self.is_round_active(round_num):
-                return round_num
-        return None  # All rounds completed, boss is active
+                self._active_round = round_num
+                break
+        self._active_round_cached = True
+        return self._active_round
     
     def handle_input(self):
         # Update button positions for the current active round
@@ -6418,6 +6653,10 @@ class RoundPage:
             if event.type == pygame.QUIT:
                 return "quit"
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Window contents were lost (uncovered/restored): next frame must be a full flip
+                self._needs_full_flip = True
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return "back"
@@ -6426,7 +6665,8 @@ class RoundPage:
                 if event.button == 1:  # Left click
                     # Only allow clicks on active buttons
                     if can_play_round and self.button_e_rect and self.button_e_rect.collidepoint(mouse_pos) and self.button_goals.get("e") is not None:
-                        print("LevelButtonE (bottom) clicked")
+                        if DEBUG:
+                            print("LevelButtonE (bottom) clicked")
                         # Save line coordinates when clicking
                         if self.current_line:
                             self.saved_lines.append(self.current_line)
@@ -6444,7 +6684,8 @@ class RoundPage:
                         }
                         return "button_e"
                     if can_play_round and self.button_m_rect and self.button_m_rect.collidepoint(mouse_pos) and self.button_goals.get("m") is not None:
-                        print("LevelButtonM (middle) clicked")
+                        if DEBUG:
+                            print("LevelButtonM (middle) clicked")
                         # Save line coordinates when clicking
                         if self.current_line:
                             self.saved_lines.append(self.current_line)
@@ -6462,7 +6703,8 @@ class RoundPage:
                         }
                         return "button_m"
                     if can_play_round and self.button_h_rect and self.button_h_rect.collidepoint(mouse_pos) and self.button_goals.get("h") is not None:
-                        print("LevelButtonH (upper) clicked")
+                        if DEBUG:
+                            print("LevelButtonH (upper) clicked")
                         # Save line coordinates when clicking
                         if self.current_line:
                             self.saved_lines.append(self.current_line)
@@ -6483,7 +6725,8 @@ class RoundPage:
                     current_active_round = self.get_current_active_round()
                     all_rounds_completed = (current_active_round is None)
                     if self.boss_icon_rect and self.boss_icon_rect.collidepoint(mouse_pos) and all_rounds_completed:
-                        print("Boss clicked")
+                        if DEBUG:
+                            print("Boss clicked")
                         # Set goal for boss
                         if self.test_mode:
                             self.Goal = 2  # Always 2 in test mode
@@ -6514,15 +6757,18 @@ class RoundPage:
         return None
     
     def draw(self):
+        # screen.blit is called for every layer of the page, so bind it once per frame
+        screen_blit = self.screen.blit
+        
         # Background
         if self.background:
-            self.screen.blit(self.background, (0, 0))
+            screen_blit(self.background, (0, 0))
         else:
             self.screen.fill(BLACK)
         
         # Draw Koordinates.png overlay (above background, below other objects)
         if self.koordinates:
-            self.screen.blit(self.koordinates, (0, 0))
+            screen_blit(self.koordinates, (0, 0))
         
         # Update button positions for the current active round (draw loop)
         self._refresh_button_rects()
@@ -6548,14 +6794,14 @@ class RoundPage:
                 elif key == "h":
                     img = self.button_h
                 if img:
-                    self.screen.blit(img, rect.topleft)
+                    screen_blit(img, rect.topleft)
         
         # Update PopUp position with dt-based smooth animation (stable across FPS)
         now = pygame.time.get_ticks()
-        dt = (now - getattr(self, "_popup_last_tick", now)) / 1000.0
+        dt = (now - self._popup_last_tick) / 1000.0
         self._popup_last_tick = now
         dt = _clamp_dt_seconds(dt)
-        max_delta = float(getattr(self, "popup_speed_pps", 0.0)) * dt
+        max_delta = self.popup_speed_pps * dt
         self.popup_y = move_towards(float(self.popup_y), float(self.popup_target_y), max_delta)
         
         # Determine if rounds are completed to hide current buttons when boss is active
@@ -6597,20 +6843,25 @@ class RoundPage:
                 elif key == "h":
                     img = self.button_h
                 if img:
-                    self.screen.blit(img, rect.topleft)
+                    screen_blit(img, rect.topleft)
         
         # Draw buttons (from bottom to top: E, M, H) only if rounds remain
         if not all_rounds_completed:
-            if self.button_e and self.button_e_rect:
-                self.screen.blit(self.button_e, self.button_e_rect.topleft)
-            
-            if self.button_m and self.button_m_rect:
-                self.screen.blit(self.button_m, self.button_m_rect.topleft)
-            
-            if self.button_h and self.button_h_rect:
-                self.screen.blit(self.button_h, self.button_h_rect.topleft)
+            self.screen.blits(
+                [
+                    (button_img, button_rect.topleft)
+                    for button_img, button_rect in (
+                        (self.button_e, self.button_e_rect),
+                        (self.button_m, self.button_m_rect),
+                        (self.button_h, self.button_h_rect),
+                    )
+                    if button_img and button_rect
+                ],
+                doreturn=False,
+            )
         
         # Draw boss icon if all rounds are completed (with animation if hovered)
+        boss_frame_shown = None
         if self.boss_icon and self.boss_icon_rect:
             # Update boss animation if hovered
             if self.boss_hover_state is not None and len(self.boss_animation_frames) > 0:
@@ -6626,344 +6877,54 @@ class RoundPage:
                 # Get current frame number from sequence
                 frame_index = self.animation_sequence[hover_state['sequence_index']]
                 
+                boss_frame_shown = frame_index
+                
                 # Draw animated frame if available
                 if frame_index < len(self.boss_animation_frames):
-                    self.screen.blit(self.boss_animation_frames[frame_index], self.boss_icon_rect.topleft)
+                    screen_blit(self.boss_animation_frames[frame_index], self.boss_icon_rect.topleft)
                 else:
                     # Fallback to default image if frame not available
-                    self.screen.blit(self.boss_icon, self.boss_icon_rect.topleft)
+                    screen_blit(self.boss_icon, self.boss_icon_rect.topleft)
             else:
                 # Draw default boss image when not hovered
-                self.screen.blit(self.boss_icon, self.boss_icon_rect.topleft)
-        
-        # Draw PopUp if it's visible (not completely above screen)
-        if self.popup_image and self.popup_y > -self.popup_image.get_height():
-            popup_y_draw = int(round(self.popup_y))
-            self.screen.blit(self.popup_image, (self.popup_x, popup_y_draw))
-            
-            # Draw text on PopUp if a button or boss is hovered
-            if self.popup_button is not None:
-                if self.popup_button == "boss":
-                    # Boss is hovered - show the same structure as regular rounds:
-                    # PopUpRound + Goal$, then PopUpReward + boss reward text below.
-                    if self.level_number == 2:
-                        e_boss_goal = get_level2_goal(None, "e", self.boss_selection, True)
-                        m_boss_goal = get_level2_goal(None, "m", self.boss_selection, True)
-                        goal_value = e_boss_goal if e_boss_goal is not None else (m_boss_goal if m_boss_goal is not None else 0)
-                    elif self.level_number == 3:
-                        e_boss_goal = get_level3_goal(None, "e", self.defeated_count, True)
-                        m_boss_goal = get_level3_goal(None, "m", self.defeated_count, True)
-                        goal_value = e_boss_goal if e_boss_goal is not None else (m_boss_goal if m_boss_goal is not None else 0)
-                    else:
-                        boss_key = (self.level_number, self.boss_index)
-                        goal_value = self.boss_goals.get(boss_key, 0)
-                    if self.is_apper_boss:
-                        goal_value = apper_goal_boost(goal_value) or 0
-                    
-                    # Build text: PopUpRound text + goal + "$"
-                    full_text = f"{self.popup_round_text} {goal_value}$"
-                else:
-                    # Button is hovered
-                    # Get goal value - for level 2, use current round; for others use button_goals
-                    if self.level_number == 2:
-                        current_round = self.get_current_active_round()
-                        if current_round is not None:
-                            goal_value = get_level2_goal(current_round, self.popup_button, self.boss_selection, False) or 0
-                        else:
-                            goal_value = self.button_goals.get(self.popup_button, 0) or 0
-                    elif self.level_number == 3:
-                        current_round = self.get_current_active_round()
-                        if current_round is not None:
-                            goal_value = get_level3_goal(current_round, self.popup_button, self.defeated_count, False) or 0
-                        else:
-                            goal_value = self.button_goals.get(self.popup_button, 0) or 0
-                    else:
-                        goal_value = self.button_goals.get(self.popup_button, 0) or 0
-                    if self.is_apper_boss:
-                        goal_value = apper_goal_boost(goal_value) or 0
-                    
-                    # Build text: PopUpRound text + goal + "$"
-                    full_text = f"{self.popup_round_text} {goal_value}$"
-                
-                # Split text into multiple lines to fit in PopUp
-                popup_text_width = self.popup_width - 60  # Leave more padding (30px on each side) to prevent text overflow
-                lines = wrap_text(full_text, self.popup_font, popup_text_width)
-                
-                # Draw text lines on PopUp on Round Page
-                text_start_x = self.popup_x + 30  # Left padding + 30px right
-                text_start_y = popup_y_draw + 115  # Top padding + 5px down
-                line_height = self.popup_font.get_height() + 5  # 5px spacing between lines
-                
-                for i, line in enumerate(lines):
-                    text_surface = self.popup_font.render(line, True, PAPER_COLOR)
-                    self.screen.blit(text_surface, (text_start_x, text_start_y + i * line_height))
-                
-                # Draw boss reward text below goal text (for boss hover)
-                if self.popup_button == "boss":
-                    reward_text_y = text_start_y + len(lines) * line_height
-                    reward_text_surface = self.popup_font.render(self.popup_reward_text, True, PAPER_COLOR)
-                    self.screen.blit(reward_text_surface, (text_start_x, reward_text_y))
-                    
-                    if self.boss_text:
-                        boss_reward_lines = wrap_text(self.boss_text, self.popup_font, popup_text_width)
-                        reward_text_y += line_height
-                        for i, line in enumerate(boss_reward_lines):
-                            reward_surface = self.popup_font.render(line, True, PAPER_COLOR)
-                            self.screen.blit(reward_surface, (text_start_x, reward_text_y + i * line_height))
-                
-                # Draw reward text below goal text (for round buttons E/M/H, not for boss)
-                if self.popup_button != "boss" and self.popup_button in ["e", "m", "h"]:
-                    # Determine round number - use current active round
-                    round_num = self.get_current_active_round()
-                    if round_num is None:
-                        # Fallback: for level 2 use rounds_required, for others use button-based logic
-                        if self.level_number == 2:
-                            round_num = self.rounds_required if hasattr(self, 'rounds_required') else 1
-                        else:
-                            if self.popup_button == "e":
-                                round_num = 1
-                            elif self.popup_button == "m":
-                                round_num = 2
-                            else:
-                                round_num = 3
-                    reward_key = (self.level_number, round_num, self.popup_button.upper())
-                    reward_data = self.rewards.get(reward_key)
-                    
-                    reward_text_y = text_start_y + len(lines) * line_height
-                    reward_text_surface = self.popup_font.render(self.popup_reward_text, True, PAPER_COLOR)
-                    self.screen.blit(reward_text_surface, (text_start_x, reward_text_y))
-                    
-                    # Draw additional text from Rewards.csv Text column if present
-                    if reward_data:
-                        additional_text = reward_data.get('text')
-                        if additional_text:
-                            additional_text_key = additional_text.strip()
-                            additional_text_value = get_text(additional_text_key, additional_text_key)
-                            # Wrap additional text to fit in PopUp width
-                            additional_text_lines = wrap_text(additional_text_value, self.popup_font, popup_text_width)
-                            reward_text_y += line_height
-                            for i, line in enumerate(additional_text_lines):
-                                additional_text_surface = self.popup_font.render(line, True, PAPER_COLOR)
-                                self.screen.blit(additional_text_surface, (text_start_x, reward_text_y + i * line_height))
-                
-                # Draw reward card below reward text for round buttons E/M/H (not for boss)
-                if self.popup_button != "boss" and self.popup_button in ["e", "m", "h"]:
-                    # Determine round number - use current active round
-                    round_num = self.get_current_active_round()
-                    if round_num is None:
-                        # Fallback: for level 2 use rounds_required, for others use button-based logic
-                        if self.level_number == 2:
-                            round_num = self.rounds_required if hasattr(self, 'rounds_required') else 1
-                        else:
-                            if self.popup_button == "e":
-                                round_num = 1
-                            elif self.popup_button == "m":
-                                round_num = 2
-                            else:
-                                round_num = 3
-                    reward_key = (self.level_number, round_num, self.popup_button.upper())
-                    reward_data = self.rewards.get(reward_key)
-                    
-                    if reward_data:
-                        reward1_list = reward_data.get('reward1', [])
-                        reward2 = reward_data.get('reward2')  # Can be list or None
-                        
-                        # Check if Reward2 is a list (multiple cards)
-                        reward2_list = reward2 if isinstance(reward2, list) else ([reward2] if reward2 is not None else [])
-                        
-                        if reward1_list:
-                            # Special Rewards.csv token: "Red Card" -> random red card icon
-                            has_random_red1 = REWARD_TOKEN_RANDOM_RED in reward1_list
-                            has_random_red2 = REWARD_TOKEN_RANDOM_RED in reward2_list
-
-                            # Random reward (legacy): pool of cards 10-19 -> show RandomDropGain.png
-                            has_random_reward1 = (not has_random_red1) and len(reward1_list) > 1 and any(
-                                isinstance(card, int) and 10 <= card <= 19 for card in reward1_list
-                            )
-                            has_random_reward2 = (not has_random_red2) and len(reward2_list) > 1 and any(
-                                isinstance(card, int) and 10 <= card <= 19 for card in reward2_list
-                            )
-                            
-                            # Calculate position: below the reward text (accounting for additional text if present)
-                            reward_text_y = text_start_y + len(lines) * line_height
-                            # Check if there's additional text and calculate how many lines it takes
-                            additional_text_lines_count = 0
-                            if reward_data.get('text'):
-                                additional_text_key = reward_data.get('text').strip()
-                                additional_text_value = get_text(additional_text_key, additional_text_key)
-                                additional_text_lines_list = wrap_text(additional_text_value, self.popup_font, popup_text_width)
-                                additional_text_lines_count = len(additional_text_lines_list)
-                            card_spacing = 5  # Spacing between reward text and card
-                            card_y = reward_text_y + line_height + (additional_text_lines_count * line_height) + card_spacing
-                            
-                            if has_random_red1 and self.random_red_image:
-                                # Show RandomRed.png for Reward1
-                                card_width = int(self.random_red_image.get_width() * 0.75)
-                                card_height = int(self.random_red_image.get_height() * 0.75)
-                                scaled_random1 = pygame.transform.smoothscale(self.random_red_image, (card_width, card_height)).convert_alpha()
-                                
-                                # Build optional Reward2 surface (random icon OR actual card),
-                                # so E can show 2 rewards even when Reward2 is a single card.
-                                reward2_surface = None
-                                reward2_width = 0
-                                reward2_height = 0
-                                if reward2 is not None:
-                                    if has_random_red2 and self.random_red_image:
-                                        reward2_surface = pygame.transform.smoothscale(self.random_red_image, (card_width, card_height)).convert_alpha()
-                                        reward2_width, reward2_height = card_width, card_height
-                                    elif has_random_reward2 and self.random_drop_image:
-                                        reward2_surface = pygame.transform.smoothscale(self.random_drop_image, (card_width, card_height)).convert_alpha()
-                                        reward2_width, reward2_height = card_width, card_height
-                                    else:
-                                        reward2_card = reward2_list[0] if reward2_list else None
-                                        if reward2_card is not None:
-                                            reward2_image = self._load_reward_card(reward2_card)
-                                            if reward2_image:
-                                                reward2_width = int(reward2_image.get_width() * 0.75)
-                                                reward2_height = int(reward2_image.get_height() * 0.75)
-                                                reward2_surface = pygame.transform.smoothscale(
-                                                    reward2_image, (reward2_width, reward2_height)
-                                                ).convert_alpha()
-                                
-                                # Calculate total width for cards with spacing
-                                card_spacing_between = 10  # Spacing between cards
-                                total_cards_width = card_width
-                                if reward2_surface is not None:
-                                    total_cards_width += card_spacing_between + reward2_width
-                                
-                                # Center both cards together
-                                cards_start_x = self.popup_x + (self.popup_width - total_cards_width) // 2
-                                
-                                # Draw RandomDropGain.png first (on the left) - Reward1
-                                self.screen.blit(scaled_random1, (cards_start_x, card_y))
-                                cards_start_x += card_width + card_spacing_between
-                                
-                                # Draw Reward2 (on the right) if present
-                                if reward2_surface is not None:
-                                    self.screen.blit(reward2_surface, (cards_start_x, card_y))
-                            elif has_random_reward1 and self.random_drop_image:
-                                # Show RandomDropGain.png for Reward1
-                                card_width = int(self.random_drop_image.get_width() * 0.75)
-                                card_height = int(self.random_drop_image.get_height() * 0.75)
-                                scaled_random1 = pygame.transform.smoothscale(self.random_drop_image, (card_width, card_height)).convert_alpha()
-                                
-                                # Build optional Reward2 surface (random icon OR actual card),
-                                # so E can show 2 rewards even when Reward2 is a single card.
-                                reward2_surface = None
-                                reward2_width = 0
-                                reward2_height = 0
-                                if reward2 is not None:
-                                    if has_random_red2 and self.random_red_image:
-                                        reward2_surface = pygame.transform.smoothscale(self.random_red_image, (card_width, card_height)).convert_alpha()
-                                        reward2_width, reward2_height = card_width, card_height
-                                    elif has_random_reward2 and self.random_drop_image:
-                                        reward2_surface = pygame.transform.smoothscale(self.random_drop_image, (card_width, card_height)).convert_alpha()
-                                        reward2_width, reward2_height = card_width, card_height
-                                    else:
-                                        reward2_card = reward2_list[0] if reward2_list else None
-                                        if reward2_card is not None:
-                                            reward2_image = self._load_reward_card(reward2_card)
-                                            if reward2_image:
-                                                reward2_width = int(reward2_image.get_width() * 0.75)
-                                                reward2_height = int(reward2_image.get_height() * 0.75)
-                                                reward2_surface = pygame.transform.smoothscale(
-                                                    reward2_image, (reward2_width, reward2_height)
-                                                ).convert_alpha()
-                                
-                                # Calculate total width for cards with spacing
-                                card_spacing_between = 10  # Spacing between cards
-                                total_cards_width = card_width
-                                if reward2_surface is not None:
-                                    total_cards_width += card_spacing_between + reward2_width
-                                
-                                # Center both cards together
-                                cards_start_x = self.popup_x + (self.popup_width - total_cards_width) // 2
-                                
-                                # Draw RandomDropGain.png first (on the left) - Reward1
-                                self.screen.blit(scaled_random1, (cards_start_x, card_y))
-                                cards_start_x += card_width + card_spacing_between
-                                
-                                # Draw Reward2 (on the right) if present
-                                if reward2_surface is not None:
-                                    self.screen.blit(reward2_surface, (cards_start_x, card_y))
-                            else:
-                                # Show first card from Reward1 (or single card) with Reward2 side by side if present
-                                first_card = reward1_list[0] if reward1_list else None
-                                if first_card:
-                                    reward_card_image = self._load_reward_card(first_card)
-                                    if reward_card_image:
-                                        # Reduce card size by 25% to fit better (changed from 0.9 to 0.75)
-                                        card_width = int(reward_card_image.get_width() * 0.75)
-                                        card_height = int(reward_card_image.get_height() * 0.75)
-                                        scaled_card = pygame.transform.smoothscale(reward_card_image, (card_width, card_height)).convert_alpha()
-                                        
-                                        # Calculate total width for both cards with spacing
-                                        card_spacing_between = 10  # Spacing between cards
-                                        total_cards_width = card_width
-                                        if reward2 is not None:
-                                            # Get card number from list if reward2 is a list, otherwise use reward2 directly
-                                            reward2_card = reward2[0] if isinstance(reward2, list) and len(reward2) > 0 else reward2
-                                            reward2_image = self._load_reward_card(reward2_card)
-                                            if reward2_image:
-                                                reward2_width = int(reward2_image.get_width() * 0.75)
-                                                total_cards_width += card_spacing_between + reward2_width
-                                        
-                                        # Center both cards together
-                                        cards_start_x = self.popup_x + (self.popup_width - total_cards_width) // 2
-                                        
-                                        # Draw Reward1 card first (on the left)
-                                        self.screen.blit(scaled_card, (cards_start_x, card_y))
-                                        cards_start_x += card_width + card_spacing_between
-                                        
-                                        # Draw Reward2 card next (on the right) if present
-                                        # Check if Reward2 is a list or single card
-                                        if reward2 is not None:
-                                            # If Reward2 is a list, show first card or RandomDropGain if multiple
-                                            if isinstance(reward2, list) and len(reward2) > 0:
-                                                has_random_red2 = REWARD_TOKEN_RANDOM_RED in reward2
-                                                has_random_reward2 = (not has_random_red2) and len(reward2) > 1 and any(
-                                                    isinstance(card, int) and 10 <= card <= 19 for card in reward2
-                                                )
-                                                if has_random_red2 and self.random_red_image:
-                                                    reward2_width = int(self.random_red_image.get_width() * 0.75)
-                                                    reward2_height = int(self.random_red_image.get_height() * 0.75)
-                                                    scaled_reward2 = pygame.transform.smoothscale(self.random_red_image, (reward2_width, reward2_height)).convert_alpha()
-                                                    reward2_x = cards_start_x
-                                                    reward2_y = card_y
-                                                    self.screen.blit(scaled_reward2, (reward2_x, reward2_y))
-                                                elif has_random_reward2 and self.random_drop_image:
-                                                    reward2_width = int(self.random_drop_image.get_width() * 0.75)
-                                                    reward2_height = int(self.random_drop_image.get_height() * 0.75)
-                                                    scaled_reward2 = pygame.transform.smoothscale(self.random_drop_image, (reward2_width, reward2_height)).convert_alpha()
-                                                    reward2_x = cards_start_x
-                                                    reward2_y = card_y
-                                                    self.screen.blit(scaled_reward2, (reward2_x, reward2_y))
-                                                else:
-                                                    reward2_card = reward2[0]
-                                                    reward2_image = self._load_reward_card(reward2_card)
-                                                    if reward2_image:
-                                                        reward2_width = int(reward2_image.get_width() * 0.75)
-                                                        reward2_height = int(reward2_image.get_height() * 0.75)
-                                                        scaled_reward2 = pygame.transform.smoothscale(reward2_image, (reward2_width, reward2_height)).convert_alpha()
-                                                        reward2_x = cards_start_x
-                                                        reward2_y = card_y
-                                                        self.screen.blit(scaled_reward2, (reward2_x, reward2_y))
-                                            else:
-                                                # Single card
-                                                reward2_image = self._load_reward_card(reward2)
-                                                if reward2_image:
-                                                    reward2_width = int(reward2_image.get_width() * 0.75)
-                                                    reward2_height = int(reward2_image.get_height() * 0.75)
-                                                    scaled_reward2 = pygame.transform.smoothscale(reward2_image, (reward2_width, reward2_height)).convert_alpha()
-                                                    reward2_x = cards_start_x
-                                                    reward2_y = card_y
-                                                    self.screen.blit(scaled_reward2, (reward2_x, reward2_y))
+                screen_blit(self.boss_icon, self.boss_icon_rect.topleft)
+        
+        # Draw PopUp only if part of it is on screen; skip it entirely while it is parked above the screen
+        popup_rect = None
+        popup_y_draw = int(round(self.popup_y))
+        popup_bottom = popup_y_draw + (self.popup_image.get_height() if self.popup_image else 0)
+        if self.popup_image and popup_bottom > 0 and popup_y_draw < SCREEN_HEIGHT:
+            # Re-specialize the PopUp draw function only when what it shows changes
+            popup_draw_fn_key = (self.popup_button, current_active_round, CURRENT_LANGUAGE)
+            if popup_draw_fn_key != self._popup_draw_fn_key:
+                self._popup_draw_fn = self._make_popup_draw_fn(current_active_round)
+                self._popup_draw_fn_key = popup_draw_fn_key
+            popup_rect = self._popup_draw_fn(popup_y_draw)
         else:
             # PopUp is completely hidden, clear the button for text
             if self.popup_button is not None:
                 self.popup_button = None
         
-        pygame.display.flip()
+        # While nothing but the PopUp changes (e.g. during its slide), push only the old and new
+        # PopUp areas to the display; any other change on the page gets a full flip.
+        scene_key = (
+            current_active_round,
+            len(self.round_selections),
+            len(self.saved_lines),
+            self.current_line,
+            self.boss_current_line,
+            tuple(self.boss_icon_rect) if self.boss_icon_rect else None,
+            boss_frame_shown,
+        )
+        if self._needs_full_flip or scene_key != self._last_scene_key:
+            pygame.display.flip()
+            self._needs_full_flip = False
+        else:
+            dirty_rects = [rect for rect in (self._last_popup_rect, popup_rect) if rect]
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        self._last_scene_key = scene_key
+        self._last_popup_rect = popup_rect
     
     def run(self):
         # Reset popup position when returning to round page
@@ -6971,27 +6932,43 @@ class RoundPage:
         self.popup_target_y = float(getattr(self, "popup_hidden_y", -450.0))
         self.popup_button = None
         self._popup_last_tick = pygame.time.get_ticks()
+        self._needs_full_flip = True
         
         while True:
             result = self.handle_input()
             
-            if result == "quit":
+            if result == RESULT_QUIT:
                 pygame.quit()
                 sys.exit()
             
-            if result == "back":
-                return "back"
+            if result == RESULT_BACK:
+                return RESULT_BACK
             
-            if result in ("button_e", "button_m", "button_h"):
+            if result in DIFFICULTY_RESULTS:
                 # Button clicked, navigate to gameplay page
                 return result
             
-            if result == "boss_clicked":
+            if result == RESULT_BOSS_CLICKED:
                 # Boss clicked, navigate to gameplay page with boss goal
-                return "boss_clicked"
+                return RESULT_BOSS_CLICKED
             
             self.draw()
             self.clock.tick(FPS)
+    
+    def resume(self, gameplay_result=None):
+        """Re-enter the round page after a GameplayPage exit, applying its result first"""
+        # A won round returns "round_select": mark it completed before showing the page again
+        if gameplay_result == RESULT_ROUND_SELECT and self.last_selected_round is not None:
+            self.mark_round_completed(self.last_selected_round)
+        return self.run()
+    
+    def close(self):
+        """Release cached reward surfaces and the PopUp draw function.
+        The draw function closes over self, so without this the page waits for the cyclic GC."""
+        self._popup_draw_fn = None
+        self._popup_draw_fn_key = None
+        self._popup_layout_cache.clear()
+        self.reward_card_images.clear()
 
 
 def load_background():
@@ -6999,7 +6976,7 @@ def load_background():
     bg_path = os.path.join("UI", "Background.png")
     if os.path.exists(bg_path):
         background = pygame.image.load(bg_path).convert()
-        background = pygame.transform.smoothscale(background, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background = pygame.transform.smoothscale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
         return background
     else:
         print("WARNING: Background not found:", bg_path)
@@ -7026,6 +7003,303 @@ def load_font():
     sys.exit()
 
 
+# -------------------------------
+# Navigation state machine
+# -------------------------------
+NAV_START_PAGE = "start_page"
+NAV_LEVEL_PAGE = "level_page"
+NAV_BOSS_PAGE = "boss_page"
+NAV_ROUND_PAGE = "round_page"
+NAV_GAMEPLAY = "gameplay"
+NAV_BOSS_FIGHT = "boss_fight"
+NAV_EXIT = "exit"
+
+
+class NavigationContext:
+    """State shared between navigation handlers (screen, selected level/boss, open pages)."""
+    def __init__(self, screen, background, font_path):
+        self.screen = screen
+        self.background = background
+        self.font_path = font_path
+        self.clock = pygame.time.Clock()  # One frame clock shared by every page
+        self.test_mode = False
+        self.rounds_config = None
+        self.level_num = None
+        self.bosses_required = 0
+        self.bp_state = None
+        self.boss_page = None
+        self.boss_level = None
+        self.boss_index = None
+        self.round_page = None
+        self.round_result = None
+        self.gameplay_result = None
+        self.pages = {}  # Reused page instances: (page type, variant) -> page
+
+    def close_pages(self):
+        """Release the open RoundPage and the reused BossPage caches."""
+        if self.round_page is not None:
+            self.round_page.close()
+            self.round_page = None
+        boss_page = self.pages.get("boss")
+        if boss_page is not None:
+            boss_page.close()
+
+
+def _nav_start_page(ctx):
+    """Start page: 'start'/'test_mode' open level selection."""
+    start_page = ctx.pages.get("start")
+    if start_page is None:
+        start_page = StartPage(ctx.screen, ctx.background, ctx.font_path, Lang, clock=ctx.clock)
+        ctx.pages["start"] = start_page
+    result = start_page.run()
+
+    if result == RESULT_QUIT:
+        return NAV_EXIT
+    if result not in (RESULT_START, RESULT_TEST_MODE):
+        return NAV_START_PAGE
+
+    ctx.rounds_config = load_rounds_config()
+    ctx.test_mode = (result == RESULT_TEST_MODE)
+    return NAV_LEVEL_PAGE
+
+
+def _nav_level_page(ctx):
+    """Level selection: prepares the red cards deck and boss progress for the chosen level."""
+    global active_red_cards_level, active_red_cards_deck
+
+    level_page = ctx.pages.get(("level", ctx.test_mode))
+    if level_page is None:
+        level_page = GameScreen(ctx.screen, ctx.background, ctx.font_path, test_mode=ctx.test_mode, clock=ctx.clock)
+        ctx.pages[("level", ctx.test_mode)] = level_page
+    else:
+        level_page.reset()
+    level_result = level_page.run()
+
+    if level_result == RESULT_BACK:
+        return NAV_START_PAGE  # Return to start page
+    if level_result == RESULT_QUIT:
+        return NAV_EXIT
+    if not (level_result and level_result.startswith("level_")):
+        return NAV_LEVEL_PAGE
+
+    try:
+        level_num = int(level_result.split("_")[1])
+    except (IndexError, ValueError):
+        print(f"WARNING: Unexpected level selection result: {level_result}")
+        return NAV_LEVEL_PAGE
+
+    # Build the per-run deck of available red cards on LEVEL selection.
+    # Red cards are 100 < id < 200 and are included based on Cards.csv Open/Variable.
+    active_red_cards_level = level_num
+    active_red_cards_deck = build_red_cards_deck_for_level(level_num)
+    if DEBUG:
+        print(f"DEBUG: Built red cards deck for level {level_num}: {active_red_cards_deck}")
+
+    bosses_required = get_bosses_required(level_num, ctx.rounds_config)
+    bp_state = boss_progress.get(level_num)
+    if bp_state is None:
+        bp_state = boss_progress[level_num] = BossProgress()
+    if bp_state.defeated >= bosses_required:
+        bp_state.reset()
+
+    # Level 3: generate and pin 3 mandatory bosses (no choice) for this run
+    if level_num == 3:
+        roster = _ensure_level3_roster(bp_state, bosses_required=bosses_required)
+        LEVEL_BOSS_ROUNDS[3] = roster
+
+    ctx.level_num = level_num
+    ctx.bosses_required = bosses_required
+    ctx.bp_state = bp_state
+    return NAV_BOSS_PAGE
+
+
+def _nav_boss_page(ctx):
+    """Boss selection: a boss click opens its RoundPage."""
+    bp_state = ctx.bp_state
+    boss_page = ctx.pages.get("boss")
+    if boss_page is None:
+        boss_page = BossPage(
+            ctx.screen,
+            ctx.font_path,
+            ctx.level_num,
+            defeated_count=bp_state.defeated,
+            last_defeated_rect=bp_state.last_rect,
+            saved_lines=bp_state.lines,
+            defeated_bosses=bp_state.defeated_bosses,
+            clock=ctx.clock,
+        )
+        ctx.pages["boss"] = boss_page
+    else:
+        boss_page.reset(
+            ctx.level_num,
+            defeated_count=bp_state.defeated,
+            last_defeated_rect=bp_state.last_rect,
+            saved_lines=bp_state.lines,
+            defeated_bosses=bp_state.defeated_bosses,
+        )
+    ctx.boss_page = boss_page
+    boss_result = boss_page.run()
+
+    if boss_result == RESULT_BACK:
+        return NAV_LEVEL_PAGE
+    if boss_result == RESULT_QUIT:
+        return NAV_EXIT
+    if not (isinstance(boss_result, tuple) and boss_result[0] == "boss"):
+        return NAV_BOSS_PAGE
+
+    _, boss_level, boss_index = boss_result
+
+    boss_filenames = boss_page.current_boss_filenames
+    boss_filename = boss_filenames[boss_index] if boss_index < len(boss_filenames) else None
+
+    # The previous boss's RoundPage is done with: release it now rather than at the next GC pass
+    if ctx.round_page is not None:
+        ctx.round_page.close()
+    round_page = RoundPage(
+        ctx.screen,
+        ctx.font_path,
+        boss_level,
+        boss_index,
+        boss_filename=boss_filename,
+        test_mode=ctx.test_mode,
+        defeated_count=bp_state.defeated,
+        clock=ctx.clock,
+    )
+    ctx.boss_level = boss_level
+    ctx.boss_index = boss_index
+    ctx.round_page = round_page
+    ctx.round_result = round_page.run()
+    ctx.gameplay_result = None
+    return NAV_ROUND_PAGE
+
+
+def _nav_round_page(ctx):
+    """Dispatch on the last RoundPage result."""
+    round_result = ctx.round_result
+
+    # Round buttons (E/M/H)
+    if round_result in DIFFICULTY_RESULTS:
+        return NAV_GAMEPLAY
+    if round_result == RESULT_BOSS_CLICKED:
+        return NAV_BOSS_FIGHT
+    if round_result == RESULT_QUIT:
+        return NAV_EXIT
+    return NAV_BOSS_PAGE
+
+
+def _nav_gameplay(ctx):
+    """Regular round at the difficulty picked on the RoundPage."""
+    round_page = ctx.round_page
+    difficulty = DIFFICULTY_MAP[ctx.round_result]
+    goal = round_page.Goal if round_page.Goal is not None else (2 if ctx.test_mode else None)
+    round_num = round_page.get_current_active_round()
+
+    gameplay_page = GameplayPage.for_round(
+        ctx.screen,
+        ctx.font_path,
+        difficulty,
+        goal,
+        ctx.boss_level,
+        ctx.boss_index,
+        round_num,
+        defeated_count=ctx.bp_state.defeated,  # Pass defeated_count for regular rounds too
+        clock=ctx.clock,
+    )
+    gameplay_result = gameplay_page.run()
+    ctx.gameplay_result = gameplay_result
+
+    if gameplay_result == RESULT_QUIT:
+        return NAV_EXIT
+    if gameplay_result == RESULT_LEVEL_SELECT:
+        return NAV_LEVEL_PAGE
+
+    # back / round_select / anything else: return to the round page (resume() applies the result)
+    ctx.round_result = round_page.resume(gameplay_result)
+    return NAV_ROUND_PAGE
+
+
+def _nav_boss_fight(ctx):
+    """Boss fight: a win records the defeated boss and may complete the level."""
+    global level_1_boss_defeated, level_2_boss_defeated, level_3_boss_defeated
+
+    round_page = ctx.round_page
+    boss_page = ctx.boss_page
+    bp_state = ctx.bp_state
+    boss_level = ctx.boss_level
+
+    boss_goal = round_page.Goal if round_page.Goal is not None else (2 if ctx.test_mode else None)
+    # Pass defeated_count to determine if this is the final boss
+    gameplay_page = GameplayPage.for_boss(
+        ctx.screen,
+        ctx.font_path,
+        boss_goal,
+        boss_level,
+        ctx.boss_index,
+        defeated_count=bp_state.defeated,
+        clock=ctx.clock,
+    )
+    gameplay_result = gameplay_page.run()
+    ctx.gameplay_result = gameplay_result
+
+    if gameplay_result == RESULT_QUIT:
+        return NAV_EXIT
+    if gameplay_result == RESULT_ROUND_SELECT:
+        clicked_rect = boss_page.clicked_boss_rect
+        clicked_filename = boss_page.clicked_boss_filename
+
+        bp_state.defeated += 1
+        bp_state.last_rect = clicked_rect
+        bp_state.lines = boss_page.saved_lines  # BossPage never mutates this list in place
+        if clicked_filename and clicked_rect:
+            bp_state.defeated_bosses.append(
+                DefeatedBoss(clicked_filename, clicked_rect.x, clicked_rect.y, clicked_rect.w, clicked_rect.h)
+            )
+
+        if bp_state.defeated >= ctx.bosses_required:
+            # Level completed: clear forced starting-hand cards for this level
+            if boss_level in forced_start_hand_cards_by_level:
+                forced_start_hand_cards_by_level[boss_level] = []
+            if boss_level == 1:
+                level_1_boss_defeated = True
+                print("Level 1 boss defeated! Unlocking level 2")
+            elif boss_level == 2:
+                level_2_boss_defeated = True
+                print("Level 2 completed! Unlocking level 3")
+            elif boss_level == 3:
+                level_3_boss_defeated = True
+                print("Level 3 completed! Unlocking level 4")
+            return NAV_LEVEL_PAGE
+
+        return NAV_BOSS_PAGE
+
+    if gameplay_result in (RESULT_LEVEL_SELECT, RESULT_BACK):
+        return NAV_LEVEL_PAGE
+
+    return NAV_BOSS_PAGE
+
+
+# Navigation state -> handler; each handler runs its page and returns the next state
+NAV_HANDLERS = {
+    NAV_START_PAGE: _nav_start_page,
+    NAV_LEVEL_PAGE: _nav_level_page,
+    NAV_BOSS_PAGE: _nav_boss_page,
+    NAV_ROUND_PAGE: _nav_round_page,
+    NAV_GAMEPLAY: _nav_gameplay,
+    NAV_BOSS_FIGHT: _nav_boss_fight,
+}
+
+
+def run_navigation(screen, background, font_path):
+    """Drive the page flow until a page asks to quit."""
+    ctx = NavigationContext(screen, background, font_path)
+    with contextlib.ExitStack() as stack:
+        # Runs on normal exit, on sys.exit() from a page and on errors
+        stack.callback(ctx.close_pages)
+        state = NAV_START_PAGE
+        while state != NAV_EXIT:
+            state = NAV_HANDLERS[state](ctx)
+
+
 if __name__ == "__main__":
     # Initialize screen
     display_flags = pygame.HWSURFACE | pygame.DOUBLEBUF
@@ -7042,193 +7316,5 @@ if __name__ == "__main__":
     # Validate levels and rounds config (RoundsData.csv vs LEVEL_BOSS_ROUNDS)
     validate_levels_and_rounds_config()
     
-    # Main game loop
-    while True:
-        # Start page
-        start_page = StartPage(screen, background, font_path, Lang)
-        result = start_page.run()
-        
-        # Track test mode flag
-        test_mode = False
-        
-        if result in ("start", "test_mode"):
-            rounds_config = load_rounds_config()
-            test_mode = (result == "test_mode")
-
-            # Level selection loop
-            while True:
-                level_page = GameScreen(screen, background, font_path, test_mode=test_mode)
-                level_result = level_page.run()
-
-                if level_result == "back":
-                    break  # Return to start page
-                if level_result == "quit":
-                    result = "quit"
-                    break
-                if not (level_result and level_result.startswith("level_")):
-                    continue
-
-                try:
-                    level_num = int(level_result.split("_")[1])
-                except Exception:
-                    continue
-
-                # Build the per-run deck of available red cards on LEVEL selection.
-                # Red cards are 100 < id < 200 and are included based on Cards.csv Open/Variable.
-                active_red_cards_level = level_num
-                active_red_cards_deck = build_red_cards_deck_for_level(level_num)
-                print(f"Built red cards deck for level {level_num}: {active_red_cards_deck}")
-
-                bosses_required = get_bosses_required(level_num, rounds_config)
-                bp_state = boss_progress.setdefault(
-                    level_num,
-                    {"defeated": 0, "last_rect": None, "lines": [], "defeated_bosses": [], "roster": None},
-                )
-                if bp_state["defeated"] >= bosses_required:
-                    bp_state.update({"defeated": 0, "last_rect": None, "lines": [], "defeated_bosses": [], "roster": None})
-
-                # Level 3: generate and pin 3 mandatory bosses (no choice) for this run
-                if level_num == 3:
-                    roster = _ensure_level3_roster(bp_state, bosses_required=bosses_required)
-                    LEVEL_BOSS_ROUNDS[3] = roster
-
-                # Boss selection loop
-                while True:
-                    boss_page = BossPage(
-                        screen,
-                        font_path,
-                        level_num,
-                        defeated_count=bp_state["defeated"],
-                        last_defeated_rect=bp_state["last_rect"],
-                        saved_lines=bp_state["lines"],
-                        defeated_bosses=bp_state["defeated_bosses"],
-                    )
-                    boss_result = boss_page.run()
-
-                    if boss_result == "back":
-                        break
-                    if boss_result == "quit":
-                        result = "quit"
-                        break
-                    if not (boss_result and boss_result.startswith("boss_")):
-                        continue
-
-                    parts = boss_result.split("_")
-                    boss_level = int(parts[1])
-                    boss_index = int(parts[2])
-
-                    boss_filename = None
-                    if hasattr(boss_page, "current_boss_filenames") and boss_index < len(boss_page.current_boss_filenames):
-                        boss_filename = boss_page.current_boss_filenames[boss_index]
-
-                    round_page = RoundPage(
-                        screen,
-                        font_path,
-                        boss_level,
-                        boss_index,
-                        boss_filename=boss_filename,
-                        test_mode=test_mode,
-                        defeated_count=bp_state["defeated"],
-                    )
-                    round_result = round_page.run()
-                    gameplay_result = None
-
-                    # Round buttons (E/M/H)
-                    while round_result in ("button_e", "button_m", "button_h"):
-                        difficulty = round_result.replace("button_", "")
-                        goal = round_page.Goal if getattr(round_page, "Goal", None) is not None else (2 if test_mode else None)
-                        round_num = round_page.get_current_active_round()
-
-                        gameplay_page = GameplayPage(
-                            screen,
-                            font_path,
-                            difficulty,
-                            goal=goal,
-                            level_number=boss_level,
-                            boss_index=boss_index,
-                            round_num=round_num,
-                            defeated_count=bp_state["defeated"],  # Pass defeated_count for regular rounds too
-                        )
-                        gameplay_result = gameplay_page.run()
-
-                        if gameplay_result == "back":
-                            round_result = round_page.run()
-                        elif gameplay_result == "round_select":
-                            if round_page.last_selected_round is not None:
-                                round_page.mark_round_completed(round_page.last_selected_round)
-                            round_result = round_page.run()
-                        elif gameplay_result == "level_select":
-                            break
-                        else:
-                            round_result = round_page.run()
-
-                    if gameplay_result == "level_select":
-                        break
-                    if round_result == "back":
-                        continue
-                    if round_result == "quit":
-                        result = "quit"
-                        break
-
-                    # Boss fight
-                    if round_result == "boss_clicked":
-                        boss_goal = round_page.Goal if getattr(round_page, "Goal", None) is not None else (2 if test_mode else None)
-                        # Pass defeated_count to determine if this is the final boss
-                        gameplay_page = GameplayPage(
-                            screen,
-                            font_path,
-                            "e",
-                            goal=boss_goal,
-                            level_number=boss_level,
-                            is_boss_fight=True,
-                            boss_index=boss_index,
-                            defeated_count=bp_state["defeated"],
-                        )
-                        gameplay_result = gameplay_page.run()
-
-                        if gameplay_result == "round_select":
-                            bp_state["defeated"] += 1
-                            bp_state["last_rect"] = getattr(boss_page, "clicked_boss_rect", None)
-                            bp_state["lines"] = getattr(boss_page, "saved_lines", [])[:]
-
-                            clicked_filename = getattr(boss_page, "clicked_boss_filename", None)
-                            clicked_rect = getattr(boss_page, "clicked_boss_rect", None)
-                            if clicked_filename and clicked_rect:
-                                bp_state["defeated_bosses"].append(
-                                    {"filename": clicked_filename, "rect": clicked_rect.copy()}
-                                )
-
-                            if bp_state["defeated"] >= bosses_required:
-                                # Level completed: clear forced starting-hand cards for this level
-                                if boss_level in forced_start_hand_cards_by_level:
-                                    forced_start_hand_cards_by_level[boss_level] = []
-                                if boss_level == 1:
-                                    level_1_boss_defeated = True
-                                    print("Level 1 boss defeated! Unlocking level 2")
-                                elif boss_level == 2:
-                                    level_2_boss_defeated = True
-                                    print("Level 2 completed! Unlocking level 3")
-                                elif boss_level == 3:
-                                    level_3_boss_defeated = True
-                                    print("Level 3 completed! Unlocking level 4")
-                                break
-
-                            continue
-
-                        if gameplay_result in ("level_select", "back"):
-                            break
-
-                        continue
-
-                    continue
-
-                if result == "quit":
-                    break
-
-            if result == "quit":
-                break
-        elif result == "quit":
-            break
-    
-    pygame.quit()
-    sys.exit()
\ No newline at end of file
+    # Main game loop (pygame.quit runs from the atexit hook)
+    run_navigation(screen, background, font_path)